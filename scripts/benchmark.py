@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""Benchmark gitspaces commands against synthetic projects.
+
+Generates a git repository with a configurable number and size of files,
+clones it into projects with each requested number of spaces, and times
+clone, switch, rename, sleep and extend end to end through ``cli.main``.
+CLI import time and interpreter start-up are measured in fresh processes.
+Results are written as JSON so runs can be compared between versions:
+
+    python scripts/benchmark.py --spaces 1,10,40 --output after.json
+    python scripts/benchmark.py --spaces 1,10,40 --compare before.json
+
+Commands run in-process with prompts answered by their defaults. Caches that
+live for one process (the configuration, cwd lookups) are reset before each
+run, so every run starts like a new ``gs`` invocation apart from imports.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+import gitspaces  # noqa: E402
+from gitspaces import cli  # noqa: E402
+from gitspaces.modules.config import Config  # noqa: E402
+from gitspaces.modules.console import Console  # noqa: E402
+from gitspaces.modules.project import Project  # noqa: E402
+from gitspaces.modules.space import Space  # noqa: E402
+
+GIT_ENV = {
+    "GIT_AUTHOR_NAME": "gitspaces-benchmark",
+    "GIT_AUTHOR_EMAIL": "benchmark@example.com",
+    "GIT_COMMITTER_NAME": "gitspaces-benchmark",
+    "GIT_COMMITTER_EMAIL": "benchmark@example.com",
+}
+
+FILES_PER_DIR = 100
+
+
+def make_repo(path: Path, files: int, file_size: int) -> Path:
+    """Create a git repository with one commit of generated files.
+
+    Args:
+        path: Where to create the repository.
+        files: The number of files.
+        file_size: The size of each file in bytes.
+
+    Returns:
+        The repository path.
+    """
+    path.mkdir(parents=True)
+    line = b"gitspaces benchmark data 0123456789abcdefghijklmnopqrstuvwxyz\n"
+    content = (line * (file_size // len(line) + 1))[:file_size]
+    for i in range(files):
+        file_path = path / f"dir-{i // FILES_PER_DIR:04d}" / f"file-{i:06d}.txt"
+        file_path.parent.mkdir(exist_ok=True)
+        file_path.write_bytes(content)
+
+    env = {**os.environ, **GIT_ENV}
+    for args in (["init", "-q"], ["add", "-A"], ["commit", "-q", "-m", "Benchmark data"]):
+        subprocess.run(["git", *args], cwd=path, env=env, check=True)
+    return path
+
+
+def run_cli(*argv: str) -> None:
+    """Run one gitspaces command through cli.main like a fresh invocation."""
+    Config._instance = None
+    Config._data = {}
+    Project.clear_location_cache()
+
+    saved_argv = sys.argv
+    sys.argv = ["gitspaces", *argv]
+    try:
+        cli.main()
+    except SystemExit as e:
+        if e.code:
+            raise RuntimeError(f"gitspaces {' '.join(argv)} exited with {e.code}")
+    finally:
+        sys.argv = saved_argv
+
+
+def measure(
+    repeat: int,
+    run: Callable[[int], None],
+    reset: Callable[[int], None] | None = None,
+) -> list[float]:
+    """Time a command several times.
+
+    Args:
+        repeat: The number of runs.
+        run: Runs the command; called with the run number.
+        reset: Undoes the command's changes between runs (not timed).
+
+    Returns:
+        The run times in seconds.
+    """
+    times = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        run(i)
+        times.append(time.perf_counter() - start)
+        if reset:
+            reset(i)
+    return times
+
+
+def summarize(name: str, spaces: int | None, times: list[float], **extra: Any) -> dict[str, Any]:
+    """Build a result entry with summary statistics."""
+    return {
+        "name": name,
+        "spaces": spaces,
+        "runs": times,
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.mean(times),
+        **extra,
+    }
+
+
+def bench_commands(root: Path, repo: Path, num_spaces: int, repeat: int) -> list[dict[str, Any]]:
+    """Time each command against a project with num_spaces spaces."""
+    projects_dir = root / "projects" / f"spaces-{num_spaces}"
+    results = []
+
+    # clone: every run creates a new project; the first one is kept for the rest
+    def clone(i: int):
+        os.chdir(root)
+        run_cli("clone", str(repo), "-n", str(num_spaces), "-d", str(projects_dir / f"run-{i}"))
+
+    times = measure(repeat, clone)
+    results.append(summarize("clone", num_spaces, times))
+    for i in range(1, repeat):
+        shutil.rmtree(projects_dir / f"run-{i}")
+
+    project = Project(str(projects_dir / "run-0" / repo.name))
+    main = project.path / "main"
+
+    def switch(i: int):
+        os.chdir(project.path)
+        run_cli("switch", "main")
+
+    results.append(summarize("switch", num_spaces, measure(repeat, switch)))
+
+    def rename(i: int):
+        os.chdir(project.path)
+        run_cli("rename", "main", "renamed")
+
+    def rename_back(i: int):
+        Space(project, project.path / "renamed").rename("main")
+
+    results.append(summarize("rename", num_spaces, measure(repeat, rename, rename_back)))
+
+    sleepers_before: set[str] = set()
+
+    def new_sleepers() -> list[Path]:
+        return [
+            entry.path
+            for entry in project.spaces(sleeping=True, refresh=True)
+            if entry.name not in sleepers_before
+        ]
+
+    def sleep(i: int):
+        sleepers_before.clear()
+        sleepers_before.update(s.name for s in project.spaces(sleeping=True, refresh=True))
+        os.chdir(project.path)
+        run_cli("sleep", "main")
+
+    def wake(i: int):
+        slept = new_sleepers()
+        if len(slept) != 1 or main.exists():
+            raise RuntimeError("sleep didn't move 'main' into .zzz")
+        Space(project, slept[0]).wake("main")
+
+    results.append(summarize("sleep", num_spaces, measure(repeat, sleep, wake)))
+
+    def extend(i: int):
+        sleepers_before.clear()
+        sleepers_before.update(s.name for s in project.spaces(sleeping=True, refresh=True))
+        os.chdir(project.path)
+        run_cli("extend", "-n", "1", "main")
+
+    def remove_new(i: int):
+        for path in new_sleepers():
+            Space(project, path).remove()
+
+    results.append(summarize("extend", num_spaces, measure(repeat, extend, remove_new)))
+    return results
+
+
+def bench_startup(repeat: int) -> list[dict[str, Any]]:
+    """Time CLI imports and a complete `--version` run in fresh interpreters."""
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(filter(None, [str(SRC_DIR), os.environ.get("PYTHONPATH")])),
+    }
+
+    import_times = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import gitspaces.cli"],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        for line in result.stderr.splitlines():
+            if line.rstrip().endswith("| gitspaces.cli"):
+                import_times.append(int(line.split("|")[1]) / 1_000_000)
+
+    def version(i: int):
+        subprocess.run(
+            [sys.executable, "-m", "gitspaces", "--version"],
+            capture_output=True,
+            env=env,
+            check=True,
+        )
+
+    return [
+        summarize("import", None, import_times),
+        summarize("startup", None, measure(repeat, version)),
+    ]
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> str:
+    """Format a table of median times against a baseline run."""
+    old = {(r["name"], r["spaces"]): r for r in baseline["results"]}
+    rows = [f"{'command':<10} {'spaces':>6} {'before':>10} {'after':>10} {'change':>8}"]
+    for r in current["results"]:
+        spaces = "-" if r["spaces"] is None else str(r["spaces"])
+        base = old.get((r["name"], r["spaces"]))
+        if base is None:
+            rows.append(f"{r['name']:<10} {spaces:>6} {'':>10} {r['median']*1000:>8.1f}ms")
+            continue
+        change = (r["median"] - base["median"]) / base["median"] * 100 if base["median"] else 0.0
+        rows.append(
+            f"{r['name']:<10} {spaces:>6} {base['median']*1000:>8.1f}ms "
+            f"{r['median']*1000:>8.1f}ms {change:>+7.1f}%"
+        )
+    return "\n".join(rows)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks and write the results."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--spaces", default="1,5,20", help="Comma-separated space counts (default: 1,5,20)"
+    )
+    parser.add_argument("--files", type=int, default=500, help="Files in the repo (default: 500)")
+    parser.add_argument(
+        "--file-size", type=int, default=4096, help="Bytes per file (default: 4096)"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per command (default: 5)")
+    parser.add_argument("--output", "-o", help="Write JSON results to this file")
+    parser.add_argument("--compare", metavar="JSON", help="Compare with an earlier results file")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated projects")
+    args = parser.parse_args(argv)
+
+    space_counts = [int(n) for n in args.spaces.split(",") if n.strip()]
+    root = Path(tempfile.mkdtemp(prefix="gitspaces-bench-")).resolve()
+    saved_home, saved_cwd = os.environ.get("HOME"), os.getcwd()
+
+    try:
+        # An isolated home with one project path, so setup never prompts
+        home = root / "home"
+        (home / ".gitspaces").mkdir(parents=True)
+        (home / ".gitspaces" / "config.yaml").write_text(f"project_paths:\n- {root / 'projects'}\n")
+        os.environ["HOME"] = str(home)
+        os.environ.update(GIT_ENV)
+        Config._config_dir = None
+        Config._config_file = None
+
+        # Quiet output and default answers for every prompt
+        from rich.console import Console as RichConsole
+
+        Console._console = RichConsole(file=io.StringIO())
+        Console.prompt_input = classmethod(lambda cls, message, default="": default)
+        Console.prompt_confirm = classmethod(lambda cls, message, default=True: False)
+        Console.prompt_select = classmethod(
+            lambda cls, message, choices, default=None, annotations=None: default or choices[0]
+        )
+
+        repo = make_repo(root / "source" / "bench-repo", args.files, args.file_size)
+
+        results = bench_startup(args.repeat)
+        for num_spaces in space_counts:
+            print(f"Benchmarking {num_spaces} space(s)...", file=sys.stderr)
+            results.extend(bench_commands(root, repo, num_spaces, args.repeat))
+    finally:
+        os.chdir(saved_cwd)
+        if saved_home is None:
+            os.environ.pop("HOME", None)
+        else:
+            os.environ["HOME"] = saved_home
+        if args.keep:
+            print(f"Projects kept in {root}", file=sys.stderr)
+        else:
+            shutil.rmtree(root, ignore_errors=True)
+
+    report = {
+        "gitspaces_version": gitspaces.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "params": {
+            "spaces": space_counts,
+            "files": args.files,
+            "file_size": args.file_size,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.compare:
+        print(compare(json.loads(Path(args.compare).read_text()), report))
+    else:
+        for r in results:
+            spaces = "-" if r["spaces"] is None else r["spaces"]
+            print(f"{r['name']:<10} {spaces!s:>6} median {r['median']*1000:8.1f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
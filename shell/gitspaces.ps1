@@ -17,8 +17,10 @@ function Invoke-GitSpaces {
     )
 
     # Run gitspaces with current shell PID
+    $env:GITSPACES_SHELL_PID = $PID
     & gitspaces.exe @Arguments
     $exitCode = $LASTEXITCODE
+    Remove-Item Env:GITSPACES_SHELL_PID -ErrorAction SilentlyContinue
 
     # Check for shell target file
     $pidFile = Join-Path $env:USERPROFILE ".gitspaces\pid-$PID"
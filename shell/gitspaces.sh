@@ -9,11 +9,39 @@
 # Usage:
 #   gs [command] [args...]
 #   gitspaces [command] [args...]
+#
+# When the daemon is running ('gitspaces daemon start') and socat is
+# installed, quick commands are sent straight to the daemon's socket
+# without starting Python. Set GITSPACES_NO_DAEMON=1 to bypass it.
+#
+# Tab completion of commands and space names reads the name cache gitspaces
+# keeps in ~/.gitspaces/completion.txt, so it doesn't start Python either.
 
 gs() {
-    # Run gitspaces with current shell PID
-    command gitspaces "$@"
-    local exit_code=$?
+    local exit_code=""
+
+    # Ask the daemon: NUL-terminated cwd, shell PID and arguments; it replies
+    # with the output and then the exit status on the last line ("-" to decline)
+    local sock="${HOME}/.gitspaces/daemon/socket"
+    case "${1:-switch}" in
+        switch|list|config|daemon) ;;
+        *) sock="" ;;  # The daemon would decline anything else
+    esac
+    if [[ -S "$sock" && -z "${GITSPACES_NO_DAEMON:-}" ]] && command -v socat >/dev/null 2>&1; then
+        local response rc
+        response=$(printf '%s\0' "$PWD" "$$" "$@" | socat -t 600 -T 15 - "UNIX-CONNECT:${sock}" 2>/dev/null)
+        rc=${response##*$'\n'}
+        if [[ "$rc" =~ ^[0-9]+$ ]]; then
+            printf '%s' "${response%"$rc"}"
+            exit_code=$rc
+        fi
+    fi
+
+    # Run gitspaces, telling it which shell to write the target for
+    if [[ -z "$exit_code" ]]; then
+        GITSPACES_SHELL_PID=$$ command gitspaces "$@"
+        exit_code=$?
+    fi
 
     # Check for shell target file
     local pid_file="${HOME}/.gitspaces/pid-$$"
@@ -32,3 +60,67 @@ gs() {
 
 # Alias gitspaces to gs function
 alias gitspaces='gs'
+
+_GS_COMMANDS="setup clone switch sleep rename code config extend list share-objects pool mirror exclude status exec daemon"
+
+# Print the project directory containing the current directory, if any
+_gs_project_root() {
+    local dir
+    dir=$(pwd -P)
+    while [[ -n "$dir" ]]; do
+        if [[ -f "$dir/__GITSPACES_PROJECT__" ]]; then
+            printf '%s\n' "$dir"
+            return 0
+        fi
+        dir="${dir%/*}"
+    done
+    return 1
+}
+
+# Print the space names to complete: the current project's, or every project's
+# outside one. Each cache line is a project path and a space name, tab-separated.
+_gs_space_names() {
+    local cache="${HOME}/.gitspaces/completion.txt"
+    local root project space found=""
+    root=$(_gs_project_root)
+
+    if [[ -f "$cache" ]]; then
+        while IFS=$'\t' read -r project space; do
+            if [[ -z "$root" || "$project" == "$root" ]]; then
+                printf '%s\n' "$space"
+                found=1
+            fi
+        done < "$cache"
+    fi
+
+    # No cache, or a project it doesn't know about yet
+    if [[ -z "$found" ]]; then
+        command gitspaces list </dev/null 2>/dev/null
+    fi
+}
+
+_gs_complete() {
+    local cur="${COMP_WORDS[COMP_CWORD]}"
+
+    if (( COMP_CWORD == 1 )); then
+        COMPREPLY=($(compgen -W "$_GS_COMMANDS" -- "$cur"))
+        return
+    fi
+
+    case "${COMP_WORDS[1]}" in
+        switch|sleep|rename|code|extend)
+            local names IFS=$'\n'
+            names=$(_gs_space_names | sort -u)
+            # Sleepers (.zzz/...) only once a "." has been typed
+            if [[ "$cur" != .* ]]; then
+                names=$(printf '%s\n' "$names" | grep -v '^\.')
+            fi
+            COMPREPLY=($(compgen -W "$names" -- "$cur"))
+            ;;
+    esac
+}
+
+if [[ -n "${ZSH_VERSION:-}" ]]; then
+    autoload -U +X bashcompinit && bashcompinit
+fi
+complete -F _gs_complete gs gitspaces
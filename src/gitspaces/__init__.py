@@ -4,7 +4,17 @@ __version__ = "2.0.36"
 __author__ = "David Rowe"
 __email__ = "davfive@gmail.com"
 
-from .modules.project import Project
-from .modules.space import Space
-
 __all__ = ["Project", "Space", "__version__"]
+
+
+def __getattr__(name):
+    # Imported on first use so `import gitspaces` (and the CLI) starts quickly
+    if name == "Project":
+        from .modules.project import Project
+
+        return Project
+    if name == "Space":
+        from .modules.space import Space
+
+        return Space
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,6 @@
 """GitSpaces CLI - Command-line interface for gitspaces."""
 
+import os
 import sys
 import argparse
 from gitspaces import __version__
@@ -33,7 +34,17 @@ def create_parser():
         cmd_rename,
         cmd_code,
         cmd_config,
+        cmd_daemon,
         cmd_extend,
+        cmd_list,
+        cmd_share_objects,
+        cmd_status,
+        cmd_pool,
+        cmd_mirror,
+        cmd_exclude,
+        cmd_exec,
+        execute,
+        status,
     )
 
     # Setup command
@@ -49,6 +60,22 @@ def create_parser():
         "-n", "--num-spaces", type=int, default=3, help="Number of spaces to create (default: 3)"
     )
     clone_parser.add_argument("-d", "--directory", help="Directory where project will be created")
+    clone_parser.add_argument(
+        "--worktrees",
+        action="store_true",
+        help="Make spaces git worktrees of one shared clone instead of full copies",
+    )
+    clone_parser.add_argument(
+        "--filter",
+        metavar="SPEC",
+        help="Partial clone filter, e.g. blob:none (fetch file contents on demand)",
+    )
+    clone_parser.add_argument(
+        "--depth", type=int, help="Shallow clone with this many commits of history"
+    )
+    clone_parser.add_argument(
+        "--single-branch", action="store_true", help="Only fetch the default branch"
+    )
     clone_parser.set_defaults(func=cmd_clone.clone_command)
 
     # Switch command
@@ -98,13 +125,152 @@ def create_parser():
     )
     extend_parser.set_defaults(func=cmd_extend.extend_command)
 
+    # Share-objects command
+    share_parser = subparsers.add_parser(
+        "share-objects", help="Move all spaces' git history into a shared object store"
+    )
+    share_parser.set_defaults(func=cmd_share_objects.share_objects_command)
+
+    # Pool command
+    pool_parser = subparsers.add_parser(
+        "pool", help="Show or set how many sleepers to keep ready in the background"
+    )
+    pool_parser.add_argument(
+        "target", nargs="?", type=int, help="Number of sleepers to keep (0 disables)"
+    )
+    pool_parser.set_defaults(func=cmd_pool.pool_command)
+
+    # Mirror command
+    mirror_parser = subparsers.add_parser("mirror", help="Manage the local clone mirror cache")
+    mirror_subparsers = mirror_parser.add_subparsers(dest="mirror_command")
+    mirror_add_parser = mirror_subparsers.add_parser("add", help="Mirror a repository URL")
+    mirror_add_parser.add_argument("url", help="Git repository URL")
+    mirror_subparsers.add_parser("list", help="List cached mirrors")
+    mirror_subparsers.add_parser("update", help="Refresh all mirrors in parallel")
+    mirror_parser.set_defaults(func=cmd_mirror.mirror_command)
+
+    # Exclude command
+    exclude_parser = subparsers.add_parser(
+        "exclude", help="Show or edit what isn't copied when creating new spaces"
+    )
+    exclude_parser.add_argument(
+        "patterns", nargs="*", help="Gitignore-style patterns (e.g. node_modules/ *.o /build)"
+    )
+    exclude_mode = exclude_parser.add_mutually_exclusive_group()
+    exclude_mode.add_argument(
+        "--include", action="store_true", help="Re-include paths matching the patterns"
+    )
+    exclude_mode.add_argument(
+        "--remove", action="store_true", help="Remove the patterns from the rules"
+    )
+    exclude_parser.add_argument(
+        "--git-ignored",
+        choices=["on", "off"],
+        help="Skip everything git ignores in the source space",
+    )
+    exclude_parser.set_defaults(func=cmd_exclude.exclude_command)
+
+    # List command
+    list_parser = subparsers.add_parser(
+        "list", help="List the current project's spaces (every project's outside one)"
+    )
+    list_parser.add_argument(
+        "--projects", action="store_true", help="List project names instead of spaces"
+    )
+    list_parser.set_defaults(func=cmd_list.list_command)
+
+    # Status command
+    status_parser = subparsers.add_parser(
+        "status", help="Show branch, changes and upstream distance of every space"
+    )
+    status_parser.add_argument(
+        "--json", action="store_true", help="Print one JSON object per space, as they finish"
+    )
+    status_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=status.DEFAULT_WORKERS,
+        help=f"Spaces to check at once (default: {status.DEFAULT_WORKERS})",
+    )
+    status_parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Check every space with git, even ones whose git metadata hasn't changed",
+    )
+    status_parser.set_defaults(func=cmd_status.status_command)
+
+    # Exec command
+    exec_parser = subparsers.add_parser(
+        "exec", help="Run a command in every space of the project, in parallel"
+    )
+    exec_parser.add_argument(
+        "--all-projects",
+        action="store_true",
+        help="Run in the spaces of every configured project",
+    )
+    exec_state = exec_parser.add_mutually_exclusive_group()
+    exec_state.add_argument("--active", action="store_true", help="Only run in active spaces")
+    exec_state.add_argument("--sleeping", action="store_true", help="Only run in sleeping spaces")
+    exec_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=execute.DEFAULT_JOBS,
+        help=f"Commands to run at once (default: {execute.DEFAULT_JOBS})",
+    )
+    exec_parser.add_argument(
+        "--buffer",
+        action="store_true",
+        help="Print each space's output in one block when it finishes",
+    )
+    exec_parser.add_argument(
+        "exec_args",
+        nargs=argparse.REMAINDER,
+        metavar="-- COMMAND",
+        help="The command and its arguments, run without a shell",
+    )
+    exec_parser.set_defaults(func=cmd_exec.exec_command)
+
+    # Daemon command
+    daemon_parser = subparsers.add_parser(
+        "daemon", help="Manage the background process that makes switching instant"
+    )
+    daemon_subparsers = daemon_parser.add_subparsers(dest="daemon_command")
+    daemon_subparsers.add_parser("start", help="Start the daemon in the background")
+    daemon_subparsers.add_parser("stop", help="Stop the daemon")
+    daemon_subparsers.add_parser("status", help="Show whether the daemon is running")
+    daemon_subparsers.add_parser("run", help="Run the daemon in the foreground")
+    daemon_parser.set_defaults(func=cmd_daemon.daemon_command)
+
     return parser
 
 
 def main():
-    """Main entry point for the CLI."""
+    """Main entry point for the CLI.
+
+    Quick commands are handed to the resident daemon when it is running;
+    otherwise they run in this process.
+    """
+    from gitspaces.modules import daemon
+
+    status = daemon.forward(sys.argv[1:])
+    if status is not None:
+        if status:
+            sys.exit(status)
+        return
+
+    run(sys.argv[1:])
+
+
+def run(argv: list[str]):
+    """Parse and run a command in this process.
+
+    Args:
+        argv: The command-line arguments, without the program name.
+    """
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Show debug info if requested
     if args.debug:
@@ -120,6 +286,17 @@ def main():
         Console.println("Try running 'gitspaces setup' to configure GitSpaces.")
         sys.exit(1)
 
+    # Clean up sleepers whose creation was interrupted (Ctrl-C, OOM, full disk)
+    from gitspaces.modules.project import Project
+
+    try:
+        project = Project.find_project(os.getcwd())
+        if project:
+            for staging_path in project.sweep_staging():
+                Console.println(f"Removed incomplete sleeper: {staging_path.name}")
+    except OSError:
+        pass  # Not fatal; the next run will try again
+
     # If no command is provided, default to switch
     if args.command is None:
         from gitspaces.modules import cmd_switch
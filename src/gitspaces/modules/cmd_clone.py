@@ -4,10 +4,11 @@ import os
 from pathlib import Path
 from gitspaces.modules.config import Config
 from gitspaces.modules.console import Console
+from gitspaces.modules.errors import GitSpacesError
 from gitspaces.modules.project import Project
 from gitspaces.modules.space import Space
 from gitspaces.modules.path import write_shell_target
-from gitspaces.modules import runshell
+from gitspaces.modules import index, mirror, runshell
 
 
 def clone_command(args):
@@ -18,11 +19,21 @@ def clone_command(args):
             - url: Git repository URL
             - num_spaces: Number of spaces to create
             - directory: Optional directory where project will be created
+            - worktrees: Make spaces git worktrees of one shared clone
+            - filter: Optional partial clone filter (e.g. blob:none)
+            - depth: Optional shallow clone depth
+            - single_branch: Only fetch the default branch
     """
     config = Config.instance()
     url = args.url
     num_spaces = args.num_spaces
     directory = args.directory
+    worktrees = args.worktrees
+    clone_options = {
+        "filter": args.filter,
+        "depth": args.depth,
+        "single_branch": args.single_branch,
+    }
 
     # Determine the target directory
     if directory:
@@ -47,14 +58,35 @@ def clone_command(args):
     Console.println(f"Creating GitSpaces project from {url}")
     Console.println(f"Location: {target_dir}")
     Console.println(f"Number of spaces: {num_spaces}")
+    if worktrees:
+        Console.println("Spaces: git worktrees")
+    for option, value in clone_options.items():
+        if value:
+            Console.println(f"Clone option: {option}={value}")
 
     try:
-        project = Project.create_project(str(target_dir), url, num_spaces)
+        reference = mirror.reference_for(url)
+    except (GitSpacesError, OSError) as e:
+        # A mirror only saves network traffic; a stale one is no reason to fail
+        Console.println(f"✗ Could not refresh the local mirror, cloning without it: {e}")
+        reference = None
+    if reference:
+        Console.println(f"Using local mirror: {reference}")
+
+    try:
+        project = Project.create_project(
+            str(target_dir),
+            url,
+            num_spaces,
+            worktrees=worktrees,
+            clone_options=clone_options,
+            reference=reference,
+        )
         Console.println(f"\n✓ Successfully created project: {project.name}")
         Console.println(f"  Path: {project.path}")
 
         # After creation, wake one sleeper and cd into it
-        sleeping_spaces = [s for s in project.list_spaces() if s.startswith(".zzz/")]
+        sleeping_spaces = [s.name for s in project.spaces(sleeping=True)]
 
         if sleeping_spaces:
             Console.println("\nLet's set up your first working space!")
@@ -91,6 +123,8 @@ def clone_command(args):
         else:
             Console.println("\nUse 'gitspaces switch' to activate a space.")
 
+        index.record_project(project)
+
     except Exception as e:
         Console.println(f"\n✗ Error creating project: {e}")
         raise
@@ -2,39 +2,12 @@
 
 import json
 from pathlib import Path
-from typing import Optional
 from gitspaces.modules.config import Config
 from gitspaces.modules.console import Console
 from gitspaces.modules.project import Project
 from gitspaces.modules import runshell
 
 
-def _get_current_space_name(project: Project) -> Optional[str]:
-    """Get the name of the current space if we're in one.
-
-    Args:
-        project: The current project.
-
-    Returns:
-        The space name if in a space directory, None otherwise.
-    """
-    cwd = Path.cwd()
-    spaces = project.list_spaces()
-
-    for space_name in spaces:
-        if space_name.startswith(".zzz/"):
-            continue  # Skip sleeping spaces
-
-        space_path = project.path / space_name
-
-        if cwd == space_path or (
-            cwd.is_relative_to(space_path) and not cwd.is_relative_to(project.zzz_dir)
-        ):
-            return space_name
-
-    return None
-
-
 def _ensure_workspace_file(project: Project, space_name: str) -> Path:
     """Ensure a .code-workspace file exists for the space.
 
@@ -81,7 +54,7 @@ def code_command(args):
 
     # Find the current project
     cwd = Path.cwd()
-    project = Project.find_project(str(cwd))
+    project, current_space = Project.locate(cwd)
 
     if not project:
         Console.println("✗ Not in a GitSpaces project directory")
@@ -91,15 +64,12 @@ def code_command(args):
     if hasattr(args, "space") and args.space:
         space_name = args.space
     else:
-        # Check if we're in a space directory - use it automatically
-        current_space = _get_current_space_name(project)
-
-        if current_space:
+        # If we're in an active space, use it automatically
+        if current_space and not current_space.startswith(".zzz/"):
             space_name = current_space
         else:
             # List available active spaces for selection
-            spaces = project.list_spaces()
-            active_spaces = [s for s in spaces if not s.startswith(".zzz/")]
+            active_spaces = [s.name for s in project.spaces(sleeping=False)]
 
             if not active_spaces:
                 Console.println("✗ No active spaces available")
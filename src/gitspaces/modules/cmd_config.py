@@ -22,6 +22,11 @@ def config_command(args):
         Console.println("\nSettings:")
         Console.println(f"  project_paths: {config.project_paths}")
         Console.println(f"  default_editor: {config.default_editor}")
+        Console.println(f"  copy_workers: {config.copy_workers}")
+        Console.println(f"  mirror_cache: {config.mirror_cache}")
+        Console.println(f"  discovery_depth: {config.discovery_depth}")
+        Console.println(f"  discovery_exclude: {config.discovery_exclude}")
+        Console.println(f"  lock_timeout: {config.lock_timeout}")
         return
 
     key = args.key
@@ -0,0 +1,49 @@
+"""Daemon command for GitSpaces - keep a warm process for quick commands."""
+
+import os
+from pathlib import Path
+from gitspaces.modules.console import Console
+from gitspaces.modules import daemon
+
+
+def daemon_command(args):
+    """Start, stop or inspect the resident daemon.
+
+    Args:
+        args: Parsed command-line arguments containing:
+            - daemon_command: 'start', 'stop', 'status' or 'run' (default: status)
+    """
+    if not daemon.available():
+        Console.println("✗ The daemon needs Unix domain sockets, which this platform lacks")
+        return
+
+    action = args.daemon_command or "status"
+
+    if action == "run":
+        runner = daemon.Daemon()
+        runner.listen()
+        runner.warm_up()
+        # Don't keep the directory the daemon was started from in use
+        os.chdir(Path.home())
+        runner.serve_forever()
+        return
+
+    if action == "start":
+        if daemon.is_running():
+            Console.println("Daemon is already running")
+        elif daemon.start():
+            Console.println("✓ Daemon started")
+            Console.println(f"  Socket: {daemon.socket_path()}")
+        else:
+            Console.println("✗ Daemon didn't start; run 'gitspaces daemon run' to see why")
+        return
+
+    # stop and status are answered by the daemon itself
+    try:
+        result = daemon.request(["daemon", action])
+    except OSError:
+        result = None
+    if result is None:
+        Console.println("Daemon is not running")
+        return
+    Console.println(result[1].rstrip("\n"))
@@ -0,0 +1,55 @@
+"""Exclude command for GitSpaces - choose what isn't copied into new spaces."""
+
+from pathlib import Path
+from gitspaces.modules.console import Console
+from gitspaces.modules.project import Project
+
+
+def exclude_command(args):
+    """Show or edit the current project's copy exclusion rules.
+
+    Args:
+        args: Parsed command-line arguments containing:
+            - patterns: Gitignore-style patterns to add (or remove)
+            - include: Add patterns to the include list instead of the exclude list
+            - remove: Remove patterns from both lists
+            - git_ignored: "on" or "off" to skip everything git ignores
+    """
+    # Find the current project
+    cwd = Path.cwd()
+    project = Project.find_project(str(cwd))
+
+    if not project:
+        Console.println("✗ Not in a GitSpaces project directory")
+        return
+
+    with project.lock():
+        settings = project.settings
+        changed = False
+
+        if args.git_ignored:
+            settings["exclude_ignored"] = args.git_ignored == "on"
+            changed = True
+
+        if args.patterns:
+            if args.remove:
+                for key in ("exclude", "include"):
+                    remaining = [p for p in settings.get(key, []) if p not in args.patterns]
+                    if remaining:
+                        settings[key] = remaining
+                    else:
+                        settings.pop(key, None)
+            else:
+                key = "include" if args.include else "exclude"
+                current = settings.get(key, [])
+                settings[key] = current + [p for p in args.patterns if p not in current]
+            changed = True
+
+        if changed:
+            project.save_settings()
+            Console.println(f"✓ Updated copy rules for '{project.name}'")
+
+    Console.println(f"Project: {project.name}")
+    Console.println(f"  Exclude: {', '.join(settings.get('exclude', [])) or '(none)'}")
+    Console.println(f"  Include: {', '.join(settings.get('include', [])) or '(none)'}")
+    Console.println(f"  Skip git-ignored files: {bool(settings.get('exclude_ignored'))}")
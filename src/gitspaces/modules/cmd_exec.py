@@ -0,0 +1,120 @@
+"""Exec command for GitSpaces - run a command in every space."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+from gitspaces.modules.config import Config
+from gitspaces.modules.console import Console
+from gitspaces.modules.project import Project, SpaceEntry
+from gitspaces.modules import execute, index
+
+
+def _find_targets(args) -> list[tuple[Project, SpaceEntry]] | None:
+    """Get the (project, space) pairs the command should run in, or None outside a project."""
+    sleeping = True if args.sleeping else False if args.active else None
+
+    if args.all_projects:
+        projects = index.ProjectIndex().list_projects(Config.instance().project_paths)
+    else:
+        project, _ = Project.locate(Path.cwd())
+        if not project:
+            return None
+        projects = [project]
+
+    targets: list[tuple[Project, SpaceEntry]] = []
+    for project in projects:
+        with project.lock(shared=True):
+            targets.extend((project, entry) for entry in project.spaces(sleeping=sleeping))
+    return targets
+
+
+def exec_command(args):
+    """Run a command in each space of the current project (or of every project).
+
+    The command runs directly, without a shell, in every matching space at
+    once, up to the job limit. Output is printed as it arrives with each line
+    prefixed by its space, or with --buffer, in one block per space as each
+    finishes. A timing summary follows, and the exit status is the highest
+    any space's command returned.
+
+    Args:
+        args: Parsed command-line arguments containing:
+            - exec_args: The command and its arguments, optionally after '--'
+            - all_projects: Run in the spaces of every configured project
+            - active: Only run in active spaces
+            - sleeping: Only run in sleeping spaces
+            - jobs: The most commands to run at once
+            - buffer: Print each space's output in one block when it finishes
+    """
+    command = list(args.exec_args)
+    if command[:1] == ["--"]:
+        command = command[1:]
+    if not command:
+        Console.println("✗ No command given")
+        Console.println("Usage: gitspaces exec [--all-projects] [--active|--sleeping] -- <command>")
+        sys.exit(2)
+
+    targets = _find_targets(args)
+    if targets is None:
+        Console.println("✗ Not in a GitSpaces project")
+        Console.println("Use --all-projects to run in the spaces of every project")
+        sys.exit(1)
+    if not targets:
+        Console.println("✗ No matching spaces found")
+        return
+
+    def label(project_name: str, space_name: str) -> str:
+        return f"{project_name}/{space_name}" if args.all_projects else space_name
+
+    width = max(len(label(project.name, entry.name)) for project, entry in targets)
+    write_lock = threading.Lock()
+    buffered: dict = {}
+
+    def on_line(target, line: str):
+        if not line.endswith("\n"):
+            line += "\n"
+        if args.buffer:
+            buffered.setdefault(str(target[1].path), []).append(line)
+            return
+        with write_lock:
+            sys.stdout.write(f"{label(target[0].name, target[1].name):<{width}} | {line}")
+            sys.stdout.flush()
+
+    start = time.perf_counter()
+    results = []
+    for result in execute.run_all(targets, command, on_line, jobs=args.jobs):
+        results.append(result)
+        name = label(result.project, result.space)
+        if args.buffer:
+            with write_lock:
+                sys.stdout.write(f"==> {name} <==\n")
+                sys.stdout.writelines(buffered.pop(result.path, []))
+                sys.stdout.flush()
+        if result.error:
+            Console.println(f"✗ {name}: {result.error}")
+    elapsed = time.perf_counter() - start
+
+    Console.println("")
+    for result in sorted(results, key=lambda r: r.elapsed, reverse=True):
+        name = label(result.project, result.space)
+        if result.status:
+            Console.println(
+                f"✗ {name:<{width}}  {result.elapsed:6.2f}s  "
+                f"{execute.describe_status(result.status)}"
+            )
+        else:
+            Console.println(f"✓ {name:<{width}}  {result.elapsed:6.2f}s")
+
+    failed = sum(1 for r in results if r.status)
+    busy = sum(r.elapsed for r in results)
+    Console.println(
+        f"\n{len(results)} spaces: {len(results) - failed} succeeded, {failed} failed "
+        f"in {elapsed:.2f}s ({busy:.2f}s of command time)"
+    )
+
+    status = max(r.status for r in results)
+    if status:
+        sys.exit(status)
@@ -5,6 +5,7 @@ from gitspaces.modules.config import Config
 from gitspaces.modules.console import Console
 from gitspaces.modules.project import Project
 from gitspaces.modules.space import Space
+from gitspaces.modules import index
 
 
 def extend_command(args):
@@ -17,7 +18,7 @@ def extend_command(args):
     """
     # Find the current project
     cwd = Path.cwd()
-    project = Project.find_project(str(cwd))
+    project, current_space = Project.locate(cwd)
 
     if not project:
         Console.println("✗ Not in a GitSpaces project directory")
@@ -26,8 +27,7 @@ def extend_command(args):
     num_spaces = args.num_spaces if hasattr(args, "num_spaces") and args.num_spaces else 1
 
     # Determine which space to clone from
-    spaces = project.list_spaces()
-    active_spaces = [s for s in spaces if not s.startswith(".zzz/")]
+    active_spaces = [s.name for s in project.spaces(sleeping=False)]
 
     if not active_spaces:
         Console.println("✗ No active spaces available to clone from")
@@ -41,15 +41,8 @@ def extend_command(args):
             Console.println(f"Available active spaces: {', '.join(active_spaces)}")
             return
     else:
-        # Check if we're currently in a space directory
-        current_space = None
-        for space_name in active_spaces:
-            space_path = project.path / space_name
-            if cwd == space_path or cwd.is_relative_to(space_path):
-                current_space = space_name
-                break
-
-        if current_space:
+        # Use the current space if we're in an active one
+        if current_space in active_spaces:
             source_space_name = current_space
             Console.println(f"Using current space '{source_space_name}' as source")
         else:
@@ -64,19 +57,23 @@ def extend_command(args):
     # Create the additional clones
     Console.println(f"Creating {num_spaces} additional clone(s) from '{source_space_name}'...")
 
-    created_count = 0
-    for i in range(num_spaces):
+    def _report(done, total, new_space):
+        Console.println(
+            f"  ✓ [{done}/{total}] Created clone {new_space.path.name} ({new_space.copy_method})"
+        )
+
+    # Sleeper slots are reserved atomically, so only changes to the source
+    # space (sleep, rename) need to wait for the copies
+    with project.lock(shared=True):
         try:
-            new_space = source_space.duplicate()
-            created_count += 1
-            Console.println(f"  ✓ Created clone {i + 1}/{num_spaces}: {new_space.path.name}")
+            new_spaces = project.create_sleepers(source_space, num_spaces, on_progress=_report)
         except Exception as e:
-            Console.println(f"  ✗ Error creating clone {i + 1}: {e}")
-            break
+            Console.println(f"  ✗ Error creating clones: {e}")
+            Console.println("\n✗ No clones were created")
+            return
 
-    if created_count > 0:
-        Console.println(f"\n✓ Successfully created {created_count} additional clone(s)")
-        Console.println(f"Total spaces in project: {len(project.list_spaces())}")
-        Console.println("\nUse 'gitspaces switch' to wake and name the new clones")
-    else:
-        Console.println("\n✗ No clones were created")
+        index.record_project(project)
+
+    Console.println(f"\n✓ Successfully created {len(new_spaces)} additional clone(s)")
+    Console.println(f"Total spaces in project: {len(project.spaces())}")
+    Console.println("\nUse 'gitspaces switch' to wake and name the new clones")
@@ -0,0 +1,44 @@
+"""List command for GitSpaces - print space and project names."""
+
+from pathlib import Path
+from gitspaces.modules.config import Config
+from gitspaces.modules.console import Console
+from gitspaces.modules.project import Project
+from gitspaces.modules import index
+
+
+def list_command(args):
+    """Print space or project names, one per line.
+
+    Inside a project this lists its spaces. Outside one it lists the spaces of
+    every project, which is what ``switch`` accepts there. The shell
+    completion functions call this when their name cache is missing.
+
+    Args:
+        args: Parsed command-line arguments containing:
+            - projects: List project names instead of space names
+    """
+    project_index = index.ProjectIndex()
+    project = None if args.projects else Project.locate(Path.cwd())[0]
+
+    if project:
+        with project.lock(shared=True):
+            names = [s.name for s in project.spaces()]
+    else:
+        projects = project_index.list_projects(Config.instance().project_paths)
+        if args.projects:
+            names = sorted({p.name for p in projects})
+        else:
+            names = sorted(
+                {name for p in projects for name in project_index.spaces(p) or p.list_spaces()}
+            )
+
+    for name in names:
+        Console.println(name)
+
+    # Recreate a deleted completion cache; saving the index normally writes it
+    if not project_index.completion_path.exists():
+        try:
+            project_index.write_completions()
+        except OSError:
+            pass
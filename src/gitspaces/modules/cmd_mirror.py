@@ -0,0 +1,54 @@
+"""Mirror command for GitSpaces - manage the local clone mirror cache."""
+
+import time
+from gitspaces.modules.console import Console
+from gitspaces.modules import mirror
+
+
+def mirror_command(args):
+    """Add, list or update local mirrors.
+
+    Args:
+        args: Parsed command-line arguments containing:
+            - mirror_command: "add", "list" or "update" (default: list)
+            - url: Repository URL (for add)
+    """
+    action = args.mirror_command or "list"
+
+    if action == "add":
+        Console.println(f"Mirroring {args.url}...")
+        try:
+            path = mirror.ensure_mirror(args.url)
+        except Exception as e:
+            Console.println(f"✗ Error creating mirror: {e}")
+            return
+        Console.println(f"✓ Mirror ready: {path}")
+        return
+
+    mirrors = mirror.list_mirrors()
+    if not mirrors:
+        Console.println("No mirrors cached")
+        Console.println("Add one with 'gitspaces mirror add <url>'")
+        return
+
+    if action == "list":
+        for url, path in mirrors:
+            Console.println(f"{url}")
+            Console.println(f"  {path}")
+        return
+
+    Console.println(f"Updating {len(mirrors)} mirror(s)...")
+    start = time.monotonic()
+    failed = 0
+    for url, error in mirror.update_all():
+        if error:
+            failed += 1
+            Console.println(f"  ✗ {url}: {error}")
+        else:
+            Console.println(f"  ✓ {url}")
+
+    elapsed = time.monotonic() - start
+    if failed:
+        Console.println(f"\n✗ {failed} of {len(mirrors)} mirror(s) failed to update")
+    else:
+        Console.println(f"\n✓ Updated {len(mirrors)} mirror(s) in {elapsed:.1f}s")
@@ -0,0 +1,53 @@
+"""Pool command for GitSpaces - keep sleepers ready in the background."""
+
+import time
+from pathlib import Path
+from gitspaces.modules.console import Console
+from gitspaces.modules.project import Project
+from gitspaces.modules import pool
+
+
+def pool_command(args):
+    """Show or set how many sleepers the current project keeps ready.
+
+    Args:
+        args: Parsed command-line arguments containing:
+            - target: Optional number of sleepers to keep (0 disables the pool)
+    """
+    # Find the current project
+    cwd = Path.cwd()
+    project = Project.find_project(str(cwd))
+
+    if not project:
+        Console.println("✗ Not in a GitSpaces project directory")
+        return
+
+    if args.target is not None:
+        if args.target < 0:
+            Console.println("✗ The pool target can't be negative")
+            return
+        with project.lock():
+            pool.set_target(project, args.target)
+        Console.println(f"✓ Pool target for '{project.name}' set to {args.target}")
+
+        if pool.replenish_in_background(project):
+            Console.println("  Creating sleepers in the background")
+        return
+
+    Console.println(f"Project: {project.name}")
+    Console.println(f"  Pool target: {pool.get_target(project)}")
+    Console.println(f"  Sleepers: {pool.count_sleepers(project)}")
+
+    status = pool.read_status(project)
+    if not status:
+        return
+
+    state = status.get("state", "unknown")
+    if state == "running" and not pool.is_running(project):
+        state = "interrupted"
+    Console.println(f"  Worker: {state} (created {status.get('created', 0)})")
+    if status.get("finished"):
+        finished = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(status["finished"]))
+        Console.println(f"  Last run: {finished}")
+    if status.get("error"):
+        Console.println(f"  Error: {status['error']}")
@@ -1,36 +1,12 @@
 """Rename command for GitSpaces - rename spaces."""
 
 from pathlib import Path
-from typing import Optional
 from gitspaces.modules.config import Config
 from gitspaces.modules.console import Console
 from gitspaces.modules.project import Project
 from gitspaces.modules.space import Space
 from gitspaces.modules.path import write_shell_target
-from gitspaces.modules import runshell
-
-
-def _get_current_space_name(project: Project) -> Optional[str]:
-    """Get the name of the current space if we're in one.
-
-    Args:
-        project: The current project.
-
-    Returns:
-        The space name if in a space directory, None otherwise.
-    """
-    cwd = Path.cwd()
-    spaces = project.list_spaces()
-
-    for space_name in spaces:
-        space_path = project.path / space_name
-
-        if cwd == space_path or (
-            cwd.is_relative_to(space_path) and not cwd.is_relative_to(project.zzz_dir)
-        ):
-            return space_name
-
-    return None
+from gitspaces.modules import index, runshell
 
 
 def rename_command(args):
@@ -43,7 +19,7 @@ def rename_command(args):
     """
     # Find the current project
     cwd = Path.cwd()
-    project = Project.find_project(str(cwd))
+    project, current_space = Project.locate(cwd)
 
     if not project:
         Console.println("✗ Not in a GitSpaces project directory")
@@ -56,8 +32,6 @@ def rename_command(args):
     # If new_name is not set but old_name is, treat old_name as new_name
     # (this happens when only one arg is passed and it goes to old_name)
     if old_name and not new_name:
-        # Detect current space
-        current_space = _get_current_space_name(project)
         if current_space:
             new_name = old_name
             old_name = current_space
@@ -69,34 +43,37 @@ def rename_command(args):
         Console.println("✗ Both old_name and new_name are required")
         return
 
-    # Check if old space exists
-    spaces = project.list_spaces()
-    if old_name not in spaces:
-        Console.println(f"✗ Space '{old_name}' not found")
-        Console.println(f"Available spaces: {', '.join(spaces)}")
-        return
+    with project.lock():
+        # Check if old space exists
+        spaces = [s.name for s in project.spaces()]
+        if old_name not in spaces:
+            Console.println(f"✗ Space '{old_name}' not found")
+            Console.println(f"Available spaces: {', '.join(spaces)}")
+            return
 
-    # Check if new name already exists
-    if new_name in spaces:
-        Console.println(f"✗ Space '{new_name}' already exists")
-        return
+        # Check if new name already exists
+        if new_name in spaces:
+            Console.println(f"✗ Space '{new_name}' already exists")
+            return
+
+        # Rename the space
+        space_path = project.path / old_name
 
-    # Rename the space
-    space_path = project.path / old_name
+        space = Space(project, str(space_path))
 
-    space = Space(project, str(space_path))
+        try:
+            renamed_space = space.rename(new_name)
 
-    try:
-        renamed_space = space.rename(new_name)
+            # Write shell target for cd to new path
+            write_shell_target(renamed_space.path)
 
-        # Write shell target for cd to new path
-        write_shell_target(renamed_space.path)
+            Console.println(f"✓ Renamed space '{old_name}' to '{new_name}'")
+            Console.println(f"  New path: {renamed_space.path}")
 
-        Console.println(f"✓ Renamed space '{old_name}' to '{new_name}'")
-        Console.println(f"  New path: {renamed_space.path}")
+            # Change directory to the renamed space
+            runshell.fs.chdir(str(renamed_space.path))
+        except Exception as e:
+            Console.println(f"✗ Error renaming space: {e}")
+            raise
 
-        # Change directory to the renamed space
-        runshell.fs.chdir(str(renamed_space.path))
-    except Exception as e:
-        Console.println(f"✗ Error renaming space: {e}")
-        raise
+        index.record_project(project)
@@ -0,0 +1,66 @@
+"""Share-objects command for GitSpaces - move space history into a shared store."""
+
+from pathlib import Path
+from gitspaces.modules.console import Console
+from gitspaces.modules.project import Project
+
+
+def _format_size(num_bytes: int) -> str:
+    """Format a byte count for display.
+
+    Args:
+        num_bytes: The number of bytes.
+
+    Returns:
+        A human readable size, e.g. "1.5 MB".
+    """
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{num_bytes} B" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def share_objects_command(args):
+    """Convert an existing project to use a shared object store.
+
+    Every space's git objects are moved into the project's store repository and
+    replaced with an alternates reference, so the history is kept on disk once.
+
+    Args:
+        args: Parsed command-line arguments (unused)
+    """
+    # Find the current project
+    cwd = Path.cwd()
+    project = Project.find_project(str(cwd))
+
+    if not project:
+        Console.println("✗ Not in a GitSpaces project directory")
+        return
+
+    if project.mode == Project.MODE_WORKTREE:
+        Console.println("✓ Worktree spaces already share the project's repository")
+        return
+
+    spaces = [s.name for s in project.spaces()]
+    if not spaces:
+        Console.println("✗ No spaces found in project")
+        return
+
+    Console.println(f"Sharing git objects for {len(spaces)} space(s) in '{project.name}'...")
+
+    total_reclaimed = 0
+    with project.lock():
+        for space_name in spaces:
+            try:
+                reclaimed = project.share_objects(project.path / space_name)
+            except Exception as e:
+                Console.println(f"  ✗ Error sharing objects for '{space_name}': {e}")
+                continue
+
+            total_reclaimed += reclaimed
+            Console.println(f"  ✓ {space_name}: reclaimed {_format_size(reclaimed)}")
+
+    Console.println(f"\n✓ Reclaimed {_format_size(total_reclaimed)} in total")
+    Console.println(f"  Shared store: {project.store_dir}")
@@ -6,6 +6,7 @@ from gitspaces.modules.config import Config
 from gitspaces.modules.console import Console
 from gitspaces.modules.project import Project
 from gitspaces.modules.space import Space
+from gitspaces.modules import index, pool
 
 
 def sleep_command(args):
@@ -24,9 +25,9 @@ def sleep_command(args):
         return
 
     # List available spaces
-    spaces = project.list_spaces()
-    active_spaces = [s for s in spaces if not s.startswith(".zzz/")]
-    sleeping_spaces = [s for s in spaces if s.startswith(".zzz/")]
+    with project.lock(shared=True):
+        active_spaces = [s.name for s in project.spaces(sleeping=False)]
+        sleeping_spaces = [s.name for s in project.spaces(sleeping=True)]
 
     # Determine which space to sleep
     if hasattr(args, "space") and args.space:
@@ -49,12 +50,21 @@ def sleep_command(args):
     space_path = project.path / space_to_sleep
     space = Space(project, str(space_path))
 
-    try:
-        sleeping_space = space.sleep()
-        Console.println(f"✓ Space '{space_to_sleep}' is now sleeping")
-    except Exception as e:
-        Console.println(f"✗ Error putting space to sleep: {e}")
-        return
+    with project.lock():
+        # Recheck under the lock: another command may have changed the spaces
+        # while we were prompting
+        if space_to_sleep not in [s.name for s in project.spaces(sleeping=False, refresh=True)]:
+            Console.println(f"✗ Space '{space_to_sleep}' not found or already sleeping")
+            return
+
+        try:
+            sleeping_space = space.sleep()
+            Console.println(f"✓ Space '{space_to_sleep}' is now sleeping")
+        except Exception as e:
+            Console.println(f"✗ Error putting space to sleep: {e}")
+            return
+
+        index.record_project(project)
 
     # Ask if user wants to wake a sleeping space
     if sleeping_spaces:
@@ -76,9 +86,25 @@ def sleep_command(args):
             sleeping_space_path = project.path / space_to_wake
             sleeping_space_obj = Space(project, str(sleeping_space_path))
 
-            try:
-                woken_space = sleeping_space_obj.wake(new_name)
-                Console.println(f"✓ Space '{space_to_wake}' is now awake as '{new_name}'")
-                Console.println(f"  Path: {woken_space.path}")
-            except Exception as e:
-                Console.println(f"✗ Error waking space: {e}")
+            with project.lock():
+                # Recheck under the lock, as for the space put to sleep
+                spaces = [s.name for s in project.spaces(refresh=True)]
+                if space_to_wake not in spaces:
+                    Console.println(f"✗ Sleeping space '{space_to_wake}' not found")
+                    return
+                if new_name in spaces:
+                    Console.println(f"✗ Space '{new_name}' already exists")
+                    return
+
+                try:
+                    woken_space = sleeping_space_obj.wake(new_name)
+                    Console.println(f"✓ Space '{space_to_wake}' is now awake as '{new_name}'")
+                    Console.println(f"  Path: {woken_space.path}")
+                except Exception as e:
+                    Console.println(f"✗ Error waking space: {e}")
+                    return
+
+                index.record_project(project)
+
+            if pool.replenish_in_background(project):
+                Console.println("  Replenishing sleepers in the background")
@@ -0,0 +1,99 @@
+"""Status command for GitSpaces - show the state of every space."""
+
+import json
+import sys
+import time
+from gitspaces.modules.config import Config
+from gitspaces.modules.console import Console
+from gitspaces.modules import gitrefs, index, status
+
+
+def _upstream(row: status.SpaceStatus) -> str:
+    if row.ahead is None or row.behind is None:
+        return "-"
+    parts = []
+    if row.ahead:
+        parts.append(f"↑{row.ahead}")
+    if row.behind:
+        parts.append(f"↓{row.behind}")
+    return " ".join(parts) or "up to date"
+
+
+def _modified(row: status.SpaceStatus) -> str:
+    if row.modified is None:
+        return "-"
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(row.modified))
+
+
+def status_command(args):
+    """Show the branch, local changes, upstream distance and last change of every space.
+
+    Spaces are checked in parallel and each row is printed as soon as its space
+    has been checked, so rows don't come out in a fixed order. Spaces whose git
+    metadata hasn't changed since the last check come from the status cache.
+
+    Args:
+        args: Parsed command-line arguments containing:
+            - json: Print one JSON object per space instead of a table
+            - jobs: The most spaces to check at once
+            - refresh: Check every space with git instead of using cached results
+    """
+    projects = index.ProjectIndex().list_projects(Config.instance().project_paths)
+
+    targets = []
+    for project in projects:
+        with project.lock(shared=True):
+            targets.extend((project, entry) for entry in project.spaces())
+
+    if not targets:
+        if not args.json:
+            Console.println("✗ No spaces found in the configured project paths")
+        return
+
+    start = time.perf_counter()
+    rows = status.collect(targets, workers=args.jobs, refresh=args.refresh)
+
+    if args.json:
+        for row in rows:
+            sys.stdout.write(json.dumps(row.to_json()) + "\n")
+            sys.stdout.flush()
+        return
+
+    # Size the columns up front; reading HEAD is cheap, git status isn't
+    project_width = max(len("PROJECT"), *(len(p.name) for p, _ in targets))
+    space_width = max(len("SPACE"), *(len(e.name) for _, e in targets))
+    branch_width = max(
+        len("BRANCH"), *(len(gitrefs.current_branch(e.path) or "") for _, e in targets)
+    )
+    row_format = (
+        f"{{:<{project_width}}}  {{:<{space_width}}}  {{:<{branch_width}}}  {{:<7}}  {{:<11}}  {{}}"
+    )
+
+    Console.println(
+        row_format.format("PROJECT", "SPACE", "BRANCH", "STATE", "UPSTREAM", "MODIFIED")
+    )
+    dirty = failed = cached = 0
+    for row in rows:
+        cached += row.cached
+        if row.error:
+            failed += 1
+            state = "error"
+        elif row.dirty:
+            dirty += 1
+            state = "dirty"
+        else:
+            state = "clean"
+        line = row_format.format(
+            row.project, row.space, row.branch or "-", state, _upstream(row), _modified(row)
+        )
+        Console.println(line)
+        if row.error:
+            Console.println(f"  ✗ {row.error}")
+
+    elapsed = time.perf_counter() - start
+    summary = f"{len(targets)} spaces in {len(projects)} projects: {dirty} with changes"
+    if failed:
+        summary += f", {failed} failed"
+    if cached:
+        summary += f", {cached} unchanged since the last check"
+    Console.println(f"\n{summary} ({elapsed:.2f}s)")
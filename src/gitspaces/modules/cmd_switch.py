@@ -7,59 +7,30 @@ from gitspaces.modules.console import Console
 from gitspaces.modules.project import Project
 from gitspaces.modules.space import Space
 from gitspaces.modules.path import write_shell_target
-from gitspaces.modules import runshell
+from gitspaces.modules import index, pool, runshell, status
 
 
 def _find_all_projects() -> List[Project]:
     """Find all GitSpaces projects in configured project paths.
 
+    Projects come from the persistent index, which only rescans project paths
+    that changed since they were last scanned. Rescans report how long they took.
+
     Returns:
         List of Project instances found.
     """
-    config = Config.instance()
-    projects = []
-
-    for project_path in config.project_paths:
-        path = Path(project_path).expanduser().resolve()
-        if not path.exists():
-            continue
+    project_index = index.ProjectIndex()
+    projects = project_index.list_projects(Config.instance().project_paths)
 
-        # Scan for directories with __GITSPACES_PROJECT__ marker
-        for item in path.iterdir():
-            if item.is_dir():
-                dotfile = item / Project.DOTFILE
-                if dotfile.exists():
-                    projects.append(Project(str(item)))
+    for project_path, found in project_index.scans:
+        Console.println(
+            f"Scanned {project_path}: {len(found.projects)} projects in "
+            f"{len(found.dirs)} directories ({found.elapsed:.2f}s)"
+        )
 
     return projects
 
 
-def _get_current_space_name(project: Project) -> Optional[str]:
-    """Get the name of the current space if we're in one.
-
-    Args:
-        project: The current project.
-
-    Returns:
-        The space name if in a space directory, None otherwise.
-    """
-    cwd = Path.cwd()
-    spaces = project.list_spaces()
-
-    for space_name in spaces:
-        if space_name.startswith(".zzz/"):
-            space_path = project.path / space_name
-        else:
-            space_path = project.path / space_name
-
-        if cwd == space_path or (
-            cwd.is_relative_to(space_path) and not cwd.is_relative_to(project.zzz_dir)
-        ):
-            return space_name
-
-    return None
-
-
 def switch_command(args):
     """Switch to a different space.
 
@@ -69,7 +40,7 @@ def switch_command(args):
     """
     # Find the current project
     cwd = Path.cwd()
-    project = Project.find_project(str(cwd))
+    project, current_space = Project.locate(cwd)
 
     if not project:
         # When not in a project, list all projects from config
@@ -92,18 +63,16 @@ def switch_command(args):
             return
 
     # List available spaces
-    all_spaces = project.list_spaces()
+    with project.lock(shared=True):
+        all_spaces = project.spaces()
 
     if not all_spaces:
         Console.println("✗ No spaces found in project")
         return
 
     # Separate active and sleeping spaces
-    active_spaces = [s for s in all_spaces if not s.startswith(".zzz/")]
-    sleeping_spaces = [s for s in all_spaces if s.startswith(".zzz/")]
-
-    # Get current space to filter it out
-    current_space = _get_current_space_name(project)
+    active_spaces = [s.name for s in all_spaces if not s.sleeping]
+    sleeping_spaces = [s.name for s in all_spaces if s.sleeping]
 
     # Filter out current space from choices
     display_spaces = [s for s in active_spaces if s != current_space]
@@ -139,9 +108,14 @@ def switch_command(args):
             Console.println("✗ No spaces available to switch to")
             return
 
-        # Interactive selection
+        # Interactive selection; branch and dirty state fill in while the menu is up
         Console.println(f"Project: {project.name}")
-        target_space = Console.prompt_select("Select a space:", choices=choices)
+        annotations = status.StatusAnnotations(
+            [(project, s) for s in all_spaces if s.name in display_spaces]
+        )
+        target_space = Console.prompt_select(
+            "Select a space:", choices=choices, annotations=annotations
+        )
 
         # Handle wake option
         if target_space == wake_option:
@@ -171,7 +145,7 @@ def _wake_and_switch(project: Project, sleeper_name: Optional[str]):
         project: The project containing the sleeper.
         sleeper_name: The sleeper space name (e.g., '.zzz/zzz-0'), or None to prompt.
     """
-    sleeping_spaces = [s for s in project.list_spaces() if s.startswith(".zzz/")]
+    sleeping_spaces = [s.name for s in project.spaces(sleeping=True)]
 
     if not sleeping_spaces:
         Console.println("✗ No sleeping spaces to wake")
@@ -194,27 +168,37 @@ def _wake_and_switch(project: Project, sleeper_name: Optional[str]):
         Console.println("✗ A name is required to wake the space")
         return
 
-    # Check if name already exists
-    active_spaces = [s for s in project.list_spaces() if not s.startswith(".zzz/")]
-    if new_name in active_spaces:
-        Console.println(f"✗ Space '{new_name}' already exists")
-        return
+    with project.lock():
+        # Recheck under the lock: another command may have changed the spaces
+        # while we were prompting
+        spaces = [s.name for s in project.spaces(refresh=True)]
+        if sleeper_name not in spaces:
+            Console.println(f"✗ Sleeping space '{sleeper_name}' not found")
+            return
+        if new_name in spaces:
+            Console.println(f"✗ Space '{new_name}' already exists")
+            return
 
-    # Wake the sleeper
-    sleeper_path = project.path / sleeper_name
-    space = Space(project, str(sleeper_path))
+        # Wake the sleeper
+        sleeper_path = project.path / sleeper_name
+        space = Space(project, str(sleeper_path))
 
-    try:
-        woken_space = space.wake(new_name)
+        try:
+            woken_space = space.wake(new_name)
 
-        # Write shell target for cd
-        write_shell_target(woken_space.path)
+            # Write shell target for cd
+            write_shell_target(woken_space.path)
 
-        Console.println(f"✓ Woke space '{sleeper_name}' as '{new_name}'")
-        Console.println(f"  Path: {woken_space.path}")
+            Console.println(f"✓ Woke space '{sleeper_name}' as '{new_name}'")
+            Console.println(f"  Path: {woken_space.path}")
 
-        # Change directory
-        runshell.fs.chdir(str(woken_space.path))
-    except Exception as e:
-        Console.println(f"✗ Error waking space: {e}")
-        raise
+            # Change directory
+            runshell.fs.chdir(str(woken_space.path))
+        except Exception as e:
+            Console.println(f"✗ Error waking space: {e}")
+            raise
+
+        index.record_project(project)
+
+    if pool.replenish_in_background(project):
+        Console.println("  Replenishing sleepers in the background")
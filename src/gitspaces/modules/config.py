@@ -1,8 +1,9 @@
 """Configuration management for GitSpaces."""
 
 from __future__ import annotations
+import json
+import os
 from typing import Any
-import yaml
 from pathlib import Path
 
 
@@ -14,6 +15,9 @@ class Config:
     _config_file: Path | None = None
     _data: dict[str, Any] = {}
 
+    # Parsed config.yaml, so most runs don't have to import PyYAML
+    CACHE_FILE = ".config-cache.json"
+
     @classmethod
     def instance(cls) -> "Config":
         """Get the singleton instance of Config."""
@@ -56,16 +60,111 @@ class Config:
         """Set the default editor."""
         self._data["default_editor"] = editor
 
+    @property
+    def copy_workers(self) -> int:
+        """Get the number of threads used to copy files when duplicating spaces."""
+        # Same default as ThreadPoolExecutor: copying is I/O bound
+        default = min(32, (os.cpu_count() or 1) + 4)
+        try:
+            return max(1, int(self._data.get("copy_workers", default)))
+        except (TypeError, ValueError):
+            return default
+
+    @copy_workers.setter
+    def copy_workers(self, workers: int):
+        """Set the number of threads used to copy files when duplicating spaces."""
+        self._data["copy_workers"] = workers
+
+    @property
+    def mirror_cache(self) -> bool:
+        """Get whether clone should create and use local mirrors for every URL."""
+        value = self._data.get("mirror_cache", False)
+        if isinstance(value, str):
+            return value.strip().lower() in ("1", "true", "yes", "on")
+        return bool(value)
+
+    @mirror_cache.setter
+    def mirror_cache(self, enabled: bool):
+        """Set whether clone should create and use local mirrors for every URL."""
+        self._data["mirror_cache"] = enabled
+
+    @property
+    def discovery_depth(self) -> int:
+        """Get how many directory levels below each project path to search for projects."""
+        try:
+            return max(1, int(self._data.get("discovery_depth", 3)))
+        except (TypeError, ValueError):
+            return 3
+
+    @discovery_depth.setter
+    def discovery_depth(self, depth: int):
+        """Set how many directory levels below each project path to search for projects."""
+        self._data["discovery_depth"] = depth
+
+    @property
+    def discovery_exclude(self) -> list[str]:
+        """Get the glob patterns for directories skipped when searching for projects."""
+        value = self._data.get("discovery_exclude", [])
+        if isinstance(value, str):
+            return [p.strip() for p in value.split(",") if p.strip()]
+        return [str(p) for p in value or []]
+
+    @discovery_exclude.setter
+    def discovery_exclude(self, patterns: list[str]):
+        """Set the glob patterns for directories skipped when searching for projects."""
+        self._data["discovery_exclude"] = patterns
+
+    @property
+    def lock_timeout(self) -> float:
+        """Get how many seconds to wait for another command using the same project."""
+        try:
+            return max(0.0, float(self._data.get("lock_timeout", 60)))
+        except (TypeError, ValueError):
+            return 60.0
+
+    @lock_timeout.setter
+    def lock_timeout(self, seconds: float):
+        """Set how many seconds to wait for another command using the same project."""
+        self._data["lock_timeout"] = seconds
+
     def load(self):
-        """Load configuration from file."""
-        if self.config_file.exists():
-            with open(self.config_file, "r") as f:
-                self._data = yaml.safe_load(f) or {}
-        else:
+        """Load configuration from file.
+
+        The parsed file is cached as JSON, keyed by the file's mtime and size,
+        and the YAML is only parsed again when it changes.
+        """
+        try:
+            st = self.config_file.stat()
+        except FileNotFoundError:
             self._data = {}
+            return
+
+        key = [st.st_mtime_ns, st.st_size]
+        cache_file = self.config_dir / self.CACHE_FILE
+        try:
+            cached = json.loads(cache_file.read_text())
+            if cached["key"] == key and isinstance(cached["data"], dict):
+                self._data = cached["data"]
+                return
+        except (OSError, ValueError, TypeError, KeyError):
+            pass
+
+        import yaml
+
+        with open(self.config_file, "r") as f:
+            self._data = yaml.safe_load(f) or {}
+
+        try:
+            tmp_file = cache_file.with_name(f"{self.CACHE_FILE}.{os.getpid()}")
+            tmp_file.write_text(json.dumps({"key": key, "data": self._data}))
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError):
+            pass  # Values JSON can't hold, or a read-only directory: parse every time
 
     def save(self):
         """Save configuration to file."""
+        import yaml
+
         self.config_dir.mkdir(parents=True, exist_ok=True)
         with open(self.config_file, "w") as f:
             yaml.safe_dump(self._data, f, default_flow_style=False)
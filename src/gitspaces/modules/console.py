@@ -1,16 +1,38 @@
 """Console output and prompting utilities."""
 
 from __future__ import annotations
-from typing import Any
-from rich.console import Console as RichConsole
-import questionary
+from typing import TYPE_CHECKING, Any, Callable, Protocol
+
+# rich and questionary (with prompt_toolkit) take over 100ms to import, so they
+# are imported when the first message is printed or the first prompt is shown
+if TYPE_CHECKING:
+    from rich.console import Console as RichConsole
+
+
+class Annotations(Protocol):
+    """A source of notes shown next to the choices of a select prompt."""
+
+    def start(self, update: Callable[[str, str], None]) -> None:
+        """Start producing notes, calling update(choice, note) from any thread."""
+
+    def cancel(self) -> None:
+        """Stop producing notes; called once a choice has been made."""
 
 
 class Console:
     """Console utilities for output and user prompts."""
 
     _use_pretty_prompts = True
-    _console = RichConsole()
+    _console: RichConsole | None = None
+
+    @classmethod
+    def _rich(cls) -> RichConsole:
+        """Get the rich console, creating it on first use."""
+        if cls._console is None:
+            from rich.console import Console as RichConsole
+
+            cls._console = RichConsole()
+        return cls._console
 
     @classmethod
     def println(cls, message: str, *args: Any) -> None:
@@ -22,7 +44,7 @@ class Console:
         """
         if args:
             message = message % args
-        cls._console.print(message)
+        cls._rich().print(message)
 
     @classmethod
     def set_use_pretty_prompts(cls, use_pretty: bool) -> None:
@@ -44,6 +66,8 @@ class Console:
         Returns:
             The user's input.
         """
+        import questionary
+
         return questionary.text(message, default=default).ask() or default
 
     @classmethod
@@ -57,19 +81,49 @@ class Console:
         Returns:
             True if confirmed, False otherwise.
         """
+        import questionary
+
         result = questionary.confirm(message, default=default).ask()
         return result if result is not None else default
 
     @classmethod
-    def prompt_select(cls, message: str, choices: list[str], default: str | None = None) -> str:
+    def prompt_select(
+        cls,
+        message: str,
+        choices: list[str],
+        default: str | None = None,
+        annotations: Annotations | None = None,
+    ) -> str:
         """Prompt the user to select from a list of choices.
 
         Args:
             message: The prompt message.
             choices: The list of choices.
             default: The default choice.
+            annotations: Notes to show after the choices. The prompt is shown
+                straight away and each note appears as it arrives; whatever
+                hasn't arrived when the user chooses is cancelled.
 
         Returns:
             The selected choice.
         """
-        return str(questionary.select(message, choices=choices, default=default).ask())
+        import questionary
+
+        if annotations is None:
+            return str(questionary.select(message, choices=choices, default=default).ask())
+
+        items = {choice: questionary.Choice(choice, value=choice) for choice in choices}
+        width = max(len(choice) for choice in choices)
+        question = questionary.select(message, choices=list(items.values()), default=default)
+
+        def update(choice: str, note: str):
+            item = items.get(choice)
+            if item is not None:
+                item.title = f"{choice:<{width}}  {note}"
+                question.application.invalidate()  # Redraws from any thread
+
+        annotations.start(update)
+        try:
+            return str(question.ask())
+        finally:
+            annotations.cancel()
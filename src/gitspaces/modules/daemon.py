@@ -0,0 +1,430 @@
+"""Resident daemon that runs quick commands without starting Python.
+
+Every ``gs`` invocation pays for a new interpreter, imports and a fresh read
+of the configuration and project index before it does any work. The daemon
+keeps one process with all of that loaded, listening on a Unix domain socket
+in ``~/.gitspaces/daemon/``, and runs the commands in ``DAEMON_COMMANDS`` for
+clients: the shell wrapper (through socat) or the ``gitspaces`` CLI itself.
+
+The protocol is small enough for a shell to speak. A request is NUL-terminated
+fields: the client's working directory, its shell PID, then the command's
+arguments. The daemon replies with the command's output followed by a last
+line holding the exit status, or ``-`` when the client should run the command
+itself (e.g. it needs to prompt). A client that can't connect does the same.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import socket
+import sys
+import time
+from contextlib import ExitStack, contextmanager, redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Iterator
+from gitspaces.modules.errors import GitSpacesError, LockError
+from gitspaces.modules.path import SHELL_PID_ENV, shell_targets_dir
+
+DAEMON_DIR = "daemon"
+SOCKET_NAME = "socket"
+
+# Commands that finish quickly and don't change anything before their first
+# prompt, so the client can rerun them when the daemon declines
+DAEMON_COMMANDS = ("switch", "list", "config", "daemon")
+DECLINED = "-"
+
+# Set to bypass a running daemon
+DISABLE_ENV = "GITSPACES_NO_DAEMON"
+
+PROMPTS = ("prompt_input", "prompt_confirm", "prompt_select")
+START_TIMEOUT = 5.0
+
+# Seconds the daemon waits on a client's socket, and a client waits for the
+# daemon, before giving up on the connection
+CONNECTION_TIMEOUT = 5.0
+REQUEST_TIMEOUT = 15.0
+
+
+class NeedsTerminal(BaseException):
+    """Raised in the daemon when a command prompts.
+
+    Derives from BaseException so the CLI's error handling doesn't report it.
+    """
+
+
+class ProjectBusy(BaseException):
+    """Raised in the daemon when a command would wait for another command's project lock.
+
+    Requests are handled one at a time, so waiting would hold up every client.
+    """
+
+
+def available() -> bool:
+    """Check whether this platform supports the daemon (Unix domain sockets)."""
+    return hasattr(socket, "AF_UNIX")
+
+
+def socket_path() -> Path:
+    """Get the daemon's socket path.
+
+    The socket lives in a directory only the user can enter, so other users
+    can't connect to it on systems that ignore socket file permissions.
+
+    Returns:
+        The Path to ~/.gitspaces/daemon/socket.
+    """
+    return shell_targets_dir() / DAEMON_DIR / SOCKET_NAME
+
+
+def _encode_request(cwd: str, shell_pid: str, argv: list[str]) -> bytes:
+    return b"".join(os.fsencode(field) + b"\0" for field in [cwd, shell_pid, *argv])
+
+
+def _decode_request(data: bytes) -> tuple[str, str, list[str]]:
+    fields = [os.fsdecode(field) for field in data.split(b"\0")[:-1]]
+    if len(fields) < 2:
+        raise ValueError("incomplete request")
+    return fields[0], fields[1], fields[2:]
+
+
+def _recv_all(conn: socket.socket) -> bytes:
+    chunks: list[bytes] = []
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def command_name(argv: list[str]) -> str | None:
+    """Get the command a CLI argument list runs.
+
+    Args:
+        argv: The arguments, without the program name.
+
+    Returns:
+        The command name ('switch' when none is given), or None for
+        --help and --version.
+    """
+    for arg in argv:
+        if arg in ("-h", "--help", "--version"):
+            return None
+        if not arg.startswith("-"):
+            return arg
+    return "switch"
+
+
+def request(
+    argv: list[str],
+    cwd: str | None = None,
+    shell_pid: str | None = None,
+    path: str | Path | None = None,
+    timeout: float = REQUEST_TIMEOUT,
+) -> tuple[int, str] | None:
+    """Ask the daemon to run a command.
+
+    Args:
+        argv: The command's arguments, without the program name.
+        cwd: The directory to run it in (default: the current directory).
+        shell_pid: The PID to write the shell target for (default:
+            GITSPACES_SHELL_PID, or this process's PID).
+        path: The daemon's socket (default: socket_path()).
+        timeout: Seconds to wait for the daemon to connect or reply.
+
+    Returns:
+        The exit status and output, or None if the daemon declined.
+
+    Raises:
+        OSError: If the daemon isn't running, the connection failed or
+            the daemon didn't reply in time.
+    """
+    if cwd is None:
+        cwd = os.getcwd()
+    if shell_pid is None:
+        shell_pid = os.environ.get(SHELL_PID_ENV) or str(os.getpid())
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(path or socket_path()))
+        sock.sendall(_encode_request(cwd, shell_pid, argv))
+        sock.shutdown(socket.SHUT_WR)
+        response = _recv_all(sock).decode()
+
+    head, sep, status = response[:-1].rpartition("\n")
+    if not response.endswith("\n") or status == DECLINED:
+        return None
+    try:
+        return int(status), head + sep
+    except ValueError:
+        return None
+
+
+def forward(argv: list[str]) -> int | None:
+    """Run a command in the daemon if it is running.
+
+    Args:
+        argv: The command's arguments, without the program name.
+
+    Returns:
+        The command's exit status, or None if the caller should run the
+        command itself (no daemon, or the daemon declined).
+    """
+    if not available() or os.environ.get(DISABLE_ENV):
+        return None
+
+    path = socket_path()
+    if not path.exists() or command_name(argv) not in DAEMON_COMMANDS:
+        return None
+
+    try:
+        result = request(argv, path=path)
+    except OSError:
+        return None
+    if result is None:
+        return None
+
+    status, output = result
+    sys.stdout.write(output)
+    sys.stdout.flush()
+    return status
+
+
+def is_running(path: str | Path | None = None) -> bool:
+    """Check whether a daemon is listening.
+
+    Args:
+        path: The daemon's socket (default: socket_path()).
+
+    Returns:
+        True if a daemon accepted a connection.
+    """
+    if not available():
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(path or socket_path()))
+            return True
+        except OSError:
+            return False
+
+
+def start() -> bool:
+    """Start the daemon in the background and wait until it is listening.
+
+    Returns:
+        True once the daemon accepts connections, False if it didn't in time.
+    """
+    from gitspaces.modules import runshell
+
+    runshell.subprocess.spawn_detached([sys.executable, "-m", "gitspaces", "daemon", "run"])
+
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        if is_running():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def _needs_terminal(cls, *args, **kwargs):
+    raise NeedsTerminal()
+
+
+def _lock_without_waiting(lock):
+    """Wrap Project.lock to fail at once with ProjectBusy when another command holds it."""
+
+    @contextmanager
+    def lock_or_fail(self, shared: bool = False, timeout: float | None = None):
+        with ExitStack() as stack:
+            try:
+                stack.enter_context(lock(self, shared=shared, timeout=0))
+            except LockError:
+                raise ProjectBusy() from None
+            yield
+
+    return lock_or_fail
+
+
+class Daemon:
+    """Serves commands to clients over a Unix domain socket, one at a time.
+
+    Commands change the working directory and environment of the whole
+    process, so requests are handled sequentially.
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        """Initialize a Daemon.
+
+        Args:
+            path: The socket to listen on (default: socket_path()).
+        """
+        self.path = Path(path) if path else socket_path()
+        self.started = time.time()
+        self.requests = 0
+        self._stopping = False
+        self._server: socket.socket | None = None
+
+    def warm_up(self):
+        """Import everything a command needs, so the first request is fast too."""
+        import yaml  # noqa: F401
+        from rich.console import Console as RichConsole  # noqa: F401
+        from gitspaces import cli
+        from gitspaces.modules import runshell
+
+        cli.create_parser()  # imports every command module
+        runshell._repo_class()
+
+    def listen(self):
+        """Bind the socket, replacing a stale one left by a daemon that died.
+
+        Raises:
+            GitSpacesError: If another daemon is already listening.
+        """
+        if is_running(self.path):
+            raise GitSpacesError(f"A daemon is already listening on {self.path}")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        os.chmod(self.path.parent, 0o700)
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(str(self.path))
+        os.chmod(self.path, 0o600)
+        self._server.listen()
+
+    def serve_forever(self):
+        """Handle requests until a client asks the daemon to stop."""
+        if self._server is None:
+            self.listen()
+        server = self._server
+
+        try:
+            while not self._stopping:
+                conn, _ = server.accept()
+                with conn:
+                    # A client that stops sending or reading mustn't stall the others
+                    conn.settimeout(CONNECTION_TIMEOUT)
+                    try:
+                        request_data = _recv_all(conn)
+                        conn.sendall(self.handle(request_data).encode())
+                    except (OSError, ValueError):
+                        pass  # The client went away or sent garbage
+        finally:
+            server.close()
+            self._server = None
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def handle(self, data: bytes) -> str:
+        """Run one request.
+
+        Args:
+            data: The encoded request.
+
+        Returns:
+            The response: output, then the exit status (or DECLINED) on its own line.
+
+        Raises:
+            ValueError: If the request is malformed.
+        """
+        cwd, shell_pid, argv = _decode_request(data)
+        self.requests += 1
+
+        if command_name(argv) not in DAEMON_COMMANDS:
+            return DECLINED + "\n"
+        if argv == ["daemon", "stop"]:
+            self._stopping = True
+            return "✓ Daemon stopped\n0\n"
+        if argv == ["daemon", "status"]:
+            uptime = time.time() - self.started
+            return (
+                f"✓ Daemon running (pid {os.getpid()}, up {uptime:.0f}s, "
+                f"{self.requests} requests)\n  Socket: {self.path}\n0\n"
+            )
+        if argv[:1] == ["daemon"]:
+            return DECLINED + "\n"
+
+        output = io.StringIO()
+        try:
+            with self._request_context(cwd, shell_pid, output):
+                status = self._run(argv, output)
+        except (NeedsTerminal, ProjectBusy):
+            # Prompting, or waiting for a busy project, is left to the client
+            return DECLINED + "\n"
+        except OSError:
+            return DECLINED + "\n"  # e.g. the client's directory is gone
+        except Exception as e:
+            # Report failures to the client instead of letting them stop the daemon
+            text = output.getvalue()
+            if text and not text.endswith("\n"):
+                text += "\n"
+            return f"{text}✗ {e}\n1\n"
+
+        text = output.getvalue()
+        if text and not text.endswith("\n"):
+            text += "\n"
+        return f"{text}{status}\n"
+
+    @staticmethod
+    def _run(argv: list[str], output: io.StringIO) -> int:
+        from gitspaces import cli
+
+        try:
+            cli.run(argv)
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                return e.code or 0
+            output.write(f"{e.code}\n")
+            return 1
+        return 0
+
+    @contextmanager
+    def _request_context(self, cwd: str, shell_pid: str, output: io.StringIO) -> Iterator[None]:
+        """Run a command as if it were a fresh process in the client's directory.
+
+        Output goes to ``output``, prompts raise NeedsTerminal, project locks
+        fail at once instead of waiting for another command, and the
+        per-process caches that assume nothing changes on disk behind them
+        (the configuration, cwd lookups) are reset. Parsed files and imported
+        modules stay warm.
+        """
+        from rich.console import Console as RichConsole
+        from gitspaces.modules.config import Config
+        from gitspaces.modules.console import Console
+        from gitspaces.modules.project import Project
+
+        saved_cwd = os.getcwd()
+        saved_pid = os.environ.get(SHELL_PID_ENV)
+        saved_console = Console._console
+        saved_prompts = {name: Console.__dict__[name] for name in PROMPTS}
+        saved_lock = Project.__dict__["lock"]
+
+        os.chdir(cwd)
+        try:
+            os.environ[SHELL_PID_ENV] = shell_pid
+            Console._console = RichConsole(file=output, soft_wrap=True)
+            for name in PROMPTS:
+                setattr(Console, name, classmethod(_needs_terminal))
+            Config._instance = None
+            Config._data = {}
+            Project.clear_location_cache()
+            setattr(Project, "lock", _lock_without_waiting(saved_lock))
+
+            with redirect_stdout(output), redirect_stderr(output):
+                yield
+        finally:
+            Console._console = saved_console
+            setattr(Project, "lock", saved_lock)
+            for name, prompt in saved_prompts.items():
+                setattr(Console, name, prompt)
+            if saved_pid is None:
+                os.environ.pop(SHELL_PID_ENV, None)
+            else:
+                os.environ[SHELL_PID_ENV] = saved_pid
+            os.chdir(saved_cwd)
@@ -0,0 +1,128 @@
+"""Recursive discovery of GitSpaces projects under a project path.
+
+Directories are listed with ``os.scandir`` on a thread pool, so a deep tree
+on a network filesystem is walked with many listings in flight. A directory
+holding a project marker is reported and never descended into: its spaces,
+``.zzz`` and ``.git`` directories can hold tens of thousands of entries.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import NamedTuple
+from gitspaces.modules.project import Project
+
+# Never worth descending into, whatever the exclusion globs say
+SKIP_DIRS = frozenset({".git", Project.ZZZ_DIR, Project.STORE_DIR})
+
+MAX_WORKERS = 16
+
+
+class Discovery(NamedTuple):
+    """The result of scanning one project path."""
+
+    projects: list[str]
+    dirs: dict[str, int]  # directory listed -> its mtime_ns when listed
+    elapsed: float
+
+
+def _excluded(name: str, rel_path: str, exclude: list[str]) -> bool:
+    return name in SKIP_DIRS or any(
+        fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(rel_path, pattern) for pattern in exclude
+    )
+
+
+def _scan_dir(path: str, rel_path: str, depth: int, max_depth: int, exclude: list[str]):
+    """List one directory.
+
+    Returns:
+        Its mtime_ns, the projects directly below it, and the directories
+        left to scan as (path, rel_path, depth, (st_dev, st_ino)) tuples.
+    """
+    projects = []
+    subdirs = []
+    mtime = os.stat(path).st_mtime_ns
+
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                if not entry.is_dir():
+                    continue
+            except OSError:
+                continue
+
+            entry_rel = f"{rel_path}/{entry.name}" if rel_path else entry.name
+            if _excluded(entry.name, entry_rel, exclude):
+                continue
+
+            if os.path.exists(os.path.join(entry.path, Project.DOTFILE)):
+                projects.append(entry.path)
+            elif depth < max_depth:
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                subdirs.append((entry.path, entry_rel, depth + 1, (st.st_dev, st.st_ino)))
+
+    return mtime, projects, subdirs
+
+
+def discover_projects(
+    root: str,
+    max_depth: int = 1,
+    exclude: list[str] | None = None,
+    workers: int = MAX_WORKERS,
+) -> Discovery:
+    """Find the projects up to max_depth levels below a directory.
+
+    Args:
+        root: The directory to scan.
+        max_depth: How many levels to look below root (1 = direct children).
+        exclude: Glob patterns for directories to skip, matched against the
+            directory name and its path relative to root.
+        workers: The number of directories listed concurrently.
+
+    Returns:
+        The projects found (sorted), the directories listed with their
+        mtimes, and how long the scan took in seconds.
+    """
+    exclude = list(exclude or [])
+    start = time.perf_counter()
+    projects: list[str] = []
+    dirs: dict[str, int] = {}
+
+    try:
+        st = os.stat(root)
+    except OSError:
+        return Discovery([], {}, time.perf_counter() - start)
+    # Symlinked directories are followed, but each directory is listed once
+    seen = {(st.st_dev, st.st_ino)}
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        pending = {executor.submit(_scan_dir, root, "", 1, max_depth, exclude): root}
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = pending.pop(future)
+                try:
+                    mtime, found, subdirs = future.result()
+                except OSError:
+                    # Unreadable or vanished mid-scan: skip it
+                    continue
+
+                dirs[path] = mtime
+                projects.extend(found)
+                for sub_path, sub_rel, depth, key in subdirs:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    sub_future = executor.submit(
+                        _scan_dir, sub_path, sub_rel, depth, max_depth, exclude
+                    )
+                    pending[sub_future] = sub_path
+
+    return Discovery(sorted(projects), dirs, time.perf_counter() - start)
@@ -23,3 +23,9 @@ class SpaceError(GitSpacesError):
     """Space related errors."""
 
     pass
+
+
+class LockError(GitSpacesError):
+    """Lock acquisition errors."""
+
+    pass
@@ -0,0 +1,143 @@
+"""Run a command in many spaces at once.
+
+Each space gets its own process, started without a shell in the space's
+directory with no input, on a bounded thread pool. A worker thread reads the
+process's combined stdout and stderr line by line and hands each line to a
+callback, so callers can print output as it arrives or keep it until the
+space finishes. Results are yielded in the order the spaces finish.
+"""
+
+from __future__ import annotations
+
+import os
+import signal
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterator, NamedTuple
+from gitspaces.modules.project import Project, SpaceEntry
+from gitspaces.modules import runshell
+
+DEFAULT_JOBS = os.cpu_count() or 1
+
+# Exit statuses for commands that couldn't be started, as a shell reports them
+NOT_EXECUTABLE = 126
+NOT_FOUND = 127
+
+
+class ExecResult(NamedTuple):
+    """The outcome of running the command in one space."""
+
+    project: str
+    space: str
+    path: str
+    status: int  # shell-style exit status (see exit_status)
+    elapsed: float  # seconds
+    error: str | None = None  # why the command couldn't be started
+
+
+def exit_status(returncode: int) -> int:
+    """Convert a process's return code to a shell-style exit status.
+
+    Args:
+        returncode: The return code, negative when the process was killed by a signal.
+
+    Returns:
+        The status, 128 + the signal number for killed processes.
+    """
+    if returncode < 0:
+        return 128 - returncode
+    return min(returncode, 255)
+
+
+def run_in_space(
+    project: Project,
+    entry: SpaceEntry,
+    command: list[str],
+    on_line: Callable[[str], None],
+) -> ExecResult:
+    """Run a command in a space, passing each line it prints to a callback.
+
+    Args:
+        project: The project the space belongs to.
+        entry: The space.
+        command: The program and its arguments.
+        on_line: Called with each line of output (stdout and stderr combined),
+            including its line ending, from the calling thread.
+
+    Returns:
+        The command's result; a command that can't be started gets the
+        status a shell would give it, with the reason in the error field.
+    """
+    start = time.perf_counter()
+    result = ExecResult(project.name, entry.name, str(entry.path), 0, 0.0)
+
+    try:
+        process = runshell.subprocess.stream(command, entry.path)
+    except FileNotFoundError as e:
+        return result._replace(status=NOT_FOUND, elapsed=time.perf_counter() - start, error=str(e))
+    except OSError as e:
+        return result._replace(
+            status=NOT_EXECUTABLE, elapsed=time.perf_counter() - start, error=str(e)
+        )
+
+    with process:
+        for line in process.stdout:
+            on_line(line)
+    return result._replace(
+        status=exit_status(process.returncode), elapsed=time.perf_counter() - start
+    )
+
+
+def run_all(
+    targets: list[tuple[Project, SpaceEntry]],
+    command: list[str],
+    on_line: Callable[[tuple[Project, SpaceEntry], str], None],
+    jobs: int = DEFAULT_JOBS,
+) -> Iterator[ExecResult]:
+    """Run a command in several spaces concurrently.
+
+    Args:
+        targets: The spaces, with their projects.
+        command: The program and its arguments.
+        on_line: Called with the target and each line of its output, from
+            the worker thread running that space.
+        jobs: The most commands to run at once.
+
+    Yields:
+        Each space's result as soon as its command exits.
+    """
+    if not targets:
+        return
+
+    def line_callback(target: tuple[Project, SpaceEntry]) -> Callable[[str], None]:
+        return lambda line: on_line(target, line)
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(jobs, len(targets))))
+    try:
+        futures = [
+            executor.submit(run_in_space, project, entry, command, line_callback((project, entry)))
+            for project, entry in targets
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        # Don't start commands in more spaces after Ctrl-C; running ones get
+        # the terminal's SIGINT themselves
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def describe_status(status: int) -> str:
+    """Describe a failed exit status, e.g. 'exited with 2' or 'killed by SIGTERM'.
+
+    Args:
+        status: A shell-style exit status (see exit_status).
+
+    Returns:
+        The description.
+    """
+    if status > 128:
+        try:
+            return f"killed by {signal.Signals(status - 128).name}"
+        except ValueError:
+            pass
+    return f"exited with {status}"
@@ -0,0 +1,236 @@
+"""Read HEAD and refs straight from a repository's files.
+
+Opening a GitPython Repo reads the repository's config and probes its layout,
+which adds up when a command looks at dozens of spaces. Finding the branch or
+commit a space is on only takes a few small files: ``.git/HEAD`` (or the HEAD
+of the worktree a ``.git`` file points to), a loose ref, or a line of
+``packed-refs``. These functions return None for anything they don't
+understand, and callers fall back to GitPython.
+"""
+
+from __future__ import annotations
+
+import re
+import struct
+from pathlib import Path
+
+HEADS_PREFIX = "refs/heads/"
+MAX_SYMREF_DEPTH = 5
+
+# Refs a linked worktree keeps in its own git directory rather than the common one
+_PER_WORKTREE_PREFIXES = ("refs/bisect/", "refs/worktree/", "refs/rewritten/")
+
+_SHA_RE = re.compile(r"[0-9a-f]{40}(?:[0-9a-f]{24})?")
+
+_SHA256_RE = re.compile(r"^\s*objectformat\s*=\s*sha256\s*$", re.IGNORECASE | re.MULTILINE)
+
+# An index entry's stat fields (ctime, mtime, dev, ino, mode, uid, gid, size)
+_INDEX_STAT = struct.Struct(">10I")
+_INDEX_EXTENDED = 0x4000
+_INDEX_SPARSE_DIR_MODE = 0o040000
+
+
+def _read_line(path: Path) -> str | None:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.readline().strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _parse_ref_value(value: str | None) -> tuple[str | None, str | None]:
+    """Split a HEAD or loose ref file into (symbolic ref, sha); both None if invalid."""
+    if value is None:
+        return None, None
+    if value.startswith("ref:"):
+        return value[4:].strip() or None, None
+    if _SHA_RE.fullmatch(value):
+        return None, value
+    return None, None
+
+
+def git_dir(worktree: str | Path) -> Path | None:
+    """Find a working tree's git directory.
+
+    Args:
+        worktree: The working tree.
+
+    Returns:
+        The ``.git`` directory, or the directory a ``.git`` file points to
+        (linked worktrees, submodules), or None if there isn't a usable one.
+    """
+    dot_git = Path(worktree) / ".git"
+    if dot_git.is_dir():
+        path = dot_git
+    else:
+        line = _read_line(dot_git)
+        if not line or not line.startswith("gitdir:"):
+            return None
+        path = Path(line[7:].strip())
+        if not path.is_absolute():
+            path = Path(worktree) / path
+
+    return path if (path / "HEAD").is_file() else None
+
+
+def common_dir(git_directory: Path) -> Path:
+    """Get the directory holding the shared refs of a (possibly linked) git directory.
+
+    Args:
+        git_directory: A git directory.
+
+    Returns:
+        The directory its ``commondir`` file names, or git_directory itself.
+    """
+    line = _read_line(git_directory / "commondir")
+    if not line:
+        return git_directory
+    path = Path(line)
+    return path if path.is_absolute() else git_directory / path
+
+
+def packed_refs(git_directory: Path) -> dict[str, str]:
+    """Read a repository's packed-refs file.
+
+    Args:
+        git_directory: The (common) git directory.
+
+    Returns:
+        A map of ref name to sha, empty if there is no packed-refs file.
+    """
+    refs = {}
+    try:
+        with open(git_directory / "packed-refs", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith(("#", "^")):
+                    continue
+                sha, _, name = line.strip().partition(" ")
+                if name and _SHA_RE.fullmatch(sha):
+                    refs[name] = sha
+    except (OSError, UnicodeDecodeError):
+        pass
+    return refs
+
+
+def resolve_ref(git_directory: Path, ref: str) -> str | None:
+    """Resolve a ref to the commit it points at, following symbolic refs.
+
+    Args:
+        git_directory: The git directory of the working tree.
+        ref: The full ref name, e.g. 'refs/heads/main' or 'HEAD'.
+
+    Returns:
+        The sha, or None if the ref doesn't exist or can't be read.
+    """
+    shared = common_dir(git_directory)
+
+    for _ in range(MAX_SYMREF_DEPTH):
+        per_worktree = ref == "HEAD" or ref.startswith(_PER_WORKTREE_PREFIXES)
+        ref_dir = git_directory if per_worktree else shared
+
+        target, sha = _parse_ref_value(_read_line(ref_dir / ref))
+        if sha:
+            return sha
+        if target is None:
+            return packed_refs(shared).get(ref)
+        ref = target
+    return None
+
+
+def read_head(git_directory: Path) -> tuple[str | None, str | None]:
+    """Read a git directory's HEAD.
+
+    Args:
+        git_directory: The git directory.
+
+    Returns:
+        (ref, None) when HEAD points at a ref such as 'refs/heads/main',
+        (None, sha) when it is detached, or (None, None) if it can't be read.
+    """
+    return _parse_ref_value(_read_line(git_directory / "HEAD"))
+
+
+def current_branch(worktree: str | Path) -> str | None:
+    """Get the branch a working tree has checked out.
+
+    Args:
+        worktree: The working tree.
+
+    Returns:
+        The branch name (which may not have any commits yet), "detached"
+        for a detached HEAD, or None if HEAD couldn't be read.
+    """
+    git_directory = git_dir(worktree)
+    if git_directory is None:
+        return None
+
+    target, sha = read_head(git_directory)
+    if sha:
+        return "detached"
+    if target and target.startswith(HEADS_PREFIX):
+        return target[len(HEADS_PREFIX) :]
+    return None
+
+
+def head_commit(worktree: str | Path) -> str | None:
+    """Get the commit a working tree's HEAD points at.
+
+    Args:
+        worktree: The working tree.
+
+    Returns:
+        The sha, or None if HEAD couldn't be resolved (e.g. no commits yet).
+    """
+    git_directory = git_dir(worktree)
+    if git_directory is None:
+        return None
+    return resolve_ref(git_directory, "HEAD")
+
+
+def index_paths(git_directory: Path) -> list[str] | None:
+    """List the paths a git directory's index tracks.
+
+    Reads index versions 2 and 3, which git writes unless told otherwise.
+
+    Args:
+        git_directory: A (possibly linked worktree's) git directory.
+
+    Returns:
+        The tracked paths relative to the working tree, in index order, or
+        None for version 4 and sparse indexes or an index that can't be read.
+    """
+    try:
+        data = (git_directory / "index").read_bytes()
+    except OSError:
+        return None
+    if len(data) < 12 or data[:4] != b"DIRC":
+        return None
+    version, count = struct.unpack_from(">II", data, 4)
+    if version not in (2, 3):
+        return None
+
+    try:
+        config = (common_dir(git_directory) / "config").read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        config = ""
+    hash_size = 32 if _SHA256_RE.search(config) else 20
+
+    paths = []
+    offset = 12
+    try:
+        for _ in range(count):
+            mode = _INDEX_STAT.unpack_from(data, offset)[6]
+            if mode == _INDEX_SPARSE_DIR_MODE:
+                return None
+            name_start = offset + _INDEX_STAT.size + hash_size
+            (flags,) = struct.unpack_from(">H", data, name_start)
+            name_start += 2
+            if flags & _INDEX_EXTENDED:
+                name_start += 2
+            name_end = data.index(b"\0", name_start)
+            paths.append(data[name_start:name_end].decode("utf-8", "surrogateescape"))
+            # Entries are NUL-padded to a multiple of 8 bytes
+            offset += (name_end - offset + 8) & ~7
+    except (struct.error, ValueError):
+        return None
+    return paths
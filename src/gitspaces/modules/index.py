@@ -0,0 +1,257 @@
+"""Persistent index of GitSpaces projects and their spaces.
+
+Scanning every configured project path for project markers costs a stat per
+child directory, which is slow on network home directories. The index in
+``~/.gitspaces/index.json`` remembers, per configured path, the projects found
+there and the mtimes of the directories listed to find them. A warm lookup
+costs a stat per listed directory instead of a listing plus a stat per entry;
+a path is rescanned only when one of those mtimes changes (i.e. entries were
+added or removed). Commands that change spaces (clone, rename, sleep, wake)
+refresh their project's entry explicitly.
+
+Every save also writes ``~/.gitspaces/completion.txt`` for the shell completion
+functions, which read it without starting Python: one line per space, holding
+the project path and the space name separated by a tab.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+from gitspaces.modules.config import Config
+from gitspaces.modules.discovery import Discovery, discover_projects
+from gitspaces.modules.project import Project
+
+INDEX_VERSION = 2
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class ProjectIndex:
+    """On-disk cache of where projects are and which spaces they have."""
+
+    FILENAME = "index.json"
+    COMPLETION_FILE = "completion.txt"
+
+    # Parsed index files, keyed by inode, mtime and size, so a long-running
+    # process (the daemon) only parses the file again after someone saves it
+    _parsed: dict[Path, tuple[tuple[int, int, int], dict[str, Any]]] = {}
+
+    def __init__(self, path: str | Path | None = None):
+        """Initialize a ProjectIndex.
+
+        Args:
+            path: The index file (default: index.json in the config directory).
+        """
+        self.path = Path(path) if path else Config.instance().config_dir / self.FILENAME
+        self._data: dict[str, Any] | None = None
+        self._dirty = False
+        self.scans: list[tuple[str, Discovery]] = []
+
+    @property
+    def completion_path(self) -> Path:
+        """Get the completion cache written next to the index."""
+        return self.path.with_name(self.COMPLETION_FILE)
+
+    @property
+    def data(self) -> dict[str, Any]:
+        """Get the index contents, loading them on first use."""
+        if self._data is None:
+            self._data = self._load()
+        return self._data
+
+    @staticmethod
+    def _file_key(path: Path) -> tuple[int, int, int]:
+        st = os.stat(path)
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _load(self) -> dict[str, Any]:
+        try:
+            key = self._file_key(self.path)
+            cached = self._parsed.get(self.path)
+            if cached and cached[0] == key:
+                return cached[1]
+
+            data = json.loads(self.path.read_text())
+            if data.get("version") == INDEX_VERSION:
+                data = dict(data)
+                self._parsed[self.path] = (key, data)
+                return data
+        except (OSError, ValueError, AttributeError):
+            pass
+        return {"version": INDEX_VERSION, "roots": {}, "projects": {}}
+
+    @classmethod
+    def clear_cache(cls):
+        """Forget parsed index files, e.g. between tests."""
+        cls._parsed.clear()
+
+    def save(self):
+        """Write the index if it changed, atomically replacing the old file."""
+        if not self._dirty:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.FILENAME}.{os.getpid()}")
+        tmp_path.write_text(json.dumps(self.data, indent=1, sort_keys=True))
+        os.replace(tmp_path, self.path)
+        self._parsed[self.path] = (self._file_key(self.path), self.data)
+        self._dirty = False
+        self.write_completions()
+
+    def write_completions(self):
+        """Write the completion cache from the recorded projects' spaces."""
+        lines = [
+            f"{project_path}\t{name}\n"
+            for project_path, entry in sorted(self.data["projects"].items())
+            for name in entry["spaces"]
+            if "\t" not in name and "\n" not in name
+        ]
+
+        path = self.completion_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{self.COMPLETION_FILE}.{os.getpid()}")
+        tmp_path.write_text("".join(lines))
+        os.replace(tmp_path, path)
+
+    def list_projects(
+        self,
+        project_paths: list[str],
+        max_depth: int | None = None,
+        exclude: list[str] | None = None,
+    ) -> list[Project]:
+        """List the projects in the configured project paths.
+
+        A path is served from the index while none of the directories listed
+        when it was scanned have changed; otherwise it is rescanned and the
+        index is saved. Rescans are recorded in ``scans``.
+
+        Args:
+            project_paths: The configured project paths.
+            max_depth: Directory levels to search (default: discovery_depth).
+            exclude: Directory globs to skip (default: discovery_exclude).
+
+        Returns:
+            The projects found, in configuration order.
+        """
+        config = Config.instance()
+        max_depth = config.discovery_depth if max_depth is None else max_depth
+        exclude = config.discovery_exclude if exclude is None else list(exclude)
+
+        roots = self.data["roots"]
+        projects: list[Project] = []
+
+        for project_path in project_paths:
+            entry = roots.get(project_path)
+            if not self._is_fresh(entry, max_depth, exclude):
+                root = Path(project_path).expanduser().resolve()
+                if not root.is_dir():
+                    roots.pop(project_path, None)
+                    continue
+
+                found = discover_projects(str(root), max_depth, exclude)
+                self.scans.append((project_path, found))
+                self._record_found((entry or {}).get("projects", []), found.projects)
+                entry = {
+                    "path": str(root),
+                    "depth": max_depth,
+                    "exclude": exclude,
+                    "dirs": found.dirs,
+                    "projects": found.projects,
+                }
+                roots[project_path] = entry
+                self._dirty = True
+
+            projects.extend(Project(p) for p in entry["projects"])
+
+        # Forget paths that are no longer configured
+        for stale in set(roots) - set(project_paths):
+            del roots[stale]
+            self._dirty = True
+
+        self.save()
+        return projects
+
+    @staticmethod
+    def _is_fresh(entry: dict[str, Any] | None, max_depth: int, exclude: list[str]) -> bool:
+        """Check whether a cached scan is still valid.
+
+        Adding or removing a directory changes its parent's mtime, so the
+        scan is valid while every directory it listed keeps its mtime.
+        """
+        if not entry or entry.get("depth") != max_depth or entry.get("exclude") != exclude:
+            return False
+        dirs = entry.get("dirs")
+        if not isinstance(dirs, dict) or not dirs:
+            return False
+        return all(_mtime_ns(Path(d)) == mtime for d, mtime in dirs.items())
+
+    def _record_found(self, previous: list[str], found: list[str]):
+        """Record the spaces of newly found projects and forget deleted ones."""
+        recorded = self.data["projects"]
+        for project_path in found:
+            if project_path not in recorded:
+                recorded[project_path] = self._project_entry(Project(project_path))
+        for project_path in set(previous) - set(found):
+            if not (Path(project_path) / Project.DOTFILE).exists():
+                recorded.pop(project_path, None)
+
+    @staticmethod
+    def _project_entry(project: Project) -> dict[str, Any]:
+        return {
+            "name": project.name,
+            "spaces": [s.name for s in project.spaces(refresh=True)],
+        }
+
+    def update_project(self, project: Project):
+        """Record a project and its current spaces, e.g. after a clone or rename.
+
+        Args:
+            project: The project that changed.
+        """
+        self.data["projects"][str(project.path)] = self._project_entry(project)
+
+        # Add a new project to the scan of the directory it was created in
+        parent = str(project.path.parent)
+        for entry in self.data["roots"].values():
+            dirs = entry.get("dirs", {})
+            if parent in dirs and str(project.path) not in entry["projects"]:
+                entry["projects"] = sorted(entry["projects"] + [str(project.path)])
+                dirs[parent] = _mtime_ns(project.path.parent)
+
+        self._dirty = True
+        self.save()
+
+    def spaces(self, project: Project) -> list[str] | None:
+        """Get a project's spaces as last recorded.
+
+        Args:
+            project: The project.
+
+        Returns:
+            The space names, or None if the project hasn't been recorded.
+        """
+        entry = self.data["projects"].get(str(project.path))
+        return list(entry["spaces"]) if entry else None
+
+
+def record_project(project: Project):
+    """Refresh a project's index entry, ignoring failures.
+
+    The index is only a cache, so a read-only or full config directory must
+    not fail the command that changed the project.
+
+    Args:
+        project: The project that changed.
+    """
+    try:
+        ProjectIndex().update_project(project)
+    except OSError:
+        pass
@@ -0,0 +1,101 @@
+"""Advisory file locks shared between gitspaces processes."""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from pathlib import Path
+from gitspaces.modules.errors import LockError
+
+
+class FileLock:
+    """An advisory lock on a file, usable as a context manager.
+
+    Uses fcntl.flock on POSIX and msvcrt.locking on Windows (where shared locks
+    are treated as exclusive). The lock file is created if needed and left in
+    place afterwards.
+    """
+
+    POLL_INTERVAL = 0.05
+
+    def __init__(self, path: str | Path, shared: bool = False, timeout: float | None = None):
+        """Initialize a FileLock.
+
+        Args:
+            path: The lock file.
+            shared: If True, take a shared (read) lock instead of an exclusive one.
+            timeout: Seconds to wait for the lock; None waits forever, 0 doesn't wait.
+        """
+        self.path = Path(path)
+        self.shared = shared
+        self.timeout = timeout
+        self._fd: int | None = None
+
+    def acquire(self) -> "FileLock":
+        """Acquire the lock.
+
+        Returns:
+            This lock.
+
+        Raises:
+            LockError: If the lock isn't available within the timeout.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(str(self.path), os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+
+        while True:
+            try:
+                self._lock(fd)
+                self._fd = fd
+                return self
+            except OSError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    os.close(fd)
+                    raise LockError(f"Timed out waiting for lock: {self.path}")
+                time.sleep(self.POLL_INTERVAL)
+
+    def release(self):
+        """Release the lock if it is held."""
+        if self._fd is None:
+            return
+        try:
+            self._unlock(self._fd)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    @property
+    def locked(self) -> bool:
+        """Check if this lock is currently held."""
+        return self._fd is not None
+
+    def _lock(self, fd: int):
+        if sys.platform == "win32":
+            import msvcrt
+
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+
+            mode = fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
+            fcntl.flock(fd, mode | fcntl.LOCK_NB)
+
+    def _unlock(self, fd: int):
+        if sys.platform == "win32":
+            import msvcrt
+
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def __enter__(self) -> "FileLock":
+        return self.acquire()
+
+    def __exit__(self, *exc_info):
+        self.release()
@@ -0,0 +1,133 @@
+"""Local mirror cache for repositories cloned more than once.
+
+Mirrors live in ``~/.gitspaces/mirrors/<hash-of-url>`` as bare ``--mirror``
+clones. When a URL has a mirror (or the ``mirror_cache`` setting is on), clone
+refreshes the mirror and uses it as a ``--reference``/``--dissociate`` source,
+so only objects the mirror lacks come over the network and the new project
+doesn't depend on the mirror afterwards.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Iterator
+from gitspaces.modules.config import Config
+from gitspaces.modules.lock import FileLock
+from gitspaces.modules import runshell
+
+# Mirror updates are network bound; don't open more connections than this at once
+MAX_PARALLEL_UPDATES = 8
+
+
+def mirrors_dir() -> Path:
+    """Get the directory holding all mirrors.
+
+    Returns:
+        The path to ~/.gitspaces/mirrors.
+    """
+    return Config.instance().config_dir / "mirrors"
+
+
+def mirror_path(url: str) -> Path:
+    """Get where the mirror for a URL is (or would be) stored.
+
+    Args:
+        url: The git repository URL.
+
+    Returns:
+        The mirror's path.
+    """
+    digest = hashlib.sha256(url.rstrip("/").encode("utf-8")).hexdigest()[:16]
+    return mirrors_dir() / digest
+
+
+def has_mirror(url: str) -> bool:
+    """Check if a URL has a mirror.
+
+    Args:
+        url: The git repository URL.
+
+    Returns:
+        True if the mirror exists.
+    """
+    return (mirror_path(url) / "HEAD").exists()
+
+
+def _lock(path: Path) -> FileLock:
+    return FileLock(path.with_name(f"{path.name}.lock"))
+
+
+def ensure_mirror(url: str) -> Path:
+    """Create the mirror for a URL, or bring an existing one up to date.
+
+    Args:
+        url: The git repository URL.
+
+    Returns:
+        The mirror's path.
+    """
+    path = mirror_path(url)
+    with _lock(path):
+        if (path / "HEAD").exists():
+            runshell.git.update_mirror(path)
+        else:
+            runshell.git.clone_mirror(url, path)
+    return path
+
+
+def reference_for(url: str) -> Path | None:
+    """Get a fresh mirror to clone a URL from, if mirrors are in use for it.
+
+    Args:
+        url: The git repository URL.
+
+    Returns:
+        The mirror's path, or None if the URL isn't mirrored.
+    """
+    if not (Config.instance().mirror_cache or has_mirror(url)):
+        return None
+    return ensure_mirror(url)
+
+
+def list_mirrors() -> list[tuple[str, Path]]:
+    """List the cached mirrors.
+
+    Returns:
+        (url, path) pairs, sorted by URL.
+    """
+    if not mirrors_dir().is_dir():
+        return []
+
+    mirrors = []
+    for path in mirrors_dir().iterdir():
+        if path.is_dir() and (path / "HEAD").exists():
+            url = runshell.git.get_remote_url(path)
+            if url:
+                mirrors.append((url, path))
+    return sorted(mirrors)
+
+
+def update_all() -> Iterator[tuple[str, Exception | None]]:
+    """Refresh every mirror concurrently.
+
+    Yields:
+        (url, error) pairs as each update finishes; error is None on success.
+    """
+    mirrors = list_mirrors()
+    if not mirrors:
+        return
+
+    def _update(url: str, path: Path) -> tuple[str, Exception | None]:
+        try:
+            with _lock(path):
+                runshell.git.update_mirror(path)
+        except Exception as e:
+            return url, e
+        return url, None
+
+    with ThreadPoolExecutor(max_workers=min(len(mirrors), MAX_PARALLEL_UPDATES)) as pool:
+        futures = [pool.submit(_update, url, path) for url, path in mirrors]
+        for future in as_completed(futures):
+            yield future.result()
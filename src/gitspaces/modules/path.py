@@ -5,6 +5,10 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
+# Set by the shell wrappers to their own PID, so the target is written where the
+# wrapper looks for it even when gitspaces runs as a grandchild or in the daemon
+SHELL_PID_ENV = "GITSPACES_SHELL_PID"
+
 
 def ensure_dir(path: str | Path) -> Path:
     """Ensure a directory exists, creating it if necessary.
@@ -54,10 +58,11 @@ def shell_targets_dir() -> Path:
 
 
 def write_shell_target(target_path: str | Path) -> bool:
-    """Write the shell target file for the current process.
+    """Write the shell target file for the calling shell.
 
     This writes the target path to ~/.gitspaces/pid-{PID} so that
-    the shell wrapper can read it and cd to that directory.
+    the shell wrapper can read it and cd to that directory. PID is the
+    shell's PID from GITSPACES_SHELL_PID, or this process's PID if unset.
 
     Args:
         target_path: The path that the shell should cd to.
@@ -69,7 +74,7 @@ def write_shell_target(target_path: str | Path) -> bool:
         targets_dir = shell_targets_dir()
         targets_dir.mkdir(parents=True, exist_ok=True)
 
-        pid = os.getpid()
+        pid = os.environ.get(SHELL_PID_ENV) or os.getpid()
         pid_file = targets_dir / f"pid-{pid}"
         pid_file.write_text(str(target_path))
         return True
@@ -0,0 +1,99 @@
+"""Gitignore-style path filters for copying spaces."""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable
+
+
+def _compile(pattern: str) -> tuple[re.Pattern[str], bool]:
+    """Compile a gitignore-style pattern into a regex over relative paths.
+
+    Args:
+        pattern: The pattern, e.g. "node_modules/", "*.o", "/build" or "docs/**/*.tmp".
+
+    Returns:
+        The compiled regex and whether the pattern only matches directories.
+    """
+    dir_only = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+
+    # Patterns with a slash (other than a trailing one) are relative to the space root;
+    # others match a name at any depth
+    anchored = "/" in pattern
+    pattern = pattern.lstrip("/")
+
+    regex = ""
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            regex += "(?:.*/)?"
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == len(pattern):
+            regex += "/.*"
+            i += 3
+        elif pattern[i] == "*":
+            regex += "[^/]*"
+            i += 1
+        elif pattern[i] == "?":
+            regex += "[^/]"
+            i += 1
+        elif pattern[i] == "[" and "]" in pattern[i + 1 :]:
+            end = pattern.index("]", i + 1)
+            regex += "[" + pattern[i + 1 : end].replace("!", "^", 1) + "]"
+            i = end + 1
+        else:
+            regex += re.escape(pattern[i])
+            i += 1
+
+    prefix = "" if anchored else "(?:.*/)?"
+    return re.compile(f"{prefix}{regex}"), dir_only
+
+
+class PathFilter:
+    """Decides which paths to skip while copying a space.
+
+    Called with a path relative to the space root (using "/" separators) and
+    whether it is a directory; returns True if the path should be skipped.
+    Include patterns re-include paths an exclude pattern matched, and ``.git``
+    is never skipped.
+    """
+
+    def __init__(
+        self,
+        exclude: Iterable[str] = (),
+        include: Iterable[str] = (),
+        skip_paths: Iterable[str] = (),
+    ):
+        """Initialize a PathFilter.
+
+        Args:
+            exclude: Gitignore-style patterns to skip.
+            include: Gitignore-style patterns to copy even if excluded.
+            skip_paths: Exact relative paths to skip (directories end with "/"),
+                e.g. the output of ``git ls-files --ignored --directory``.
+        """
+        self._exclude = [_compile(p) for p in self._clean(exclude)]
+        self._include = [_compile(p) for p in self._clean(include)]
+        self._skip_paths = set(skip_paths)
+
+    @staticmethod
+    def _clean(patterns: Iterable[str]) -> list[str]:
+        return [p.strip() for p in patterns if p.strip() and not p.strip().startswith("#")]
+
+    @staticmethod
+    def _matches(rules: list[tuple[re.Pattern[str], bool]], rel_path: str, is_dir: bool) -> bool:
+        return any(
+            (is_dir or not dir_only) and regex.fullmatch(rel_path) for regex, dir_only in rules
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self._exclude or self._skip_paths)
+
+    def __call__(self, rel_path: str, is_dir: bool) -> bool:
+        if rel_path == ".git" or rel_path.startswith(".git/"):
+            return False
+
+        key = f"{rel_path}/" if is_dir else rel_path
+        skipped = key in self._skip_paths or self._matches(self._exclude, rel_path, is_dir)
+        return skipped and not self._matches(self._include, rel_path, is_dir)
@@ -0,0 +1,234 @@
+"""Sleeper pool replenishment for GitSpaces.
+
+A project can ask to keep a number of sleepers ready in ``.zzz`` (its pool
+target). When waking a space drops the pool below the target, a detached
+worker process duplicates new sleepers so the interactive command can return
+immediately. The worker holds ``.zzz/.pool.lock`` while it runs, and the
+project's shared lock while it copies, and reports progress in
+``.zzz/.pool-status``.
+
+Run a worker directly with ``python -m gitspaces.modules.pool <project-path>``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from typing import Any
+from gitspaces.modules.errors import LockError
+from gitspaces.modules.lock import FileLock
+from gitspaces.modules.project import Project
+from gitspaces.modules.space import Space
+from gitspaces.modules import index, runshell
+
+LOCK_FILE = ".pool.lock"
+STATUS_FILE = ".pool-status"
+
+
+def get_target(project: Project) -> int:
+    """Get the number of sleepers a project wants to keep ready.
+
+    Args:
+        project: The project.
+
+    Returns:
+        The pool target (0 when the project doesn't use a pool).
+    """
+    try:
+        return max(0, int(project.settings.get("pool_target", 0)))
+    except (TypeError, ValueError):
+        return 0
+
+
+def set_target(project: Project, target: int):
+    """Set and save the number of sleepers a project wants to keep ready.
+
+    Args:
+        project: The project.
+        target: The pool target (0 disables replenishment).
+    """
+    project.settings["pool_target"] = max(0, target)
+    project.save_settings()
+
+
+def count_sleepers(project: Project) -> int:
+    """Count the project's sleeping spaces.
+
+    Args:
+        project: The project.
+
+    Returns:
+        The number of sleepers in .zzz.
+    """
+    # Other processes wake and create sleepers, so never trust a remembered list
+    return len(project.spaces(sleeping=True, refresh=True))
+
+
+def read_status(project: Project) -> dict[str, Any]:
+    """Read the last status written by a pool worker.
+
+    Args:
+        project: The project.
+
+    Returns:
+        The status dictionary, empty if no worker has run.
+    """
+    try:
+        return dict(json.loads((project.zzz_dir / STATUS_FILE).read_text()))
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_status(project: Project, **status: Any):
+    """Atomically replace the pool status file.
+
+    Args:
+        project: The project.
+        **status: The status fields.
+    """
+    status_file = project.zzz_dir / STATUS_FILE
+    tmp_file = status_file.with_name(f"{STATUS_FILE}.{os.getpid()}")
+    tmp_file.write_text(json.dumps(status, indent=2))
+    os.replace(tmp_file, status_file)
+
+
+def is_running(project: Project) -> bool:
+    """Check if a pool worker currently holds the project's pool lock.
+
+    Args:
+        project: The project.
+
+    Returns:
+        True if a worker is running.
+    """
+    try:
+        with FileLock(project.zzz_dir / LOCK_FILE, timeout=0):
+            return False
+    except LockError:
+        return True
+
+
+def replenish_in_background(project: Project) -> bool:
+    """Start a detached worker if the project's pool is below its target.
+
+    Args:
+        project: The project.
+
+    Returns:
+        True if a worker was started.
+    """
+    target = get_target(project)
+    if target <= 0 or count_sleepers(project) >= target or is_running(project):
+        return False
+
+    runshell.subprocess.spawn_detached(
+        [sys.executable, "-m", "gitspaces.modules.pool", str(project.path)]
+    )
+    return True
+
+
+def _pick_source(project: Project) -> Space | None:
+    """Pick the space to duplicate new sleepers from.
+
+    Sleepers are preferred since nobody is editing them; otherwise the first
+    active space is used.
+
+    Args:
+        project: The project.
+
+    Returns:
+        The source space, or None if the project has no spaces.
+    """
+    spaces = project.spaces(refresh=True)
+    candidates = [s for s in spaces if s.sleeping] or spaces
+    if not candidates:
+        return None
+    return Space(project, candidates[0].path)
+
+
+def replenish(project: Project) -> int:
+    """Duplicate sleepers until the project's pool reaches its target.
+
+    Returns immediately if another worker already holds the pool lock.
+
+    Args:
+        project: The project.
+
+    Returns:
+        The number of sleepers created.
+    """
+    try:
+        lock = FileLock(project.zzz_dir / LOCK_FILE, timeout=0).acquire()
+    except LockError:
+        return 0
+
+    target = get_target(project)
+    status: dict[str, Any] = {
+        "state": "running",
+        "pid": os.getpid(),
+        "started": time.time(),
+        "target": target,
+        "created": 0,
+    }
+    try:
+        missing = target - count_sleepers(project)
+        if missing > 0:
+            _write_status(project, sleepers=count_sleepers(project), **status)
+
+            def _progress(done, total, space):
+                status["created"] = done
+                _write_status(project, sleepers=count_sleepers(project), **status)
+
+            # The shared lock keeps the source from being woken, slept or
+            # renamed mid-copy, as it does for extend
+            with project.lock(shared=True):
+                source = _pick_source(project)
+                if source is None:
+                    raise RuntimeError("No space to duplicate from")
+                project.create_sleepers(source, missing, on_progress=_progress)
+                index.record_project(project)
+
+        status["state"] = "idle"
+    except Exception as e:
+        # A failed batch is rolled back entirely
+        status["state"] = "failed"
+        status["created"] = 0
+        status["error"] = str(e)
+    finally:
+        status["finished"] = time.time()
+        _write_status(project, sleepers=count_sleepers(project), **status)
+        lock.release()
+
+    return int(status["created"])
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for the detached pool worker.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:]); the project path.
+
+    Returns:
+        The process exit code.
+    """
+    from gitspaces.modules.config import init_config
+
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        print("usage: python -m gitspaces.modules.pool <project-path>", file=sys.stderr)
+        return 2
+
+    project = Project(argv[0])
+    if not project.exists():
+        print(f"Not a GitSpaces project: {argv[0]}", file=sys.stderr)
+        return 1
+
+    init_config()
+    replenish(project)
+    return 0 if read_status(project).get("state") != "failed" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,12 +3,32 @@
 from __future__ import annotations
 
 import glob
+import hashlib
 import os
 import shutil
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
-from git import Repo
-from gitspaces.modules.errors import ProjectError
+from typing import TYPE_CHECKING, Any, Callable, Iterator, NamedTuple
+from gitspaces.modules.config import Config
+from gitspaces.modules.errors import LockError, ProjectError, SpaceError
+from gitspaces.modules.lock import FileLock
 from gitspaces.modules.path import ensure_dir
+from gitspaces.modules.pathfilter import PathFilter
+from gitspaces.modules import runshell
+
+if TYPE_CHECKING:
+    from gitspaces.modules.space import Space
+
+
+class SpaceEntry(NamedTuple):
+    """A space found in a project directory."""
+
+    name: str  # relative to the project, e.g. 'main' or '.zzz/zzz-0'
+    path: Path
+    sleeping: bool
+    inode: int
+    mtime_ns: int
 
 
 class Project:
@@ -16,6 +36,25 @@ class Project:
 
     DOTFILE = "__GITSPACES_PROJECT__"
     ZZZ_DIR = ".zzz"
+    STORE_DIR = ".store.git"
+    STAGING_PREFIX = ".staging-"
+    SLOTS_FILE = ".sleeper-slot"
+    SLOTS_LOCK_FILE = ".sleeper-slot.lock"
+    LOCK_FILE = ".project.lock"
+    STATUS_CACHE_FILE = ".status-cache.json"
+
+    # Upper bound on spaces duplicated at once; each copy is itself multi-threaded
+    MAX_PARALLEL_DUPLICATES = 4
+
+    # Space layouts: full clones, or worktrees of the store repository
+    MODE_CLONE = "clone"
+    MODE_WORKTREE = "worktree"
+
+    # locate() results: path -> (project root, space name), or None outside projects
+    _locations: dict[str, tuple[str, str | None] | None] = {}
+
+    # Project locks held by this process: project path -> [lock, nesting depth]
+    _held_locks: dict[str, list[Any]] = {}
 
     def __init__(self, path: str):
         """Initialize a Project.
@@ -28,15 +67,32 @@ class Project:
         self.code_ws_dir = self.path / ".vscode"
         self.dotfile = self.path / self.DOTFILE
         self.zzz_dir = self.path / self.ZZZ_DIR
+        self.store_dir = self.path / self.STORE_DIR
+        self._settings: dict[str, Any] | None = None
+        self._spaces: list[SpaceEntry] | None = None
 
     @classmethod
-    def create_project(cls, directory: str, url: str, num_spaces: int = 1) -> "Project":
+    def create_project(
+        cls,
+        directory: str,
+        url: str,
+        num_spaces: int = 1,
+        worktrees: bool = False,
+        clone_options: dict[str, Any] | None = None,
+        reference: str | Path | None = None,
+    ) -> "Project":
         """Create a new GitSpaces project.
 
         Args:
             directory: The directory where the project will be created.
             url: The git repository URL.
             num_spaces: The number of spaces to create.
+            worktrees: If True, clone once into the store and make every space a
+                git worktree of it instead of a full copy.
+            clone_options: Partial/shallow clone options (filter, depth,
+                single_branch) for the clone. Spaces keep them in their git
+                config, and duplicates copy that config.
+            reference: Optional local mirror to borrow objects from while cloning.
 
         Returns:
             The created Project instance.
@@ -54,12 +110,31 @@ class Project:
         project = cls(str(project_path))
         project._init()
 
-        # Create first space from URL
-        first_space = Space.create_space_from_url(project, url, project._get_empty_sleeper_path())
+        clone_options = {k: v for k, v in (clone_options or {}).items() if v}
+        if worktrees:
+            project.settings["mode"] = cls.MODE_WORKTREE
+        if project.settings:
+            project.save_settings()
+
+        # The mirror only speeds up this clone; it isn't a project setting
+        if reference:
+            clone_options["reference"] = reference
+
+        if worktrees:
+            # Clone once into the store; spaces are checkouts of it
+            runshell.git.clone(url, project.store_dir, bare=True, **clone_options)
+            first_space = Space.create_space_from_store(project, project._allocate_sleeper_path())
+        else:
+            # Create first space from URL and move its history into the shared store,
+            # so duplicates only copy the checkout
+            first_space = Space.create_space_from_url(
+                project, url, project._allocate_sleeper_path(), **clone_options
+            )
+            project.share_objects(first_space.path)
 
         # Duplicate for additional spaces
-        for _ in range(1, num_spaces):
-            first_space.duplicate()
+        if num_spaces > 1:
+            project.create_sleepers(first_space, num_spaces - 1)
 
         return project
 
@@ -87,43 +162,448 @@ class Project:
         ensure_dir(self.zzz_dir)
         self.dotfile.touch()
 
-    def _get_empty_sleeper_path(self) -> Path | None:
-        """Get the path for a new sleeper space.
+    @contextmanager
+    def lock(self, shared: bool = False, timeout: float | None = None) -> Iterator[None]:
+        """Hold the project's advisory lock.
+
+        Commands that change spaces or settings take the exclusive lock; commands
+        that only read take the shared lock, so they can run side by side. The
+        lock is reentrant within a process: nesting inside a held lock is free,
+        but a shared lock can't be upgraded to an exclusive one.
+
+        Args:
+            shared: If True, take the lock shared instead of exclusive.
+            timeout: Seconds to wait for another command (default: lock_timeout
+                from the configuration).
+
+        Raises:
+            LockError: If the lock isn't available within the timeout, or an
+                exclusive lock is requested while only a shared one is held.
+        """
+        key = str(self.path)
+        held = self._held_locks.get(key)
+        if held:
+            if held[0].shared and not shared:
+                raise LockError(f"Can't upgrade the shared lock on project '{self.name}'")
+            held[1] += 1
+            try:
+                yield
+            finally:
+                held[1] -= 1
+            return
+
+        if timeout is None:
+            timeout = Config.instance().lock_timeout
+        lock = FileLock(self.path / self.LOCK_FILE, shared=shared, timeout=timeout)
+        try:
+            lock.acquire()
+        except LockError:
+            raise LockError(
+                f"Project '{self.name}' is in use by another gitspaces command "
+                f"(waited {timeout:g}s)"
+            ) from None
+
+        self._held_locks[key] = [lock, 1]
+        try:
+            yield
+        finally:
+            del self._held_locks[key]
+            lock.release()
+
+    @property
+    def settings(self) -> dict[str, Any]:
+        """Get the project's settings, stored as YAML in the project dotfile.
 
         Returns:
-            The path for the new sleeper space.
+            The settings dictionary (empty for projects without settings).
         """
-        from itertools import count
+        if self._settings is None:
+            # Parse before publishing, so threads duplicating spaces never see
+            # a half-loaded (empty) dict and take the wrong mode
+            settings: dict[str, Any] = {}
+            if self.dotfile.exists():
+                import yaml
 
-        for i in count():
-            sleeper_path = self.zzz_dir / f"zzz-{i}"
-            if not sleeper_path.exists():
-                return sleeper_path
+                settings = yaml.safe_load(self.dotfile.read_text()) or {}
+            self._settings = settings
+        return self._settings
 
-        return None
+    def save_settings(self):
+        """Write the project's settings to the project dotfile."""
+        import yaml
 
-    def list_spaces(self) -> list[str]:
-        """List all spaces in the project.
+        self.dotfile.write_text(yaml.safe_dump(self.settings, default_flow_style=False))
+
+    @property
+    def mode(self) -> str:
+        """Get the project's space layout (MODE_CLONE or MODE_WORKTREE)."""
+        return str(self.settings.get("mode", self.MODE_CLONE))
+
+    def copy_filter(self, space_path: str | Path) -> PathFilter | None:
+        """Build the filter that decides what to skip when duplicating a space.
+
+        Uses the project's ``exclude`` and ``include`` patterns and, when
+        ``exclude_ignored`` is set, everything git ignores in the space.
+
+        Args:
+            space_path: The space being duplicated.
+
+        Returns:
+            The filter, or None if nothing is excluded.
+        """
+        skip_paths = []
+        if self.settings.get("exclude_ignored"):
+            skip_paths = runshell.git.list_ignored(space_path)
+
+        path_filter = PathFilter(
+            exclude=self.settings.get("exclude", []),
+            include=self.settings.get("include", []),
+            skip_paths=skip_paths,
+        )
+        return path_filter if path_filter else None
+
+    def has_store(self) -> bool:
+        """Check if the project has a shared object store.
+
+        Returns:
+            True if the store repository exists.
+        """
+        return (self.store_dir / "objects").is_dir()
+
+    def _init_store(self):
+        """Create the shared object store if it doesn't exist yet."""
+        if not self.has_store():
+            runshell.git.init_bare(self.store_dir)
+
+    def share_objects(self, space_path: str | Path) -> int:
+        """Move a space's git objects into the project's shared object store.
+
+        The space keeps access to them through ``objects/info/alternates`` (see
+        link_store). Objects the store already has (same pack or loose object
+        name) are deleted from the space instead of moved. The space's refs are
+        then fetched into the store under ``refs/spaces/``, so the store can
+        tell the shared history is in use and ``git gc`` there keeps it. Spaces
+        without a ``.git`` directory (e.g. worktrees) are left alone.
+
+        Args:
+            space_path: The path to the space.
+
+        Returns:
+            The number of bytes freed by deleting objects the store already had.
+
+        Raises:
+            GitSpacesError: If the space's refs couldn't be fetched into the store.
+        """
+        objects_dir = Path(space_path) / ".git" / "objects"
+        if not objects_dir.is_dir():
+            return 0
+
+        self._init_store()
+        store_objects = self.store_dir / "objects"
+
+        # Point at the store before moving anything, so every object stays reachable
+        self.link_store(space_path)
+
+        reclaimed = 0
+        for rel_path in self._object_files(objects_dir):
+            src = objects_dir / rel_path
+            dst = store_objects / rel_path
+            if dst.exists():
+                reclaimed += src.stat().st_size
+                src.unlink()
+            else:
+                ensure_dir(dst.parent)
+                os.replace(src, dst)
+
+        # The store has every object by now, so this only writes refs. Keyed by
+        # the space's place in the project, so sharing it again replaces them.
+        relative = Path(space_path).resolve().relative_to(self.path.resolve()).as_posix()
+        key = hashlib.sha1(relative.encode(), usedforsecurity=False).hexdigest()[:12]
+        runshell.git.fetch_refs(self.store_dir, space_path, f"refs/spaces/{key}/")
+
+        return reclaimed
+
+    def link_store(self, space_path: str | Path, create: bool = True) -> bool:
+        """Point a space's ``objects/info/alternates`` at the store, relative to the space.
+
+        A relative path keeps working when the whole project directory is
+        moved; moving a space within the project (sleep, wake, rename,
+        duplicate) calls this again to match its new depth. Entries from older
+        versions that name the store by absolute path are replaced.
+
+        Args:
+            space_path: The path to the space.
+            create: Add the store to spaces that don't use it yet. If False,
+                only spaces that already use it are updated.
+
+        Returns:
+            True if the alternates file was changed.
+        """
+        objects_dir = Path(space_path) / ".git" / "objects"
+        alternates = objects_dir / "info" / "alternates"
+        try:
+            existing = alternates.read_text().splitlines()
+        except FileNotFoundError:
+            existing = []
+
+        others = [e for e in existing if Path(e).parts[-2:] != (self.STORE_DIR, "objects")]
+        if not create and len(others) == len(existing):
+            return False
+
+        entry = os.path.relpath((self.store_dir / "objects").resolve(), objects_dir.resolve())
+        lines = others + [entry]
+        if lines == existing:
+            return False
+        ensure_dir(alternates.parent)
+        alternates.write_text("\n".join(lines) + "\n")
+        return True
+
+    @staticmethod
+    def _object_files(objects_dir: Path) -> list[Path]:
+        """List the object and pack files in an objects directory.
+
+        Pack indexes are ordered after their packs so a pack is never visible
+        through an index without its data.
+
+        Args:
+            objects_dir: The repository's objects directory.
 
         Returns:
-            List of space directory names.
+            Paths relative to objects_dir.
         """
-        # List active spaces (top-level directories, excluding special ones)
-        spaces = [
-            item.name
-            for item in self.path.iterdir()
-            if item.is_dir()
-            and item.name not in {self.ZZZ_DIR, ".vscode", self.DOTFILE}
-            and not item.name.startswith(".")
-        ]
+        files: list[Path] = []
+        for subdir in sorted(objects_dir.iterdir()):
+            if not subdir.is_dir() or subdir.name == "info":
+                continue
+            files.extend(
+                item.relative_to(objects_dir)
+                for item in subdir.iterdir()
+                if item.is_file() and not item.name.startswith("tmp_")
+            )
+
+        return sorted(files, key=lambda p: (p.suffix == ".idx", str(p)))
+
+    def create_sleepers(
+        self,
+        source: Space,
+        count: int,
+        on_progress: Callable[[int, int, Space], None] | None = None,
+    ) -> list[Space]:
+        """Duplicate a space into several new sleepers concurrently.
+
+        Sleeper slots are reserved up front in one allocation, so the concurrent
+        copies (and other commands) never race for the same slot. If any copy
+        fails, the sleepers created by this call are removed again, so a batch
+        either fully succeeds or leaves nothing behind.
 
-        # List sleeping spaces
-        if self.zzz_dir.exists():
-            spaces.extend(
-                f"{self.ZZZ_DIR}/{item.name}" for item in self.zzz_dir.iterdir() if item.is_dir()
+        Args:
+            source: The space to duplicate.
+            count: The number of sleepers to create.
+            on_progress: Called as (completed, count, space) after each copy finishes.
+
+        Returns:
+            The new sleeper spaces, in slot order.
+
+        Raises:
+            SpaceError: If any copy failed.
+        """
+        paths = self._allocate_sleeper_paths(count)
+        created: list[Space] = []
+        errors: list[Exception] = []
+
+        executor = ThreadPoolExecutor(max_workers=min(count, self.MAX_PARALLEL_DUPLICATES))
+        futures = [executor.submit(source.duplicate, path) for path in paths]
+        try:
+            for future in as_completed(futures):
+                try:
+                    space = future.result()
+                except Exception as e:
+                    errors.append(e)
+                    continue
+                created.append(space)
+                if on_progress:
+                    on_progress(len(created), count, space)
+        except BaseException:
+            # Interrupted: let running copies finish, then discard the whole batch
+            executor.shutdown(wait=True, cancel_futures=True)
+            self._discard_sleepers(futures)
+            raise
+        executor.shutdown(wait=True)
+
+        if errors:
+            self._discard_sleepers(futures)
+            raise SpaceError(
+                f"{len(errors)} of {count} copies failed, removed the rest: {errors[0]}"
             )
 
-        return sorted(spaces)
+        return sorted(created, key=lambda space: paths.index(space.path))
+
+    @staticmethod
+    def _discard_sleepers(futures: list[Future]):
+        """Remove the sleepers created by finished duplicate() futures.
+
+        Args:
+            futures: Futures returning Space instances.
+        """
+        for future in futures:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                space = future.result()
+                if space.path.exists():
+                    space.remove()
+
+    @classmethod
+    def staging_path_for(cls, sleeper_path: str | Path) -> Path:
+        """Get the hidden directory a sleeper is built in before it's renamed into place.
+
+        The name records this process's ID, so sweep_staging can tell abandoned
+        staging directories from ones still being written.
+
+        Args:
+            sleeper_path: The sleeper's final path.
+
+        Returns:
+            The staging path, next to the final path in .zzz.
+        """
+        sleeper_path = Path(sleeper_path)
+        return sleeper_path.with_name(f"{cls.STAGING_PREFIX}{os.getpid()}-{sleeper_path.name}")
+
+    def sweep_staging(self) -> list[Path]:
+        """Remove staging directories left behind by interrupted duplications.
+
+        Directories whose creating process is still running are kept.
+
+        Returns:
+            The staging directories that were removed.
+        """
+        from gitspaces.modules.space import Space
+
+        if not self.zzz_dir.is_dir():
+            return []
+
+        removed = []
+        for item in self.zzz_dir.iterdir():
+            if not (item.is_dir() and item.name.startswith(self.STAGING_PREFIX)):
+                continue
+            pid = item.name[len(self.STAGING_PREFIX) :].split("-", 1)[0]
+            if pid.isdigit() and runshell.subprocess.pid_alive(int(pid)):
+                continue
+            Space(self, item).remove()
+            removed.append(item)
+
+        return removed
+
+    def _allocate_sleeper_paths(self, count: int) -> list[Path]:
+        """Reserve paths for new sleeper spaces.
+
+        Slot numbers come from a counter file in the project directory that is
+        read and advanced under a lock, so concurrent commands never get the same slot and no
+        slot is probed twice. Slots are not reused after their sleeper wakes.
+
+        Args:
+            count: The number of paths needed.
+
+        Returns:
+            The reserved sleeper paths.
+        """
+        with FileLock(self.path / self.SLOTS_LOCK_FILE):
+            counter_file = self.path / self.SLOTS_FILE
+            try:
+                next_slot = int(counter_file.read_text())
+            except (OSError, ValueError):
+                next_slot = self._first_free_slot()
+
+            paths: list[Path] = []
+            while len(paths) < count:
+                sleeper_path = self.zzz_dir / f"zzz-{next_slot}"
+                next_slot += 1
+                # Only a slot created by hand or an older gitspaces can be taken
+                if not sleeper_path.exists():
+                    paths.append(sleeper_path)
+
+            counter_file.write_text(str(next_slot))
+
+        return paths
+
+    def _first_free_slot(self) -> int:
+        """Get the slot after the highest one in use, to start a missing counter."""
+        highest = -1
+        try:
+            with os.scandir(self.zzz_dir) as entries:
+                for entry in entries:
+                    prefix, _, number = entry.name.partition("zzz-")
+                    if number.isdigit() and (not prefix or prefix.startswith(self.STAGING_PREFIX)):
+                        highest = max(highest, int(number))
+        except FileNotFoundError:
+            pass
+        return highest + 1
+
+    def _allocate_sleeper_path(self) -> Path:
+        """Reserve the path for a new sleeper space.
+
+        Returns:
+            The reserved sleeper path.
+        """
+        return self._allocate_sleeper_paths(1)[0]
+
+    def spaces(self, sleeping: bool | None = None, refresh: bool = False) -> list[SpaceEntry]:
+        """Enumerate the project's spaces.
+
+        The project directory and ``.zzz`` are each listed once with
+        ``os.scandir``, whose directory-entry types save a stat per entry. The
+        result is remembered until a space is created, moved or removed through
+        this project (see ``invalidate_spaces``) or ``refresh`` is set.
+
+        Args:
+            sleeping: Only return sleeping (True) or active (False) spaces.
+            refresh: Rescan even if a result is remembered.
+
+        Returns:
+            The spaces, sorted by name.
+        """
+        if self._spaces is None or refresh:
+            # Hidden entries are .zzz, .vscode, the store, staging directories
+            # and bookkeeping files; the project dotfile isn't a directory
+            entries = self._scan_spaces(self.path, "", sleeping=False)
+            entries.extend(self._scan_spaces(self.zzz_dir, f"{self.ZZZ_DIR}/", sleeping=True))
+            self._spaces = sorted(entries)
+
+        if sleeping is None:
+            return list(self._spaces)
+        return [entry for entry in self._spaces if entry.sleeping == sleeping]
+
+    @staticmethod
+    def _scan_spaces(directory: Path, prefix: str, sleeping: bool) -> list[SpaceEntry]:
+        entries = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.name.startswith(".") or not entry.is_dir():
+                        continue
+                    st = entry.stat()
+                    entries.append(
+                        SpaceEntry(
+                            f"{prefix}{entry.name}",
+                            directory / entry.name,
+                            sleeping,
+                            st.st_ino,
+                            st.st_mtime_ns,
+                        )
+                    )
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def invalidate_spaces(self):
+        """Forget the remembered space list after spaces change."""
+        self._spaces = None
+
+    def list_spaces(self) -> list[str]:
+        """List all spaces in the project.
+
+        Returns:
+            List of space names, sleeping ones prefixed with '.zzz/'.
+        """
+        return [entry.name for entry in self.spaces(refresh=True)]
 
     def exists(self) -> bool:
         """Check if the project exists.
@@ -143,12 +623,57 @@ class Project:
         Returns:
             The Project instance if found, None otherwise.
         """
-        current = Path(path).resolve()
+        return cls.locate(path)[0]
 
+    @classmethod
+    def locate(cls, path: str | Path) -> tuple[Project | None, str | None]:
+        """Find the project and space containing a path, e.g. the cwd.
+
+        The space is the path component directly below the project root (or
+        below ``.zzz`` for sleepers), so the cost doesn't depend on how many
+        spaces the project has. Results are cached for the process; each call
+        returns a fresh Project so its remembered space list is never stale.
+
+        Args:
+            path: The path to start searching from.
+
+        Returns:
+            The project and space name ('main', '.zzz/zzz-0'), either of which
+            may be None.
+        """
+        key = str(path)
+        if key not in cls._locations:
+            cls._locations[key] = cls._search_upward(Path(path).resolve())
+
+        found = cls._locations[key]
+        if found is None:
+            return None, None
+        root, space_name = found
+        return cls(root), space_name
+
+    @classmethod
+    def _search_upward(cls, path: Path) -> tuple[str, str | None] | None:
+        current = path
         while current != current.parent:
-            dotfile = current / cls.DOTFILE
-            if dotfile.exists():
-                return cls(str(current))
+            if (current / cls.DOTFILE).exists():
+                parts = path.relative_to(current).parts
+                return str(current), cls._space_name_from_parts(parts)
             current = current.parent
+        return None
 
+    @classmethod
+    def _space_name_from_parts(cls, parts: tuple[str, ...]) -> str | None:
+        """Name the space holding a path, given its parts relative to the project."""
+        if parts and parts[0] == cls.ZZZ_DIR:
+            if len(parts) > 1 and not parts[1].startswith("."):
+                return f"{cls.ZZZ_DIR}/{parts[1]}"
+            return None
+        # Hidden entries are the store, .vscode and other bookkeeping
+        if parts and not parts[0].startswith("."):
+            return parts[0]
         return None
+
+    @classmethod
+    def clear_location_cache(cls):
+        """Forget cached locate() results, e.g. after the cwd's space moved."""
+        cls._locations.clear()
@@ -6,12 +6,41 @@ to isolate security scanner warnings and provide OS-agnostic operations.
 
 from __future__ import annotations
 
+import errno
 import os
 import shutil
+import stat
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from git import Repo
+from typing import TYPE_CHECKING, Any, Callable, cast
 from gitspaces.modules.errors import GitSpacesError
 
+if TYPE_CHECKING:
+    from git import Repo
+
+
+def _repo_class() -> type[Repo]:
+    """Get GitPython's Repo class, importing GitPython on first use.
+
+    GitPython takes tens of milliseconds to import, which commands that never
+    open a repository (``switch <name>``, ``--version``) shouldn't pay for.
+    """
+    repo_class = globals().get("Repo")
+    if repo_class is None:
+        from git import Repo as imported
+
+        globals()["Repo"] = repo_class = imported
+    return cast("type[Repo]", repo_class)
+
+
+def __getattr__(name: str) -> Any:
+    # Lets runshell.Repo be used (and patched) before GitPython is imported
+    if name == "Repo":
+        return _repo_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Subprocess wrapper - isolates security warnings
 class subprocess:
@@ -38,27 +67,317 @@ class subprocess:
         # Security: Safe usage - args as list, no shell=True
         return sp.run(*args, **kwargs)  # nosec B603
 
+    @staticmethod
+    def stream(args: list[str], cwd: str | Path):
+        """Start a process whose combined stdout and stderr can be read line by line.
+
+        The process gets no input, so it can't wait on a terminal shared with
+        other processes.
+
+        Args:
+            args: Command and arguments
+            cwd: Directory to run it in
+
+        Returns:
+            subprocess.Popen with a text-mode ``stdout``
+
+        Raises:
+            OSError: If the command can't be started (FileNotFoundError if it doesn't exist)
+        """
+        import subprocess as sp  # nosec B404
+
+        # Security: Safe usage - args as list, no shell=True
+        return sp.Popen(  # nosec B603
+            args,
+            cwd=str(cwd),
+            stdin=sp.DEVNULL,
+            stdout=sp.PIPE,
+            stderr=sp.STDOUT,
+            text=True,
+            errors="replace",
+            bufsize=1,
+        )
+
+    @staticmethod
+    def spawn_detached(args: list[str]) -> int:
+        """Start a process that outlives this one, without waiting for it.
+
+        The child gets its own session (or a detached console on Windows) and no
+        stdio, so it isn't killed with the terminal or tied to its output.
+
+        Args:
+            args: Command and arguments
+
+        Returns:
+            The child's process ID
+        """
+        import subprocess as sp  # nosec B404
+
+        kwargs: dict = {"stdin": sp.DEVNULL, "stdout": sp.DEVNULL, "stderr": sp.DEVNULL}
+        if sys.platform == "win32":
+            kwargs["creationflags"] = sp.DETACHED_PROCESS | sp.CREATE_NEW_PROCESS_GROUP
+        else:
+            kwargs["start_new_session"] = True
+
+        # Security: Safe usage - args as list, no shell=True
+        return sp.Popen(args, close_fds=True, **kwargs).pid  # nosec B603
+
+    @staticmethod
+    def pid_alive(pid: int) -> bool:
+        """Check if a process is still running.
+
+        Args:
+            pid: The process ID
+
+        Returns:
+            True if a process with that ID exists
+        """
+        if pid <= 0:
+            return False
+
+        if sys.platform == "win32":
+            import ctypes
+
+            # os.kill would terminate the process on Windows; just try to open it
+            process_query_limited_information = 0x1000
+            kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+            handle = kernel32.OpenProcess(process_query_limited_information, False, pid)
+            if not handle:
+                return False
+            kernel32.CloseHandle(handle)
+            return True
+
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            # Exists, but belongs to another user
+            return True
+        return True
+
+
+# git worktree add, repair and prune read every registered worktree, so one that
+# another thread is halfway through registering makes them fail
+_worktree_admin_lock = threading.Lock()
+
 
 # Git operations namespace
 class git:
     """Git operations using GitPython."""
 
     @staticmethod
-    def clone(url: str, target_path: str | Path) -> None:
+    def clone(
+        url: str,
+        target_path: str | Path,
+        bare: bool = False,
+        filter: str | None = None,
+        depth: int | None = None,
+        single_branch: bool = False,
+        reference: str | Path | None = None,
+    ) -> None:
         """Clone a git repository.
 
         Args:
             url: Git repository URL
             target_path: Where to clone the repository
+            bare: If True, make a bare clone that still tracks origin's branches
+            filter: Partial clone filter spec, e.g. "blob:none"
+            depth: Only fetch this many commits of history
+            single_branch: Only fetch the branch HEAD points to
+            reference: Local repository to borrow objects from while cloning; the
+                clone copies what it needs and doesn't depend on it afterwards
 
         Raises:
             GitSpacesError: If clone fails
         """
+        options: dict[str, Any] = {}
+        if bare:
+            options["bare"] = True
+        if filter:
+            options["filter"] = filter
+        if depth:
+            options["depth"] = depth
+        if single_branch:
+            options["single_branch"] = True
+        if reference:
+            options["reference"] = str(reference)
+            options["dissociate"] = True
+
         try:
-            Repo.clone_from(url, str(target_path))
+            repo = _repo_class().clone_from(url, str(target_path), **options)
+            if bare:
+                # Bare clones don't map remote branches; worktrees need origin/* to pull
+                branches = repo.active_branch.name if single_branch else "*"
+                with repo.config_writer() as writer:
+                    writer.set_value(
+                        'remote "origin"',
+                        "fetch",
+                        f"+refs/heads/{branches}:refs/remotes/origin/{branches}",
+                    )
+                repo.remotes.origin.fetch()
+                # Nor do they set an upstream for the default branch spaces check out
+                head = repo.active_branch.name
+                if f"origin/{head}" in [ref.name for ref in repo.remotes.origin.refs]:
+                    repo.git.branch(f"--set-upstream-to=origin/{head}", head)
+                repo.close()
         except Exception as e:
             raise GitSpacesError(f"Failed to clone repository: {e}")
 
+    @staticmethod
+    def clone_mirror(url: str, target_path: str | Path) -> None:
+        """Make a bare mirror clone of a repository (all refs, no checkout).
+
+        Args:
+            url: Git repository URL
+            target_path: Where to create the mirror
+
+        Raises:
+            GitSpacesError: If clone fails
+        """
+        try:
+            _repo_class().clone_from(url, str(target_path), mirror=True).close()
+        except Exception as e:
+            raise GitSpacesError(f"Failed to mirror repository: {e}")
+
+    @staticmethod
+    def update_mirror(path: str | Path) -> None:
+        """Fetch all refs into a mirror clone, pruning deleted ones.
+
+        Args:
+            path: The mirror repository
+
+        Raises:
+            GitSpacesError: If the update fails
+        """
+        try:
+            with _repo_class()(str(path)) as repo:
+                repo.git.remote("update", "--prune")
+        except Exception as e:
+            raise GitSpacesError(f"Failed to update mirror: {e}")
+
+    @staticmethod
+    def get_remote_url(path: str | Path, remote: str = "origin") -> str | None:
+        """Get the URL of a repository's remote.
+
+        Args:
+            path: The repository
+            remote: The remote name
+
+        Returns:
+            The remote URL, or None if the repository or remote doesn't exist
+        """
+        try:
+            with _repo_class()(str(path)) as repo:
+                return str(repo.remotes[remote].url)
+        except Exception:
+            return None
+
+    @staticmethod
+    def worktree_add(
+        repo_path: str | Path, path: str | Path, ref: str | None = None, detach: bool = False
+    ) -> None:
+        """Add a worktree to a repository.
+
+        Registering the worktree is serialized within the process (see
+        _worktree_admin_lock); checking its files out isn't, so concurrent
+        calls still copy in parallel.
+
+        Args:
+            repo_path: The repository that owns the worktree
+            path: Where to check out the worktree
+            ref: Branch or commit to check out (default: the repository's HEAD)
+            detach: If True, check out a detached HEAD instead of the branch
+
+        Raises:
+            GitSpacesError: If the worktree can't be created
+        """
+        args = ["add", "--no-checkout"]
+        if detach:
+            args.append("--detach")
+        args.append(str(path))
+        if ref:
+            args.append(ref)
+
+        try:
+            with _worktree_admin_lock, _repo_class()(str(repo_path)) as repo:
+                repo.git.worktree(*args)
+            with _repo_class()(str(path)) as worktree:
+                worktree.git.reset("--hard", "--quiet")
+        except Exception as e:
+            raise GitSpacesError(f"Failed to add worktree: {e}")
+
+    @staticmethod
+    def worktree_prune(repo_path: str | Path) -> None:
+        """Forget worktrees of a repository whose directories no longer exist.
+
+        Args:
+            repo_path: The repository that owns the worktrees
+
+        Raises:
+            GitSpacesError: If pruning fails
+        """
+        try:
+            with _worktree_admin_lock, _repo_class()(str(repo_path)) as repo:
+                repo.git.worktree("prune")
+        except Exception as e:
+            raise GitSpacesError(f"Failed to prune worktrees: {e}")
+
+    @staticmethod
+    def worktree_repair(repo_path: str | Path, path: str | Path) -> None:
+        """Reconnect a worktree with its repository after the worktree was moved.
+
+        Args:
+            repo_path: The repository that owns the worktree
+            path: The worktree's new location
+
+        Raises:
+            GitSpacesError: If the worktree can't be repaired
+        """
+        try:
+            with _worktree_admin_lock, _repo_class()(str(repo_path)) as repo:
+                repo.git.worktree("repair", str(path))
+        except Exception as e:
+            raise GitSpacesError(f"Failed to repair worktree: {e}")
+
+    @staticmethod
+    def init_bare(path: str | Path) -> None:
+        """Initialize an empty bare repository.
+
+        Args:
+            path: Where to create the repository
+
+        Raises:
+            GitSpacesError: If initialization fails
+        """
+        try:
+            _repo_class().init(str(path), bare=True).close()
+        except Exception as e:
+            raise GitSpacesError(f"Failed to initialize repository: {e}")
+
+    @staticmethod
+    def fetch_refs(repo_path: str | Path, source: str | Path, prefix: str) -> None:
+        """Copy every ref of another local repository into a repository, under a prefix.
+
+        Shallow sources are accepted; the repository records their shallow
+        boundary too.
+
+        Args:
+            repo_path: The repository to fetch into
+            source: The repository to fetch from
+            prefix: Where to put the refs, e.g. 'refs/spaces/main/'
+
+        Raises:
+            GitSpacesError: If the fetch fails
+        """
+        try:
+            with _repo_class()(str(repo_path)) as repo:
+                repo.git.fetch(
+                    "--quiet", "--no-tags", "--update-shallow", str(source), f"+refs/*:{prefix}*"
+                )
+        except Exception as e:
+            raise GitSpacesError(f"Failed to fetch refs: {e}")
+
     @staticmethod
     def get_repo(path: str | Path) -> Repo | None:
         """Get a Repo instance for a path.
@@ -72,7 +391,7 @@ class git:
         p = Path(path)
         if p.exists():
             try:
-                return Repo(str(path))
+                return _repo_class()(str(path))
             except Exception:
                 return None
         return None
@@ -92,6 +411,78 @@ class git:
         except Exception:
             return "detached"
 
+    @staticmethod
+    def list_ignored(path: str | Path) -> list[str]:
+        """List the untracked files git ignores in a working tree.
+
+        Whole ignored directories are listed once, with a trailing "/".
+
+        Args:
+            path: The working tree
+
+        Returns:
+            Paths relative to the working tree, "/"-separated
+
+        Raises:
+            GitSpacesError: If git can't list them
+        """
+        try:
+            with _repo_class()(str(path)) as repo:
+                output = repo.git.ls_files(
+                    "--others", "--ignored", "--exclude-standard", "--directory", "-z"
+                )
+        except Exception as e:
+            raise GitSpacesError(f"Failed to list ignored files: {e}")
+        return [p for p in output.split("\0") if p]
+
+    @staticmethod
+    def status(path: str | Path, on_start: Callable[[Any], None] | None = None) -> str:
+        """Get a working tree's status in porcelain v2 format, with branch headers.
+
+        Runs with --no-optional-locks, so checking the status never rewrites
+        the index (and never waits for another git command's index lock).
+
+        Args:
+            path: The working tree
+            on_start: Called with the subprocess.Popen once git is running, so
+                the caller can terminate a check it no longer needs
+
+        Returns:
+            The output of ``git status --porcelain=v2 --branch``
+
+        Raises:
+            GitSpacesError: If git can't read the status (or was terminated)
+        """
+        import subprocess as sp  # nosec B404
+
+        # Security: Safe usage - args as list, no shell=True
+        with sp.Popen(  # nosec B603
+            ["git", "--no-optional-locks", "status", "--porcelain=v2", "--branch"],
+            cwd=str(path),
+            stdin=sp.DEVNULL,
+            stdout=sp.PIPE,
+            stderr=sp.PIPE,
+            text=True,
+        ) as process:
+            if on_start is not None:
+                on_start(process)
+            stdout, stderr = process.communicate()
+        if process.returncode != 0:
+            raise GitSpacesError(f"Failed to get status: {stderr.strip()}")
+        return str(stdout)
+
+    @staticmethod
+    def get_head_commit(repo: Repo) -> str:
+        """Get the commit HEAD points at.
+
+        Args:
+            repo: GitPython Repo instance
+
+        Returns:
+            The full commit SHA
+        """
+        return str(repo.head.commit.hexsha)
+
     @staticmethod
     def is_valid_repo(path: str) -> bool:
         """Check if path is a valid git repository.
@@ -103,12 +494,94 @@ class git:
             True if valid git repository
         """
         try:
-            Repo(path)
+            _repo_class()(path)
             return True
         except Exception:
             return False
 
 
+# Linux FICLONE ioctl request number: _IOW(0x94, 9, int)
+_FICLONE = 0x40049409
+
+# errno values meaning "this filesystem/kernel can't do that", as opposed to a real I/O error
+_CLONE_UNSUPPORTED = {
+    errno.EBADF,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.ENOTTY,
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+    errno.EXDEV,
+}
+
+
+class _FileCloner:
+    """Copy function for copy_tree that shares data blocks with the source when it can.
+
+    Each file is first cloned with the FICLONE ioctl (a reflink on btrfs, XFS, bcachefs),
+    then with os.copy_file_range, and finally with a plain copy. Once a strategy reports
+    that the filesystem does not support it, it is not tried again for the rest of the tree.
+    """
+
+    METHODS = ("reflink", "copy_file_range", "copy")
+
+    def __init__(self):
+        self.try_reflink = sys.platform.startswith("linux")
+        self.try_copy_range = hasattr(os, "copy_file_range")
+        self.counts = dict.fromkeys(self.METHODS, 0)
+        self._lock = threading.Lock()
+
+    def __call__(self, src: str, dst: str) -> str:
+        method = self._clone(src, dst)
+        if method is None:
+            shutil.copyfile(src, dst)
+            method = "copy"
+        shutil.copystat(src, dst)
+        with self._lock:
+            self.counts[method] += 1
+        return dst
+
+    def _clone(self, src: str, dst: str) -> str | None:
+        if not (self.try_reflink or self.try_copy_range):
+            return None
+
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            if self.try_reflink:
+                try:
+                    import fcntl
+
+                    fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                    return "reflink"
+                except OSError as e:
+                    if e.errno not in _CLONE_UNSUPPORTED:
+                        raise
+                    self.try_reflink = False
+
+            if self.try_copy_range:
+                try:
+                    remaining = os.fstat(fsrc.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                    return "copy_file_range"
+                except OSError as e:
+                    if e.errno not in _CLONE_UNSUPPORTED:
+                        raise
+                    self.try_copy_range = False
+                    fdst.seek(0)
+                    fdst.truncate()
+                    fsrc.seek(0)
+
+        return None
+
+    def summary(self) -> str:
+        """Describe which strategies were used, e.g. "reflink" or "copy_file_range+copy"."""
+        used = [m for m in self.METHODS if self.counts[m]]
+        return "+".join(used) if used else "copy"
+
+
 # OS operations - cross-platform file/directory operations
 class fs:
     """File system operations wrapper."""
@@ -158,15 +631,120 @@ class fs:
             shutil.move(str(src_path), str(dst_path))
 
     @staticmethod
-    def copy_tree(src: str | Path, dst: str | Path, symlinks: bool = True) -> None:
+    def copy_tree(
+        src: str | Path,
+        dst: str | Path,
+        symlinks: bool = True,
+        workers: int | None = None,
+        ignore: Callable[[str, bool], bool] | None = None,
+    ) -> str:
         """Recursively copy a directory tree.
 
+        The tree is walked with os.scandir on the calling thread, which creates each
+        directory before anything inside it, while file copies are spread across a
+        bounded thread pool. Files are reflinked (copy-on-write) when the filesystem
+        supports it, so duplicating a large repository costs neither time nor disk
+        space. Otherwise each file falls back to copy_file_range or a plain copy.
+
         Args:
             src: Source directory
-            dst: Destination directory
+            dst: Destination directory (must not exist)
             symlinks: If True, preserve symlinks
+            workers: Number of copy threads (default: ThreadPoolExecutor's default)
+            ignore: Called with each entry's path relative to src ("/"-separated) and
+                whether it is a directory; entries it returns True for are skipped,
+                and skipped directories are never walked
+
+        Returns:
+            The copy strategy used, e.g. "reflink", "copy" or "reflink+copy"
+        """
+        cloner = _FileCloner()
+        copied_dirs = [(str(src), str(dst))]
+        futures = []
+        errors: list[BaseException] = []
+
+        def _record_error(future):
+            if not future.cancelled() and future.exception() is not None:
+                errors.append(future.exception())
+
+        os.makedirs(str(dst))
+        pool = ThreadPoolExecutor(max_workers=workers)
+        try:
+            stack = [(str(src), str(dst), "")]
+            while stack:
+                src_dir, dst_dir, rel_dir = stack.pop()
+                with os.scandir(src_dir) as entries:
+                    for entry in entries:
+                        rel_path = f"{rel_dir}{entry.name}"
+                        if ignore and ignore(rel_path, entry.is_dir(follow_symlinks=not symlinks)):
+                            continue
+
+                        target = os.path.join(dst_dir, entry.name)
+                        if symlinks and entry.is_symlink():
+                            os.symlink(
+                                os.readlink(entry.path),
+                                target,
+                                target_is_directory=entry.is_dir(),
+                            )
+                            shutil.copystat(entry.path, target, follow_symlinks=False)
+                        elif entry.is_dir():
+                            os.mkdir(target)
+                            copied_dirs.append((entry.path, target))
+                            stack.append((entry.path, target, f"{rel_path}/"))
+                        else:
+                            future = pool.submit(cloner, entry.path, target)
+                            future.add_done_callback(_record_error)
+                            futures.append(future)
+
+                # Stop walking as soon as any copy has failed
+                if errors:
+                    raise errors[0]
+
+            for future in futures:
+                future.result()
+        except BaseException:
+            pool.shutdown(wait=True, cancel_futures=True)
+            raise
+        pool.shutdown(wait=True)
+
+        # Directory metadata last, so copying their contents doesn't bump mtimes
+        for src_dir, dst_dir in reversed(copied_dirs):
+            shutil.copystat(src_dir, dst_dir)
+
+        return cloner.summary()
+
+    @staticmethod
+    def rename(src: str | Path, dst: str | Path) -> None:
+        """Atomically rename a file or directory on the same filesystem.
+
+        Unlike move, this never copies and never moves src *into* an existing
+        directory, so dst either appears complete or not at all.
+
+        Args:
+            src: Source path
+            dst: Destination path (must not exist)
+        """
+        os.rename(str(src), str(dst))
+
+    @staticmethod
+    def remove_tree(path: str | Path) -> None:
+        """Recursively delete a directory tree.
+
+        Read-only files (such as git pack files on Windows) are made writable
+        and retried.
+
+        Args:
+            path: Directory to delete
         """
-        shutil.copytree(str(src), str(dst), symlinks=symlinks)
+
+        def _make_writable(func, failed_path, _exc):
+            os.chmod(failed_path, stat.S_IWRITE)
+            func(failed_path)
+
+        if sys.version_info >= (3, 12):
+            shutil.rmtree(str(path), onexc=_make_writable)
+        else:
+            shutil.rmtree(str(path), onerror=_make_writable)
 
     @staticmethod
     def chdir(path: str | Path) -> None:
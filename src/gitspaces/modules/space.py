@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 from pathlib import Path
-from git import Repo
+from typing import TYPE_CHECKING
+from gitspaces.modules.config import Config
 from gitspaces.modules.errors import SpaceError
 from gitspaces.modules.path import ensure_dir
-from gitspaces.modules import runshell
+from gitspaces.modules.project import Project
+from gitspaces.modules import gitrefs, runshell
+
+if TYPE_CHECKING:
+    from git import Repo
 
 
 class Space:
@@ -23,6 +28,7 @@ class Space:
         self.path = Path(path)
         self.name = self.path.name
         self._repo: Repo | None = None
+        self.copy_method: str | None = None
 
     @property
     def repo(self) -> Repo | None:
@@ -36,13 +42,38 @@ class Space:
         return self._repo
 
     @classmethod
-    def create_space_from_url(cls, project, url: str, path) -> "Space":
+    def create_space_from_url(cls, project, url: str, path, **clone_options) -> "Space":
         """Create a new space by cloning from a URL.
 
         Args:
             project: The parent Project instance.
             url: The git repository URL.
             path: The path where the space will be created (str or Path).
+            **clone_options: Partial/shallow clone options for runshell.git.clone
+                (filter, depth, single_branch).
+
+        Returns:
+            The created Space instance.
+        """
+        path = Path(path)
+        if path.exists():
+            raise SpaceError(f"Space directory already exists: {path}")
+
+        runshell.git.clone(url, path, **clone_options)
+        project.invalidate_spaces()
+        space = cls(project, path)
+        return space
+
+    @classmethod
+    def create_space_from_store(cls, project, path) -> "Space":
+        """Create a new space as a worktree of the project's store repository.
+
+        The worktree checks out the store's default branch (the one its HEAD
+        points at), which tracks the same branch on origin.
+
+        Args:
+            project: The parent Project instance.
+            path: The path where the space will be created (str or Path).
 
         Returns:
             The created Space instance.
@@ -51,25 +82,109 @@ class Space:
         if path.exists():
             raise SpaceError(f"Space directory already exists: {path}")
 
-        runshell.git.clone(url, path)
+        # Without a branch, git worktree add would create one named after the path
+        ref, _ = gitrefs.read_head(Path(project.store_dir))
+        branch = (
+            ref[len(gitrefs.HEADS_PREFIX) :]
+            if ref and ref.startswith(gitrefs.HEADS_PREFIX)
+            else None
+        )
+        runshell.git.worktree_add(project.store_dir, path, branch)
+        project.invalidate_spaces()
         space = cls(project, path)
+        space.copy_method = "worktree"
         return space
 
-    def duplicate(self) -> "Space":
+    def _is_worktree(self) -> bool:
+        """Check if this space is a worktree of the project's store."""
+        return bool(self.project.mode == self.project.MODE_WORKTREE)
+
+    def _moved(self, new_path: Path) -> "Space":
+        """Finish moving this space to a new path.
+
+        Worktrees are re-registered with the store so git can still find them,
+        spaces sharing the store's objects get their relative alternates path
+        updated, and the project's remembered space list is dropped.
+
+        Args:
+            new_path: The space's new location.
+
+        Returns:
+            The Space instance at the new location.
+        """
+        if self._is_worktree():
+            runshell.git.worktree_repair(self.project.store_dir, new_path)
+        else:
+            self.project.link_store(new_path, create=False)
+        self.project.invalidate_spaces()
+        Project.clear_location_cache()
+        return Space(self.project, new_path)
+
+    def duplicate(self, new_path: str | Path | None = None) -> "Space":
         """Duplicate this space to a new sleeper space.
 
+        In worktree projects the new space is a detached worktree at this space's
+        HEAD commit. The strategy that was used (worktree, reflink, copy_file_range
+        or copy) is recorded on the returned space as ``copy_method``.
+
+        The copy is built in a hidden staging directory and renamed into place only
+        once complete, so an interrupted copy never shows up as a sleeper. If the
+        copy, or connecting it to the store at its final path, fails, the partial
+        space is removed.
+
+        Args:
+            new_path: Where to create the sleeper (default: the next free sleeper slot).
+
         Returns:
             The new Space instance.
         """
-        new_path = self.project._get_empty_sleeper_path()
+        if new_path is None:
+            new_path = self.project._allocate_sleeper_path()
+        new_path = Path(new_path)
+        staging_path = Project.staging_path_for(new_path)
 
         try:
-            # Copy the entire directory
-            runshell.fs.copy_tree(self.path, new_path, symlinks=True)
+            if self._is_worktree():
+                # Worktrees can't share a branch, so sleepers start detached
+                head = gitrefs.head_commit(self.path)
+                if head is None:
+                    repo = self.repo
+                    if repo is None:
+                        raise SpaceError(f"Not a git repository: {self.path}")
+                    head = runshell.git.get_head_commit(repo)
+                runshell.git.worktree_add(self.project.store_dir, staging_path, head, detach=True)
+                copy_method = "worktree"
+            else:
+                # Copy the directory, minus anything the project excludes
+                copy_method = runshell.fs.copy_tree(
+                    self.path,
+                    staging_path,
+                    symlinks=True,
+                    workers=Config.instance().copy_workers,
+                    ignore=self.project.copy_filter(self.path),
+                )
+            runshell.fs.rename(staging_path, new_path)
+            new_space = Space(self.project, staging_path)._moved(new_path)
         except Exception as e:
+            # Whichever of the two exists is incomplete (or can't find its objects)
+            for path in (staging_path, new_path):
+                if path.exists():
+                    Space(self.project, path).remove()
             raise SpaceError(f"Failed to duplicate space: {e}")
 
-        return Space(self.project, new_path)
+        new_space.copy_method = copy_method
+        return new_space
+
+    def remove(self):
+        """Delete this space from disk.
+
+        Worktrees are also unregistered from the project's store.
+        """
+        runshell.fs.remove_tree(self.path)
+        if self._is_worktree():
+            runshell.git.worktree_prune(self.project.store_dir)
+        self.project.invalidate_spaces()
+        Project.clear_location_cache()
 
     def wake(self, new_name: str | None = None) -> "Space":
         """Wake up a sleeping space and optionally rename it.
@@ -89,11 +204,10 @@ class Space:
             new_path = self.project.path / new_name
         else:
             # Use the default branch name or 'main'
-            repo = self.repo
-            if repo:
-                branch_name = runshell.git.get_active_branch(repo)
-            else:
-                branch_name = "main"
+            branch_name = gitrefs.current_branch(self.path)
+            if branch_name is None:
+                repo = self.repo
+                branch_name = runshell.git.get_active_branch(repo) if repo else "main"
             new_path = self.project.path / branch_name
 
         if new_path.exists():
@@ -102,7 +216,7 @@ class Space:
         # Move the space
         runshell.fs.move(self.path, new_path)
 
-        return Space(self.project, new_path)
+        return self._moved(new_path)
 
     def sleep(self) -> "Space":
         """Put this space to sleep (move to .zzz directory).
@@ -114,12 +228,12 @@ class Space:
         if self.path.is_relative_to(self.project.zzz_dir):
             raise SpaceError("Space is already sleeping")
 
-        new_path = self.project._get_empty_sleeper_path()
+        new_path = self.project._allocate_sleeper_path()
 
         # Move the space
         runshell.fs.move(self.path, new_path)
 
-        return Space(self.project, new_path)
+        return self._moved(new_path)
 
     def rename(self, new_name: str) -> "Space":
         """Rename this space.
@@ -142,14 +256,21 @@ class Space:
         # Rename the space
         runshell.fs.move(self.path, new_path)
 
-        return Space(self.project, new_path)
+        return self._moved(new_path)
 
     def get_current_branch(self) -> str:
         """Get the current branch name.
 
+        HEAD is read from the repository's files; GitPython is only used for
+        layouts the reader doesn't understand.
+
         Returns:
             The current branch name or "detached".
         """
+        branch = gitrefs.current_branch(self.path)
+        if branch is not None:
+            return branch
+
         repo = self.repo
         if repo:
             return runshell.git.get_active_branch(repo)
@@ -0,0 +1,492 @@
+"""Collect the state of spaces: branch, local changes and distance to upstream.
+
+Each space costs a ``git status`` run, which is dominated by git walking the
+working tree, so spaces are checked in parallel on a bounded thread pool and
+results are yielded in the order they finish.
+
+Results are remembered per project in ``.status-cache.json`` (see
+StatusCache), and spaces whose git metadata and tracked files haven't changed
+since they were last checked are answered from there without running git.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterator, NamedTuple
+from gitspaces.modules.errors import GitSpacesError
+from gitspaces.modules.project import Project, SpaceEntry
+from gitspaces.modules import gitrefs, runshell
+
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# The fields of a SpaceStatus that come from git and are kept in the cache
+CACHED_FIELDS = ("branch", "commit", "upstream", "dirty", "ahead", "behind")
+
+# The fingerprint key for the working tree's stamp (every other key is a file path)
+WORKTREE_KEY = "worktree"
+
+
+class SpaceStatus(NamedTuple):
+    """The state of one space."""
+
+    project: str
+    space: str
+    path: str
+    branch: str | None = None
+    commit: str | None = None  # None before the first commit
+    upstream: str | None = None  # e.g. 'origin/main'
+    dirty: bool | None = None
+    ahead: int | None = None  # None when the branch has no upstream
+    behind: int | None = None
+    modified: float | None = None  # seconds since the epoch
+    error: str | None = None
+    cached: bool = False  # True when read from the StatusCache
+
+    def to_json(self) -> dict[str, Any]:
+        """Get the status as a JSON-serializable dict, with an ISO 8601 modified time."""
+        data = self._asdict()
+        if self.modified is not None:
+            data["modified"] = (
+                datetime.fromtimestamp(self.modified).astimezone().isoformat(timespec="seconds")
+            )
+        return data
+
+    def annotation(self) -> str:
+        """Get a short description of the space, e.g. 'main, dirty, ↑2'."""
+        if self.error:
+            return "status unavailable"
+        parts = [self.branch or "-", "dirty" if self.dirty else "clean"]
+        if self.ahead:
+            parts.append(f"↑{self.ahead}")
+        if self.behind:
+            parts.append(f"↓{self.behind}")
+        return ", ".join(parts)
+
+
+def parse_status(output: str) -> dict[str, Any]:
+    """Parse ``git status --porcelain=v2 --branch`` output.
+
+    Args:
+        output: The command's output.
+
+    Returns:
+        The CACHED_FIELDS: the branch ("detached" for a detached HEAD), the
+        HEAD commit, the upstream, whether there are any changes (including
+        untracked files), and the commits ahead of and behind the upstream
+        (None without an upstream).
+    """
+    fields: dict[str, Any] = dict.fromkeys(CACHED_FIELDS)
+    fields["dirty"] = False
+
+    for line in output.splitlines():
+        if line.startswith("# branch.oid "):
+            oid = line[len("# branch.oid ") :]
+            fields["commit"] = None if oid == "(initial)" else oid
+        elif line.startswith("# branch.head "):
+            head = line[len("# branch.head ") :]
+            fields["branch"] = "detached" if head == "(detached)" else head
+        elif line.startswith("# branch.upstream "):
+            fields["upstream"] = line[len("# branch.upstream ") :]
+        elif line.startswith("# branch.ab "):
+            plus, minus = line[len("# branch.ab ") :].split()
+            fields["ahead"], fields["behind"] = int(plus), -int(minus)
+        elif line and not line.startswith("#"):
+            fields["dirty"] = True
+
+    return fields
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _stat_key(path: str) -> str:
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return "-"
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def worktree_stamp(path: str | Path) -> int | None:
+    """Summarize the modification times of a space's tracked files.
+
+    Covers every file in the index and every directory holding one, so
+    editing, deleting or adding a file anywhere git looks changes the stamp.
+    This stats the files git status would, but without starting git or
+    reading their contents.
+
+    Args:
+        path: The space.
+
+    Returns:
+        The stamp, or None if the space's index can't be read (see
+        gitrefs.index_paths).
+    """
+    git_directory = gitrefs.git_dir(path)
+    paths = None if git_directory is None else gitrefs.index_paths(git_directory)
+    if paths is None:
+        return None
+
+    digest = hashlib.sha1(usedforsecurity=False)
+    directories = {""}
+    for rel_path in paths:
+        digest.update(_stat_key(os.path.join(path, rel_path)).encode())
+        parent = os.path.dirname(rel_path)
+        while parent not in directories:
+            directories.add(parent)
+            parent = os.path.dirname(parent)
+    for directory in sorted(directories):
+        digest.update(_stat_key(os.path.join(path, directory)).encode())
+    return int.from_bytes(digest.digest()[:8], "big")
+
+
+def fingerprint(
+    path: str | Path, upstream: str | None = None, worktree: bool = True
+) -> dict[str, int | None] | None:
+    """Record the mtimes of the files a space's status is derived from.
+
+    These are the space directory, the git HEAD, index and config, packed-refs,
+    the ref HEAD points at and, if given, the upstream's ref, plus the working
+    tree's stamp (see worktree_stamp) under WORKTREE_KEY. Missing files are
+    recorded as None, so creating them also counts as a change.
+
+    Args:
+        path: The space.
+        upstream: The upstream branch, e.g. 'origin/main'.
+        worktree: Include the working tree's stamp.
+
+    Returns:
+        A map of file path to mtime in nanoseconds, or None if the space
+        has no git directory that gitrefs can read.
+    """
+    git_directory = gitrefs.git_dir(path)
+    if git_directory is None:
+        return None
+    shared = gitrefs.common_dir(git_directory)
+
+    files = [
+        Path(path),
+        git_directory / "HEAD",
+        git_directory / "index",
+        shared / "config",
+        shared / "packed-refs",
+    ]
+    head_ref, _ = gitrefs.read_head(git_directory)
+    if head_ref:
+        files.append(shared / head_ref)
+    if upstream:
+        # The upstream may be a remote-tracking or a local branch
+        files += [shared / "refs" / "remotes" / upstream, shared / "refs" / "heads" / upstream]
+
+    recorded = {str(f): _mtime_ns(f) for f in files}
+    if worktree:
+        recorded[WORKTREE_KEY] = worktree_stamp(path)
+    return recorded
+
+
+def _unchanged(path: str | Path, recorded: dict[str, int | None] | None) -> bool:
+    if not recorded or recorded.get(WORKTREE_KEY) is None:
+        return False
+    # The few git files first; the stamp stats the whole working tree
+    files_unchanged = all(_mtime_ns(Path(f)) == m for f, m in recorded.items() if f != WORKTREE_KEY)
+    return files_unchanged and worktree_stamp(path) == recorded[WORKTREE_KEY]
+
+
+class StatusCache:
+    """Statuses of a project's spaces from earlier checks.
+
+    Entries are keyed by space path and stored in the project's
+    ``.status-cache.json``. An entry is used while every file in its
+    fingerprint keeps its mtime: the space's git HEAD, index and config, the
+    refs its branch and upstream come from, the space directory itself, and
+    its tracked files and their directories. Spaces whose index gitrefs can't
+    read are always checked with git.
+    """
+
+    VERSION = 2
+
+    def __init__(self, project: Project):
+        """Initialize a StatusCache.
+
+        Args:
+            project: The project whose spaces it holds.
+        """
+        self.project = project
+        self.path = project.path / Project.STATUS_CACHE_FILE
+        self._entries: dict[str, Any] | None = None
+        self._dirty = False
+
+    @property
+    def entries(self) -> dict[str, Any]:
+        """Get the cached entries by space path, loading them on first use."""
+        if self._entries is None:
+            self._entries = {}
+            try:
+                data = json.loads(self.path.read_text())
+                if data.get("version") == self.VERSION and isinstance(data.get("spaces"), dict):
+                    self._entries = data["spaces"]
+            except (OSError, ValueError, AttributeError):
+                pass
+        return self._entries
+
+    def get(self, entry: SpaceEntry) -> SpaceStatus | None:
+        """Get a space's cached status if nothing it depends on has changed.
+
+        Args:
+            entry: The space.
+
+        Returns:
+            The status, or None if there is no valid entry.
+        """
+        cached = self.entries.get(str(entry.path))
+        if not isinstance(cached, dict) or not _unchanged(entry.path, cached.get("fingerprint")):
+            return None
+        try:
+            fields = {name: cached["status"][name] for name in CACHED_FIELDS}
+        except (KeyError, TypeError):
+            return None
+
+        return SpaceStatus(
+            self.project.name,
+            entry.name,
+            str(entry.path),
+            modified=last_modified(entry.path),
+            cached=True,
+            **fields,
+        )
+
+    def put(self, row: SpaceStatus, recorded: dict[str, int | None]):
+        """Remember a space's status.
+
+        Args:
+            row: The status, as checked with git.
+            recorded: The space's fingerprint, taken before the check.
+        """
+        self.entries[row.path] = {
+            "fingerprint": recorded,
+            "status": {name: getattr(row, name) for name in CACHED_FIELDS},
+        }
+        self._dirty = True
+
+    def save(self):
+        """Write the cache if it changed, dropping spaces that no longer exist."""
+        if not self._dirty:
+            return
+
+        spaces = {p: e for p, e in self.entries.items() if os.path.isdir(p)}
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}")
+        tmp_path.write_text(json.dumps({"version": self.VERSION, "spaces": spaces}))
+        os.replace(tmp_path, self.path)
+        self._entries = spaces
+        self._dirty = False
+
+
+def last_modified(path: str | Path) -> float | None:
+    """Estimate when a space was last worked on.
+
+    Takes the latest mtime of the space directory and its git HEAD and index,
+    which change on checkouts, commits, staging and adding or removing files.
+
+    Args:
+        path: The space.
+
+    Returns:
+        The time in seconds since the epoch, or None if nothing could be read.
+    """
+    candidates = [path]
+    git_directory = gitrefs.git_dir(path)
+    if git_directory is not None:
+        candidates += [git_directory / "HEAD", git_directory / "index"]
+
+    mtimes = []
+    for candidate in candidates:
+        try:
+            mtimes.append(os.stat(candidate).st_mtime)
+        except OSError:
+            pass
+    return max(mtimes) if mtimes else None
+
+
+def _check(
+    project: Project,
+    entry: SpaceEntry,
+    on_start: Callable[[Any], None] | None = None,
+) -> tuple[SpaceStatus, dict[str, int | None] | None]:
+    """Check one space with git, returning its status and fingerprint."""
+    base = SpaceStatus(project.name, entry.name, str(entry.path))
+    recorded = fingerprint(entry.path)
+    try:
+        fields = parse_status(runshell.git.status(entry.path, on_start=on_start))
+    except (GitSpacesError, OSError, ValueError) as e:
+        return base._replace(modified=last_modified(entry.path), error=str(e)), None
+
+    if recorded is not None and fields["upstream"]:
+        recorded.update(fingerprint(entry.path, fields["upstream"], worktree=False) or {})
+    return base._replace(modified=last_modified(entry.path), **fields), recorded
+
+
+def space_status(project: Project, entry: SpaceEntry) -> SpaceStatus:
+    """Check one space with git, ignoring the cache.
+
+    Args:
+        project: The project the space belongs to.
+        entry: The space.
+
+    Returns:
+        The space's status; failures are reported in its error field.
+    """
+    return _check(project, entry)[0]
+
+
+def collect(
+    targets: list[tuple[Project, SpaceEntry]],
+    workers: int = DEFAULT_WORKERS,
+    refresh: bool = False,
+) -> Iterator[SpaceStatus]:
+    """Check spaces in parallel, answering unchanged ones from their project's cache.
+
+    Args:
+        targets: The spaces to check, with their projects.
+        workers: The most spaces to check with git at once.
+        refresh: Check every space with git, even if its cache entry is valid.
+
+    Yields:
+        Each space's status as soon as it is known, cached ones first.
+    """
+    caches: dict[Path, StatusCache] = {}
+    pending = []
+    executor = None
+
+    try:
+        for project, entry in targets:
+            cache = caches.setdefault(project.path, StatusCache(project))
+            row = None if refresh else cache.get(entry)
+            if row is None:
+                pending.append((project, entry))
+            else:
+                yield row
+
+        if not pending:
+            return
+
+        executor = ThreadPoolExecutor(max_workers=max(1, min(workers, len(pending))))
+        futures = {
+            executor.submit(_check, project, entry): caches[project.path]
+            for project, entry in pending
+        }
+        for future in as_completed(futures):
+            row, recorded = future.result()
+            if recorded is not None:
+                futures[future].put(row, recorded)
+            yield row
+    finally:
+        if executor is not None:
+            # Don't start checks nobody will read (Ctrl-C, or the caller stopped early)
+            executor.shutdown(wait=False, cancel_futures=True)
+        for cache in caches.values():
+            try:
+                cache.save()
+            except OSError:
+                pass  # The cache is only an optimization
+
+
+class StatusAnnotations:
+    """Annotate a menu of spaces with their status as the checks finish.
+
+    Implements Console's annotation source: start() reports cached statuses
+    right away and checks the other spaces on daemon worker threads,
+    reporting each one from its thread. cancel() terminates the git processes
+    still running and saves what was learned to the status caches, so a
+    choice made before every check finishes never waits for them, not even
+    when the interpreter exits.
+    """
+
+    def __init__(self, targets: list[tuple[Project, SpaceEntry]], workers: int = DEFAULT_WORKERS):
+        """Initialize StatusAnnotations.
+
+        Args:
+            targets: The spaces in the menu, with their projects.
+            workers: The most spaces to check with git at once.
+        """
+        self.targets = targets
+        self.workers = workers
+        self.threads: list[threading.Thread] = []
+        self._caches: dict[Path, StatusCache] = {}
+        self._pending: queue.SimpleQueue = queue.SimpleQueue()
+        self._processes: set[Any] = set()
+        self._lock = threading.Lock()
+        self._cancelled = False
+
+    def start(self, update: Callable[[str, str], None]):
+        """Report each space's annotation as soon as it is known.
+
+        Args:
+            update: Called with a space name and its annotation.
+        """
+        pending = 0
+        for project, entry in self.targets:
+            cache = self._caches.setdefault(project.path, StatusCache(project))
+            row = cache.get(entry)
+            if row is None:
+                self._pending.put((project, entry))
+                pending += 1
+            else:
+                update(row.space, row.annotation())
+
+        for _ in range(min(self.workers, pending)):
+            # Daemon threads: exiting never waits for a check nobody will read
+            thread = threading.Thread(target=self._work, args=(update,), daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def _work(self, update: Callable[[str, str], None]):
+        """Check pending spaces until there are none left or the menu is closed."""
+        while not self._cancelled:
+            try:
+                project, entry = self._pending.get_nowait()
+            except queue.Empty:
+                return
+
+            row, recorded = _check(project, entry, on_start=self._started)
+            with self._lock:
+                if self._cancelled:
+                    return
+                if recorded is not None:
+                    self._caches[project.path].put(row, recorded)
+            update(row.space, row.annotation())
+
+    def _started(self, process: Any):
+        """Track a running git process, or stop it if the menu has already closed."""
+        with self._lock:
+            if not self._cancelled:
+                self._processes.add(process)
+                return
+        process.terminate()
+
+    def cancel(self):
+        """Stop reporting, terminate running checks and skip the rest, and save the caches."""
+        with self._lock:
+            self._cancelled = True
+            processes, self._processes = self._processes, set()
+            for cache in self._caches.values():
+                try:
+                    cache.save()
+                except OSError:
+                    pass  # The cache is only an optimization
+
+        for process in processes:
+            try:
+                process.terminate()
+            except OSError:
+                pass  # Already exited
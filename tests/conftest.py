@@ -59,6 +59,19 @@ def _close_git_repos_in_directory(directory: Path):
     gc.collect()
 
 
+@pytest.fixture(autouse=True)
+def clear_project_locations():
+    """Don't let cached cwd lookups or parsed indexes leak between tests."""
+    from gitspaces.modules.index import ProjectIndex
+    from gitspaces.modules.project import Project
+
+    Project.clear_location_cache()
+    ProjectIndex.clear_cache()
+    yield
+    Project.clear_location_cache()
+    ProjectIndex.clear_cache()
+
+
 @pytest.fixture
 def temp_home(monkeypatch):
     """Create a temporary home directory for testing."""
@@ -201,7 +214,7 @@ def mock_console_select(monkeypatch):
 
         responses_iter = iter(responses)
 
-        def mock_select(message, choices, default=None):
+        def mock_select(message, choices, default=None, annotations=None):
             try:
                 return next(responses_iter)
             except StopIteration:
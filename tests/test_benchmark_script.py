@@ -0,0 +1,35 @@
+"""Smoke test for scripts/benchmark.py."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "benchmark.py"
+
+
+def test_benchmark_writes_results(tmp_path):
+    """Test a tiny benchmark run covers every command and writes JSON."""
+    output = tmp_path / "results.json"
+
+    subprocess.run(
+        [sys.executable, str(SCRIPT), "--spaces", "2", "--files", "5", "--repeat", "1"]
+        + ["--output", str(output)],
+        capture_output=True,
+        check=True,
+        cwd=tmp_path,
+    )
+
+    report = json.loads(output.read_text())
+    names = {(r["name"], r["spaces"]) for r in report["results"]}
+    assert names == {
+        ("import", None),
+        ("startup", None),
+        ("clone", 2),
+        ("switch", 2),
+        ("rename", 2),
+        ("sleep", 2),
+        ("extend", 2),
+    }
+    assert all(r["median"] > 0 for r in report["results"])
+    assert report["params"]["spaces"] == [2]
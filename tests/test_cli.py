@@ -43,6 +43,32 @@ def test_parser_clone_with_options():
     )
     assert args.num_spaces == 5
     assert args.directory == "/tmp/test"
+    assert args.worktrees is False
+
+
+def test_parser_clone_partial_options():
+    """Test clone command partial and shallow clone options."""
+    parser = create_parser()
+    args = parser.parse_args(
+        [
+            "clone",
+            "https://github.com/test/repo.git",
+            "--filter=blob:none",
+            "--depth",
+            "1",
+            "--single-branch",
+        ]
+    )
+    assert args.filter == "blob:none"
+    assert args.depth == 1
+    assert args.single_branch is True
+
+
+def test_parser_clone_worktrees():
+    """Test clone command with --worktrees."""
+    parser = create_parser()
+    args = parser.parse_args(["clone", "https://github.com/test/repo.git", "--worktrees"])
+    assert args.worktrees is True
 
 
 def test_parser_switch_command():
@@ -53,6 +79,42 @@ def test_parser_switch_command():
     assert args.space == "main"
 
 
+def test_parser_pool_command():
+    """Test pool command."""
+    parser = create_parser()
+    args = parser.parse_args(["pool", "2"])
+    assert args.command == "pool"
+    assert args.target == 2
+    assert parser.parse_args(["pool"]).target is None
+
+
+def test_parser_mirror_command():
+    """Test mirror command."""
+    parser = create_parser()
+    args = parser.parse_args(["mirror", "add", "https://github.com/test/repo.git"])
+    assert args.command == "mirror"
+    assert args.mirror_command == "add"
+    assert args.url == "https://github.com/test/repo.git"
+    assert parser.parse_args(["mirror", "update"]).mirror_command == "update"
+
+
+def test_parser_exclude_command():
+    """Test exclude command."""
+    parser = create_parser()
+    args = parser.parse_args(["exclude", "node_modules/", "*.o", "--git-ignored", "on"])
+    assert args.command == "exclude"
+    assert args.patterns == ["node_modules/", "*.o"]
+    assert args.git_ignored == "on"
+    assert parser.parse_args(["exclude", "--remove", "*.o"]).remove is True
+
+
+def test_parser_share_objects_command():
+    """Test share-objects command."""
+    parser = create_parser()
+    args = parser.parse_args(["share-objects"])
+    assert args.command == "share-objects"
+
+
 def test_parser_sleep_command():
     """Test sleep command."""
     parser = create_parser()
@@ -231,3 +293,50 @@ def test_main_general_exception(mock_checks, mock_init, monkeypatch):
             main()
 
         assert exc_info.value.code == 1
+
+
+@patch("gitspaces.cli.init_config")
+@patch("gitspaces.cli.run_user_environment_checks")
+def test_main_sweeps_staging(mock_checks, mock_init, tmp_path, monkeypatch, capsys):
+    """Test main removes abandoned staging directories of the current project."""
+    from gitspaces.modules.project import Project
+
+    mock_checks.return_value = True
+    project = Project(str(tmp_path / "proj"))
+    project._init()
+    abandoned = project.zzz_dir / f"{Project.STAGING_PREFIX}999999999-zzz-0"
+    abandoned.mkdir()
+    monkeypatch.chdir(project.path)
+    monkeypatch.setattr(sys, "argv", ["gitspaces", "config"])
+
+    with patch("gitspaces.modules.cmd_config.config_command"):
+        main()
+
+    assert not abandoned.exists()
+    assert "Removed incomplete sleeper" in capsys.readouterr().out
+
+
+def test_main_uses_daemon_result():
+    """Test main() exits with the daemon's status without running the command."""
+    with (
+        patch("sys.argv", ["gitspaces", "switch", "main"]),
+        patch("gitspaces.modules.daemon.forward", return_value=3),
+        patch("gitspaces.cli.run") as mock_run,
+    ):
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+    assert exc_info.value.code == 3
+    mock_run.assert_not_called()
+
+
+def test_main_runs_in_process_without_daemon():
+    """Test main() runs the command itself when the daemon doesn't handle it."""
+    with (
+        patch("sys.argv", ["gitspaces", "switch", "main"]),
+        patch("gitspaces.modules.daemon.forward", return_value=None),
+        patch("gitspaces.cli.run") as mock_run,
+    ):
+        main()
+
+    mock_run.assert_called_once_with(["switch", "main"])
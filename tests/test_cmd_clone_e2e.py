@@ -34,7 +34,7 @@ class TestCloneE2E:
 
         monkeypatch.setattr(runshell.fs, "chdir", lambda x: None)
 
-        args = Mock()
+        args = Mock(worktrees=False, filter=None, depth=None, single_branch=False)
         args.url = str(bare_git_repo)
         args.num_spaces = 2
         args.directory = None
@@ -56,7 +56,7 @@ class TestCloneE2E:
 
         monkeypatch.setattr(runshell.fs, "chdir", lambda x: None)
 
-        args = Mock()
+        args = Mock(worktrees=False, filter=None, depth=None, single_branch=False)
         args.url = str(bare_git_repo)
         args.num_spaces = 3
         args.directory = str(gitspaces_config["projects_dir"])
@@ -87,7 +87,7 @@ class TestCloneE2E:
 
         monkeypatch.setattr(runshell.fs, "chdir", lambda x: None)
 
-        args = Mock()
+        args = Mock(worktrees=False, filter=None, depth=None, single_branch=False)
         args.url = str(bare_git_repo)
         args.num_spaces = 2
         args.directory = str(gitspaces_config["projects_dir"])
@@ -109,7 +109,7 @@ class TestCloneE2E:
 
         monkeypatch.setattr(runshell.fs, "chdir", lambda x: None)
 
-        args = Mock()
+        args = Mock(worktrees=False, filter=None, depth=None, single_branch=False)
         args.url = str(bare_git_repo)
         args.num_spaces = 2
         args.directory = str(gitspaces_config["projects_dir"])
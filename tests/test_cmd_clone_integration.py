@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import subprocess
 from pathlib import Path
 from unittest.mock import Mock
 import pytest
@@ -15,7 +16,7 @@ def test_clone_command_with_directory(
     """Test cloning a repository to a specific directory."""
     target_dir = gitspaces_config["projects_dir"] / "cloned-project"
 
-    args = Mock()
+    args = Mock(worktrees=False, filter=None, depth=None, single_branch=False)
     args.url = str(temp_git_repo)
     args.num_spaces = 2
     args.directory = str(target_dir.parent)
@@ -43,7 +44,7 @@ def test_clone_command_uses_config_path(
     temp_git_repo, gitspaces_config, monkeypatch, mock_console_input
 ):
     """Test cloning uses configured project path when no directory specified."""
-    args = Mock()
+    args = Mock(worktrees=False, filter=None, depth=None, single_branch=False)
     args.url = str(temp_git_repo)
     args.num_spaces = 1
     args.directory = None
@@ -71,7 +72,7 @@ def test_clone_command_multiple_spaces(
     temp_git_repo, gitspaces_config, monkeypatch, mock_console_input
 ):
     """Test cloning with multiple spaces."""
-    args = Mock()
+    args = Mock(worktrees=False, filter=None, depth=None, single_branch=False)
     args.url = str(temp_git_repo)
     args.num_spaces = 3
     args.directory = None
@@ -100,7 +101,7 @@ def test_clone_command_multiple_spaces(
 
 def test_clone_command_invalid_url(gitspaces_config, monkeypatch, capsys):
     """Test cloning with invalid URL shows error message."""
-    args = Mock()
+    args = Mock(worktrees=False, filter=None, depth=None, single_branch=False)
     args.url = "/nonexistent/path/to/repo"
     args.num_spaces = 1
     args.directory = None
@@ -117,3 +118,91 @@ def test_clone_command_invalid_url(gitspaces_config, monkeypatch, capsys):
     # Verify error was reported
     captured = capsys.readouterr()
     assert "Error creating project" in captured.out or "Error" in captured.out
+
+
+def test_clone_command_broken_mirror(
+    temp_git_repo, gitspaces_config, monkeypatch, mock_console_input, capsys
+):
+    """Test a mirror that can't be refreshed is skipped instead of failing the clone."""
+    from gitspaces.modules import mirror, runshell
+
+    mirror_path = mirror.ensure_mirror(str(temp_git_repo))
+    (mirror_path / "HEAD").write_text("garbage\n")  # git no longer sees a repository
+
+    args = Mock(worktrees=False, filter=None, depth=None, single_branch=False)
+    args.url = str(temp_git_repo)
+    args.num_spaces = 1
+    args.directory = str(gitspaces_config["projects_dir"])
+
+    mock_console_input(["main"])
+    monkeypatch.setattr(runshell.fs, "chdir", lambda x: None)
+    monkeypatch.chdir(gitspaces_config["projects_dir"])
+
+    clone_command(args)
+
+    out = capsys.readouterr().out
+    assert "cloning without it" in out
+    assert "Using local mirror" not in out
+    assert "✓ Successfully created project" in out
+    assert (gitspaces_config["projects_dir"] / temp_git_repo.name / Project.DOTFILE).exists()
+
+
+def test_clone_command_shares_objects(
+    temp_git_repo, gitspaces_config, monkeypatch, mock_console_input
+):
+    """Test cloned spaces reference the project's shared object store."""
+    args = Mock(worktrees=False, filter=None, depth=None, single_branch=False)
+    args.url = str(temp_git_repo)
+    args.num_spaces = 2
+    args.directory = str(gitspaces_config["projects_dir"])
+
+    mock_console_input(["main"])
+
+    from gitspaces.modules import runshell
+
+    monkeypatch.setattr(runshell.fs, "chdir", lambda x: None)
+    monkeypatch.chdir(gitspaces_config["projects_dir"])
+
+    clone_command(args)
+
+    project = Project(str(gitspaces_config["projects_dir"] / temp_git_repo.name))
+    assert project.has_store()
+
+    for space_name in project.list_spaces():
+        objects_dir = project.path / space_name / ".git" / "objects"
+        assert (objects_dir / "info" / "alternates").exists()
+        assert not list((objects_dir / "pack").glob("*.pack"))
+
+
+def test_clone_command_keeps_clone_options_in_spaces(
+    temp_git_repo, gitspaces_config, monkeypatch, mock_console_input
+):
+    """Test shallow, single-branch clones stay that way in every space, duplicates included."""
+    args = Mock(worktrees=False, filter=None, depth=1, single_branch=True)
+    args.url = f"file://{temp_git_repo}"  # git ignores --depth for plain local paths
+    args.num_spaces = 2
+    args.directory = str(gitspaces_config["projects_dir"])
+
+    mock_console_input(["main"])
+
+    from gitspaces.modules import runshell
+
+    monkeypatch.setattr(runshell.fs, "chdir", lambda x: None)
+    monkeypatch.chdir(gitspaces_config["projects_dir"])
+
+    clone_command(args)
+
+    project = Project(str(gitspaces_config["projects_dir"] / temp_git_repo.name))
+    assert "clone_options" not in project.settings
+    spaces = project.spaces()
+    assert len(spaces) == 2
+    for space in spaces:
+
+        def git(*git_args):
+            return subprocess.run(
+                ["git", *git_args], cwd=space.path, capture_output=True, text=True, check=True
+            ).stdout.strip()
+
+        assert git("rev-parse", "--is-shallow-repository") == "true"
+        assert git("config", "--get-all", "remote.origin.fetch").count("\n") == 0
+        assert "*" not in git("config", "--get-all", "remote.origin.fetch")
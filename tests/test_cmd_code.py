@@ -4,6 +4,7 @@ from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 import pytest
 from gitspaces.modules.cmd_code import code_command
+from gitspaces.modules.project import Project
 
 
 @patch("gitspaces.modules.cmd_code.Console")
@@ -26,7 +27,7 @@ def test_code_command_with_space(mock_project_cls, mock_config_cls, mock_console
     mock_project.path = project_path
     mock_project.name = "project"
     mock_project.zzz_dir = project_path / ".zzz"
-    mock_project_cls.find_project.return_value = mock_project
+    mock_project_cls.locate.return_value = (mock_project, None)
 
     args = Mock()
     args.space = "main"
@@ -49,7 +50,7 @@ def test_code_command_no_project(mock_project_cls, mock_config_cls, mock_console
     mock_config.default_editor = "code"
     mock_config_cls.instance.return_value = mock_config
 
-    mock_project_cls.find_project.return_value = None
+    mock_project_cls.locate.return_value = (None, None)
 
     args = Mock()
     args.space = "main"
@@ -76,7 +77,7 @@ def test_code_command_space_not_found(mock_project_cls, mock_config_cls, mock_co
     mock_project = Mock()
     mock_project.path = project_path
     mock_project.name = "project"
-    mock_project_cls.find_project.return_value = mock_project
+    mock_project_cls.locate.return_value = (mock_project, None)
 
     args = Mock()
     args.space = "nonexistent"
@@ -104,7 +105,7 @@ def test_code_command_editor_not_found(mock_project_cls, mock_config_cls, mock_c
     mock_project.path = project_path
     mock_project.name = "project"
     mock_project.zzz_dir = project_path / ".zzz"
-    mock_project_cls.find_project.return_value = mock_project
+    mock_project_cls.locate.return_value = (mock_project, None)
 
     args = Mock()
     args.space = "main"
@@ -134,7 +135,7 @@ def test_code_command_editor_error(mock_project_cls, mock_config_cls, mock_conso
     mock_project.path = project_path
     mock_project.name = "project"
     mock_project.zzz_dir = project_path / ".zzz"
-    mock_project_cls.find_project.return_value = mock_project
+    mock_project_cls.locate.return_value = (mock_project, None)
 
     args = Mock()
     args.space = "main"
@@ -166,8 +167,8 @@ def test_code_command_select_space(mock_project_cls, mock_config_cls, mock_conso
     mock_project.path = project_path
     mock_project.name = "project"
     mock_project.zzz_dir = zzz_dir
-    mock_project.list_spaces.return_value = ["main", "feature", ".zzz/sleep1"]
-    mock_project_cls.find_project.return_value = mock_project
+    mock_project.spaces.side_effect = Project(str(project_path)).spaces
+    mock_project_cls.locate.return_value = (mock_project, None)
 
     mock_console.prompt_select.return_value = "main"
 
@@ -197,13 +198,15 @@ def test_code_command_no_active_spaces(mock_project_cls, mock_config_cls, mock_c
     project_path.mkdir()
     zzz_dir = project_path / ".zzz"
     zzz_dir.mkdir()
+    (zzz_dir / "sleep1").mkdir()
+    (zzz_dir / "sleep2").mkdir()
 
     mock_project = Mock()
     mock_project.path = project_path
     mock_project.name = "project"
     mock_project.zzz_dir = zzz_dir
-    mock_project.list_spaces.return_value = [".zzz/sleep1", ".zzz/sleep2"]
-    mock_project_cls.find_project.return_value = mock_project
+    mock_project.spaces.side_effect = Project(str(project_path)).spaces
+    mock_project_cls.locate.return_value = (mock_project, None)
 
     args = Mock()
     args.space = None
@@ -213,3 +216,31 @@ def test_code_command_no_active_spaces(mock_project_cls, mock_config_cls, mock_c
         code_command(args)
 
     mock_console.println.assert_called_with("✗ No active spaces available")
+
+
+@patch("gitspaces.modules.cmd_code.Console")
+@patch("gitspaces.modules.cmd_code.Config")
+@patch("gitspaces.modules.cmd_code.Project")
+def test_code_command_current_space(mock_project_cls, mock_config_cls, mock_console, tmp_path):
+    """Test code command opens the space containing the cwd without prompting."""
+    mock_config = Mock()
+    mock_config.default_editor = "code"
+    mock_config_cls.instance.return_value = mock_config
+
+    project_path = tmp_path / "project"
+    (project_path / "feature").mkdir(parents=True)
+
+    mock_project = Mock()
+    mock_project.path = project_path
+    mock_project.name = "project"
+    mock_project_cls.locate.return_value = (mock_project, "feature")
+
+    args = Mock()
+    args.space = None
+
+    with patch("gitspaces.modules.cmd_code.runshell.subprocess.run") as mock_run:
+        code_command(args)
+
+    mock_console.prompt_select.assert_not_called()
+    workspace_file = mock_run.call_args[0][0][1]
+    assert workspace_file.endswith("project~feature.code-workspace")
@@ -0,0 +1,46 @@
+"""Integration tests for cmd_exclude module."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+from gitspaces.modules.cmd_exclude import exclude_command
+from gitspaces.modules.project import Project
+
+
+def _args(patterns=None, include=False, remove=False, git_ignored=None):
+    return Mock(patterns=patterns or [], include=include, remove=remove, git_ignored=git_ignored)
+
+
+def test_exclude_command_edits_rules(gitspaces_project, monkeypatch, capsys):
+    """Test adding, re-including and removing patterns."""
+    project_path = gitspaces_project["project_path"]
+    monkeypatch.chdir(gitspaces_project["main_space"])
+
+    exclude_command(_args(["node_modules/", "*.o"]))
+    exclude_command(_args(["keep.o"], include=True))
+    exclude_command(_args(git_ignored="on"))
+
+    settings = Project(str(project_path)).settings
+    assert settings["exclude"] == ["node_modules/", "*.o"]
+    assert settings["include"] == ["keep.o"]
+    assert settings["exclude_ignored"] is True
+
+    exclude_command(_args(["*.o", "keep.o"], remove=True))
+
+    settings = Project(str(project_path)).settings
+    assert settings["exclude"] == ["node_modules/"]
+    assert "include" not in settings
+
+    captured = capsys.readouterr()
+    assert "Exclude: node_modules/" in captured.out
+    assert "Skip git-ignored files: True" in captured.out
+
+
+def test_exclude_command_not_in_project(temp_home, monkeypatch, capsys):
+    """Test exclude command outside a project."""
+    monkeypatch.chdir(temp_home)
+
+    exclude_command(_args())
+
+    captured = capsys.readouterr()
+    assert "Not in a GitSpaces project" in captured.out
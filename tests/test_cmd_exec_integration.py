@@ -0,0 +1,102 @@
+"""Integration tests for cmd_exec module."""
+
+from __future__ import annotations
+
+import sys
+from unittest.mock import Mock
+import pytest
+from gitspaces.modules.cmd_exec import exec_command
+from gitspaces.modules.config import Config
+
+PRINT_CWD = [sys.executable, "-c", "import os; print(os.path.basename(os.getcwd()))"]
+
+
+def _args(command, **kwargs):
+    defaults = dict(all_projects=False, active=False, sleeping=False, jobs=4, buffer=False)
+    defaults.update(kwargs)
+    return Mock(exec_args=["--", *command], **defaults)
+
+
+def test_exec_prefixes_output(gitspaces_project, monkeypatch, capsys):
+    """Test each line is prefixed with its space and a summary follows."""
+    monkeypatch.chdir(gitspaces_project["main_space"])
+
+    exec_command(_args(PRINT_CWD))
+
+    out = capsys.readouterr().out
+    assert "main    | main" in out
+    assert "feature | feature" in out
+    assert "2 spaces: 2 succeeded, 0 failed" in out
+
+
+def test_exec_buffers_output(gitspaces_project, monkeypatch, capsys):
+    """Test --buffer prints each space's output as one block under a header."""
+    monkeypatch.chdir(gitspaces_project["main_space"])
+    script = "import os; print('one'); print(os.path.basename(os.getcwd()))"
+
+    exec_command(_args([sys.executable, "-c", script], buffer=True))
+
+    out = capsys.readouterr().out
+    assert "==> main <==\none\nmain\n" in out
+    assert "==> feature <==\none\nfeature\n" in out
+
+
+def test_exec_exit_status(gitspaces_project, monkeypatch, capsys):
+    """Test the exit status is the highest status of any space."""
+    monkeypatch.chdir(gitspaces_project["main_space"])
+    script = "import os; raise SystemExit(4 if os.getcwd().endswith('feature') else 0)"
+
+    with pytest.raises(SystemExit) as exc_info:
+        exec_command(_args([sys.executable, "-c", script]))
+
+    assert exc_info.value.code == 4
+    out = capsys.readouterr().out
+    assert "exited with 4" in out
+    assert "1 succeeded, 1 failed" in out
+
+
+def test_exec_sleeping_spaces(gitspaces_project_with_sleepers, monkeypatch, capsys):
+    """Test --sleeping and --active pick spaces by state."""
+    monkeypatch.chdir(gitspaces_project_with_sleepers["main_space"])
+
+    exec_command(_args(PRINT_CWD, sleeping=True))
+    out = capsys.readouterr().out
+    assert ".zzz/zzz-0 | zzz-0" in out
+    assert "main |" not in out
+
+    exec_command(_args(PRINT_CWD, active=True))
+    out = capsys.readouterr().out
+    assert "main | main" in out
+    assert "zzz" not in out
+
+
+def test_exec_all_projects(multiple_projects, monkeypatch, capsys):
+    """Test --all-projects runs in every project and labels lines with the project."""
+    Config.instance()._data = {"project_paths": [str(multiple_projects["projects_dir"])]}
+    monkeypatch.chdir(multiple_projects["projects_dir"])
+
+    exec_command(_args(PRINT_CWD, all_projects=True))
+
+    out = capsys.readouterr().out
+    assert "project-alpha/main" in out
+    assert "project-gamma/main" in out
+
+
+def test_exec_outside_project(temp_home, monkeypatch, capsys):
+    """Test exec outside a project asks for --all-projects."""
+    monkeypatch.chdir(temp_home)
+
+    with pytest.raises(SystemExit) as exc_info:
+        exec_command(_args(PRINT_CWD))
+
+    assert exc_info.value.code == 1
+    assert "--all-projects" in capsys.readouterr().out
+
+
+def test_exec_without_command(gitspaces_project, capsys):
+    """Test a missing command is a usage error."""
+    with pytest.raises(SystemExit) as exc_info:
+        exec_command(_args([]))
+
+    assert exc_info.value.code == 2
+    assert "No command given" in capsys.readouterr().out
@@ -30,6 +30,20 @@ def test_extend_command_with_defaults(gitspaces_project, monkeypatch, capsys):
     assert "Successfully created" in captured.out
 
 
+def test_extend_command_records_new_sleepers(gitspaces_project, monkeypatch):
+    """Test the new sleepers reach the index, and with it the completion cache."""
+    from gitspaces.modules.index import ProjectIndex
+
+    monkeypatch.chdir(gitspaces_project["main_space"])
+    project = gitspaces_project["project"]
+
+    extend_command(Mock(num_spaces=1, space=None))
+
+    recorded = ProjectIndex().spaces(project)
+    assert recorded == project.list_spaces()
+    assert any(name.startswith(".zzz/") for name in recorded)
+
+
 def test_extend_command_with_specific_space(gitspaces_project, monkeypatch, capsys):
     """Test extending from a specific space."""
     project_data = gitspaces_project
@@ -156,3 +170,19 @@ def test_extend_command_multiple_spaces(gitspaces_project, monkeypatch, capsys):
     # Verify success message
     captured = capsys.readouterr()
     assert "Successfully created 3" in captured.out
+
+
+def test_extend_command_uses_current_space(gitspaces_project, monkeypatch, capsys):
+    """Test extending from inside a space duplicates that space."""
+    feature_src = gitspaces_project["project"].path / "feature" / "src"
+    feature_src.mkdir(parents=True, exist_ok=True)
+    monkeypatch.chdir(feature_src)
+
+    args = Mock()
+    args.num_spaces = 1
+    args.space = None
+
+    extend_command(args)
+
+    captured = capsys.readouterr()
+    assert "Using current space 'feature' as source" in captured.out
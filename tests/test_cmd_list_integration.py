@@ -0,0 +1,42 @@
+"""Integration tests for cmd_list module."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+from gitspaces.modules.cmd_list import list_command
+from gitspaces.modules.config import Config
+from gitspaces.modules.index import ProjectIndex
+
+
+def test_list_command_in_project(gitspaces_project, monkeypatch, capsys):
+    """Test listing the spaces of the current project."""
+    monkeypatch.chdir(gitspaces_project["main_space"])
+
+    list_command(Mock(projects=False))
+
+    assert capsys.readouterr().out.split() == ["feature", "main"]
+
+
+def test_list_command_outside_project(multiple_projects, temp_home, monkeypatch, capsys):
+    """Test listing every project's spaces, or project names, outside a project."""
+    monkeypatch.chdir(temp_home)
+    Config.instance()._data = {"project_paths": [str(multiple_projects["projects_dir"])]}
+
+    list_command(Mock(projects=False))
+    assert capsys.readouterr().out.split() == ["main"]
+
+    list_command(Mock(projects=True))
+    assert capsys.readouterr().out.split() == ["project-alpha", "project-beta", "project-gamma"]
+
+
+def test_list_command_recreates_completion_cache(multiple_projects, temp_home, monkeypatch):
+    """Test a deleted completion cache is written again."""
+    monkeypatch.chdir(temp_home)
+    Config.instance()._data = {"project_paths": [str(multiple_projects["projects_dir"])]}
+    list_command(Mock(projects=False))
+    completion_path = ProjectIndex().completion_path
+    completion_path.unlink()
+
+    list_command(Mock(projects=False))
+
+    assert len(completion_path.read_text().splitlines()) == 3
@@ -0,0 +1,60 @@
+"""Integration tests for cmd_mirror module."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+from gitspaces.modules.cmd_clone import clone_command
+from gitspaces.modules.cmd_mirror import mirror_command
+from gitspaces.modules.project import Project
+from gitspaces.modules import mirror
+
+
+def test_mirror_command_add_list_update(gitspaces_config, bare_git_repo, capsys):
+    """Test adding, listing and updating mirrors."""
+    url = str(bare_git_repo)
+
+    mirror_command(Mock(mirror_command="add", url=url))
+    assert mirror.has_mirror(url)
+
+    mirror_command(Mock(mirror_command=None))
+    mirror_command(Mock(mirror_command="update"))
+
+    captured = capsys.readouterr()
+    assert "Mirror ready" in captured.out
+    assert url in captured.out
+    assert "Updated 1 mirror(s)" in captured.out
+
+
+def test_mirror_command_empty(gitspaces_config, capsys):
+    """Test listing when no mirrors are cached."""
+    mirror_command(Mock(mirror_command="update"))
+
+    captured = capsys.readouterr()
+    assert "No mirrors cached" in captured.out
+
+
+def test_clone_uses_mirror(
+    gitspaces_config, bare_git_repo, monkeypatch, mock_console_input, capsys
+):
+    """Test clone borrows objects from an existing mirror without depending on it."""
+    url = str(bare_git_repo)
+    mirror.ensure_mirror(url)
+
+    args = Mock(worktrees=False, filter=None, depth=None, single_branch=False)
+    args.url = url
+    args.num_spaces = 1
+    args.directory = str(gitspaces_config["projects_dir"])
+    mock_console_input(["main"])
+
+    from gitspaces.modules import runshell
+
+    monkeypatch.setattr(runshell.fs, "chdir", lambda x: None)
+    clone_command(args)
+
+    captured = capsys.readouterr()
+    assert "Using local mirror" in captured.out
+
+    project = Project(str(gitspaces_config["projects_dir"] / "bare-repo"))
+    alternates = project.path / "main" / ".git" / "objects" / "info" / "alternates"
+    assert str(mirror.mirror_path(url)) not in alternates.read_text()
+    assert runshell.git.get_remote_url(project.path / "main") == url
@@ -0,0 +1,46 @@
+"""Integration tests for cmd_pool module."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+from gitspaces.modules.cmd_pool import pool_command
+from gitspaces.modules import pool
+
+
+def test_pool_command_set_target(gitspaces_project, monkeypatch, capsys):
+    """Test setting the pool target starts a background worker."""
+    project_data = gitspaces_project
+    monkeypatch.chdir(project_data["main_space"])
+
+    with patch("gitspaces.modules.pool.runshell") as mock_runshell:
+        pool_command(Mock(target=2))
+
+    captured = capsys.readouterr()
+    assert "Pool target for 'test-project' set to 2" in captured.out
+    assert pool.get_target(project_data["project"]) == 2
+    mock_runshell.subprocess.spawn_detached.assert_called_once()
+
+
+def test_pool_command_show_status(gitspaces_project, monkeypatch, capsys):
+    """Test showing the pool target and last worker run."""
+    project_data = gitspaces_project
+    monkeypatch.chdir(project_data["main_space"])
+    pool.set_target(project_data["project"], 1)
+    pool.replenish(project_data["project"])
+
+    pool_command(Mock(target=None))
+
+    captured = capsys.readouterr()
+    assert "Pool target: 1" in captured.out
+    assert "Sleepers: 1" in captured.out
+    assert "Worker: idle (created 1)" in captured.out
+
+
+def test_pool_command_not_in_project(temp_home, monkeypatch, capsys):
+    """Test pool command outside a project."""
+    monkeypatch.chdir(temp_home)
+
+    pool_command(Mock(target=None))
+
+    captured = capsys.readouterr()
+    assert "Not in a GitSpaces project" in captured.out
@@ -0,0 +1,43 @@
+"""Integration tests for cmd_share_objects module."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+from git import Repo
+from gitspaces.modules.cmd_share_objects import share_objects_command, _format_size
+
+
+def test_share_objects_command(gitspaces_project, monkeypatch, capsys):
+    """Test converting a project to a shared object store."""
+    project_data = gitspaces_project
+    monkeypatch.chdir(project_data["main_space"])
+
+    share_objects_command(Mock())
+
+    captured = capsys.readouterr()
+    assert "Reclaimed" in captured.out
+    assert project_data["project"].has_store()
+
+    # Both spaces still see their history through the store
+    for space in ("main_space", "feature_space"):
+        repo = Repo(str(project_data[space]))
+        assert repo.head.commit.message == "Initial commit"
+        repo.close()
+
+
+def test_share_objects_command_not_in_project(temp_home, monkeypatch, capsys):
+    """Test sharing objects when not in a project directory."""
+    monkeypatch.chdir(temp_home)
+
+    share_objects_command(Mock())
+
+    captured = capsys.readouterr()
+    assert "Not in a GitSpaces project" in captured.out
+
+
+def test_format_size():
+    """Test byte count formatting."""
+    assert _format_size(512) == "512 B"
+    assert _format_size(2048) == "2.0 KB"
+    assert _format_size(5 * 1024 * 1024) == "5.0 MB"
+    assert _format_size(3 * 1024**3) == "3.0 GB"
@@ -124,3 +124,80 @@ def test_sleep_command_with_wake_prompt(
     # Verify sleeping space was woken with new name
     assert not sleeping_space.exists()
     assert (project_data["project_path"] / "awakened").exists()
+
+
+def test_sleep_command_rechecks_wake_under_lock(
+    gitspaces_project, monkeypatch, mock_console_confirm, mock_console_select, capsys
+):
+    """Test a sleeper woken by another command while prompting for its name isn't woken again."""
+    import shutil
+
+    project_data = gitspaces_project
+    sleeper = project_data["zzz_dir"] / "sleep1"
+    shutil.copytree(project_data["main_space"], sleeper)
+    monkeypatch.chdir(project_data["main_space"])
+
+    mock_console_confirm([True])
+    mock_console_select([".zzz/sleep1"])
+
+    def name_while_another_command_wakes(message, default=""):
+        sleeper.rename(project_data["project_path"] / "taken")
+        return "awakened"
+
+    from gitspaces.modules.console import Console
+
+    monkeypatch.setattr(Console, "prompt_input", name_while_another_command_wakes)
+
+    sleep_command(Mock(space="feature"))
+
+    assert "Sleeping space '.zzz/sleep1' not found" in capsys.readouterr().out
+    assert not (project_data["project_path"] / "awakened").exists()
+
+
+def test_sleep_command_rechecks_wake_name_under_lock(
+    gitspaces_project, monkeypatch, mock_console_confirm, mock_console_select, capsys
+):
+    """Test waking under a name another command took while prompting is refused."""
+    import shutil
+
+    project_data = gitspaces_project
+    sleeper = project_data["zzz_dir"] / "sleep1"
+    shutil.copytree(project_data["main_space"], sleeper)
+    monkeypatch.chdir(project_data["main_space"])
+
+    mock_console_confirm([True])
+    mock_console_select([".zzz/sleep1"])
+
+    def name_taken_meanwhile(message, default=""):
+        (project_data["project_path"] / "awakened").mkdir()
+        return "awakened"
+
+    from gitspaces.modules.console import Console
+
+    monkeypatch.setattr(Console, "prompt_input", name_taken_meanwhile)
+
+    sleep_command(Mock(space="feature"))
+
+    assert "Space 'awakened' already exists" in capsys.readouterr().out
+    assert sleeper.exists()
+
+
+def test_sleep_command_waits_for_busy_project(gitspaces_project, monkeypatch):
+    """Test sleep gives up if another command holds the project lock."""
+    from gitspaces.modules.config import Config
+    from gitspaces.modules.errors import LockError
+    from gitspaces.modules.lock import FileLock
+
+    project_data = gitspaces_project
+    monkeypatch.chdir(project_data["project_path"])
+    monkeypatch.setattr(Config, "lock_timeout", property(lambda self: 0.1))
+
+    args = Mock()
+    args.space = "main"
+
+    with FileLock(project_data["project_path"] / Project.LOCK_FILE):
+        with pytest.raises(LockError):
+            sleep_command(args)
+
+    # Nothing was moved
+    assert project_data["main_space"].exists()
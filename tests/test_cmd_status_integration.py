@@ -0,0 +1,47 @@
+"""Integration tests for cmd_status module."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import Mock
+from gitspaces.modules.cmd_status import status_command
+from gitspaces.modules.config import Config
+
+
+def _configure(gitspaces_project):
+    Config.instance()._data = {"project_paths": [str(gitspaces_project["project_path"].parent)]}
+
+
+def test_status_command_table(gitspaces_project, capsys):
+    """Test the table lists every space with its state and a summary."""
+    _configure(gitspaces_project)
+    (gitspaces_project["feature_space"] / "new.txt").write_text("new\n")
+
+    status_command(Mock(json=False, jobs=4, refresh=False))
+
+    out = capsys.readouterr().out
+    lines = out.splitlines()
+    assert lines[0].split() == ["PROJECT", "SPACE", "BRANCH", "STATE", "UPSTREAM", "MODIFIED"]
+    feature = next(line for line in lines if " feature " in line)
+    assert "dirty" in feature
+    main = next(line for line in lines if " main " in line)
+    assert "clean" in main
+    assert "2 spaces in 1 projects: 1 with changes" in out
+
+
+def test_status_command_json(gitspaces_project, capsys):
+    """Test --json prints one object per space."""
+    _configure(gitspaces_project)
+
+    status_command(Mock(json=True, jobs=4, refresh=False))
+
+    rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert sorted(r["space"] for r in rows) == ["feature", "main"]
+    assert all(r["project"] == "test-project" and r["dirty"] is False for r in rows)
+
+
+def test_status_command_no_projects(temp_home, gitspaces_config, capsys):
+    """Test status without any projects."""
+    status_command(Mock(json=False, jobs=4, refresh=False))
+
+    assert "No spaces found" in capsys.readouterr().out
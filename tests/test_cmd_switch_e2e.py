@@ -30,7 +30,7 @@ class TestSwitchE2E:
         # Track what choices are offered
         choices_offered = []
 
-        def capture_select(message, choices, default=None):
+        def capture_select(message, choices, default=None, annotations=None):
             choices_offered.extend(choices)
             return choices[0] if choices else default
 
@@ -68,7 +68,7 @@ class TestSwitchE2E:
         # Track what choices are offered
         choices_offered = []
 
-        def capture_select(message, choices, default=None):
+        def capture_select(message, choices, default=None, annotations=None):
             choices_offered.extend(choices)
             # Return the first non-wake option to avoid triggering wake flow
             for c in choices:
@@ -105,7 +105,7 @@ class TestSwitchE2E:
         # Track what choices are offered
         choices_offered = []
 
-        def capture_select(message, choices, default=None):
+        def capture_select(message, choices, default=None, annotations=None):
             choices_offered.extend(choices)
             # Return first non-wake option
             for c in choices:
@@ -141,7 +141,7 @@ class TestSwitchE2E:
         # Track what choices are offered
         choices_offered = []
 
-        def capture_select(message, choices, default=None):
+        def capture_select(message, choices, default=None, annotations=None):
             choices_offered.extend(choices)
             return choices[0] if choices else default
 
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
+import time
 from pathlib import Path
 from unittest.mock import Mock
 import pytest
+import gitspaces
 from gitspaces.modules.cmd_switch import switch_command
 
 
@@ -66,6 +71,80 @@ def test_switch_command_interactive_select(gitspaces_project, monkeypatch, mock_
     assert "feature" in str(chdir_called_with[0])
 
 
+def test_switch_command_annotates_menu(gitspaces_project, monkeypatch):
+    """Test the interactive menu gets status annotations for the spaces it lists."""
+    monkeypatch.chdir(gitspaces_project["main_space"])
+    offered = {}
+
+    def select_with_annotations(message, choices, default=None, annotations=None):
+        annotations.start(lambda space, note: offered.update({space: note}))
+        for thread in annotations.threads:
+            thread.join(10)
+        annotations.cancel()
+        return choices[0]
+
+    from gitspaces.modules import runshell
+    from gitspaces.modules.console import Console
+
+    monkeypatch.setattr(Console, "prompt_select", select_with_annotations)
+    monkeypatch.setattr(runshell.fs, "chdir", lambda path: None)
+
+    args = Mock()
+    args.space = None
+    switch_command(args)
+
+    assert offered == {"feature": "master, clean"}
+
+
+SLOW_SWITCH_SCRIPT = """
+import sys, time
+from unittest.mock import MagicMock, patch
+from gitspaces.modules.cmd_switch import switch_command
+
+def slow_ask():
+    time.sleep(0.5)  # long enough for the checks to start
+    return "feature"
+
+question = MagicMock()
+question.ask.side_effect = slow_ask
+with patch("questionary.select", return_value=question):
+    start = time.perf_counter()
+    switch_command(MagicMock(space=None))
+    print(f"returned {time.perf_counter() - start:.2f}", flush=True)
+"""
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a shell script as git")
+def test_switch_command_does_not_wait_for_slow_checks(gitspaces_project, tmp_path):
+    """Test a space picked before its status check finishes neither waits for it nor the exit."""
+    fake_bin = tmp_path / "bin"
+    fake_bin.mkdir()
+    fake_git = fake_bin / "git"
+    fake_git.write_text("#!/bin/sh\nexec sleep 30\n")
+    fake_git.chmod(0o755)
+    env = {
+        **os.environ,
+        "PATH": f"{fake_bin}{os.pathsep}{os.environ['PATH']}",
+        "PYTHONPATH": str(Path(gitspaces.__file__).parent.parent),
+    }
+
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", SLOW_SWITCH_SCRIPT],
+        cwd=gitspaces_project["main_space"],
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=25,
+    )
+    elapsed = time.perf_counter() - start
+
+    assert result.returncode == 0, result.stderr
+    assert "Switched to space: feature" in result.stdout
+    assert float(result.stdout.split("returned ")[1].split()[0]) < 5
+    assert elapsed < 10
+
+
 def test_switch_command_not_in_project(temp_home, gitspaces_config, monkeypatch, capsys):
     """Test switching when not in a project directory lists all projects."""
     # Change to home directory (not a project)
@@ -77,6 +77,70 @@ def test_default_editor(tmp_path, monkeypatch):
     assert config.default_editor == "vim"
 
 
+def test_copy_workers(tmp_path, monkeypatch):
+    """Test copy workers property."""
+    Config._instance = None
+    Config._config_dir = None
+    Config._config_file = None
+    Config._data = {}
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    config = Config.instance()
+
+    # Default scales with the CPU count
+    assert config.copy_workers >= 1
+
+    config.copy_workers = 8
+    assert config.copy_workers == 8
+
+    # Values set through 'gitspaces config' arrive as strings
+    config.set("copy_workers", "4")
+    assert config.copy_workers == 4
+
+    config.set("copy_workers", "many")
+    assert config.copy_workers >= 1
+
+
+def test_discovery_settings(tmp_path, monkeypatch):
+    """Test project discovery depth and exclusion properties."""
+    Config._instance = None
+    Config._config_dir = None
+    Config._config_file = None
+    Config._data = {}
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    config = Config.instance()
+
+    assert config.discovery_depth == 3
+    assert config.discovery_exclude == []
+
+    config.set("discovery_depth", "2")
+    assert config.discovery_depth == 2
+    config.set("discovery_depth", "deep")
+    assert config.discovery_depth == 3
+
+    config.set("discovery_exclude", "node_modules, archive/*")
+    assert config.discovery_exclude == ["node_modules", "archive/*"]
+    config.discovery_exclude = ["vendor"]
+    assert config.discovery_exclude == ["vendor"]
+
+
+def test_lock_timeout(tmp_path, monkeypatch):
+    """Test lock timeout property."""
+    Config._instance = None
+    Config._config_dir = None
+    Config._config_file = None
+    Config._data = {}
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    config = Config.instance()
+
+    assert config.lock_timeout == 60
+    config.set("lock_timeout", "2.5")
+    assert config.lock_timeout == 2.5
+    config.set("lock_timeout", "forever")
+    assert config.lock_timeout == 60
+    config.lock_timeout = 0
+    assert config.lock_timeout == 0
+
+
 def test_config_save_load(tmp_path, monkeypatch):
     """Test saving and loading configuration."""
     Config._instance = None
@@ -110,6 +174,35 @@ def test_config_save_load(tmp_path, monkeypatch):
     assert config2.default_editor == "emacs"
 
 
+def test_config_load_uses_parse_cache(tmp_path, monkeypatch):
+    """Test an unchanged config.yaml is read from the JSON cache without PyYAML."""
+    from unittest.mock import patch
+    import os
+
+    Config._instance = None
+    Config._config_dir = None
+    Config._config_file = None
+    Config._data = {}
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    config = Config.instance()
+    config.project_paths = ["/test/path1"]
+    config.save()
+
+    config.load()
+    assert (config.config_dir / Config.CACHE_FILE).exists()
+
+    with patch("yaml.safe_load", side_effect=AssertionError("parsed again")):
+        config.load()
+    assert config.project_paths == ["/test/path1"]
+
+    # Changing the file invalidates the cache
+    config.config_file.write_text("project_paths:\n- /test/path2\n")
+    st = config.config_file.stat()
+    os.utime(config.config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    config.load()
+    assert config.project_paths == ["/test/path2"]
+
+
 def test_config_get_set(tmp_path, monkeypatch):
     """Test generic get/set methods."""
     Config._instance = None
@@ -98,3 +98,31 @@ class TestConsole:
         result = Console.prompt_select("Choose:", ["Option 1", "Option 2"], default="Option 1")
 
         assert result == "Option 1"
+
+    @patch("questionary.select")
+    def test_prompt_select_with_annotations(self, mock_select):
+        """Test notes are written into the choice titles and the source is cancelled."""
+        annotations = MagicMock()
+        annotations.start.side_effect = lambda update: update("main", "main, dirty")
+        mock_select.return_value.ask.return_value = "main"
+
+        result = Console.prompt_select("Choose:", ["main", "feature-x"], annotations=annotations)
+
+        assert result == "main"
+        items = mock_select.call_args.kwargs["choices"]
+        assert [item.value for item in items] == ["main", "feature-x"]
+        assert items[0].title == "main       main, dirty"
+        assert items[1].title == "feature-x"
+        mock_select.return_value.application.invalidate.assert_called_once()
+        annotations.cancel.assert_called_once()
+
+    @patch("questionary.select")
+    def test_prompt_select_cancels_annotations_on_interrupt(self, mock_select):
+        """Test pending notes are cancelled when the prompt is interrupted."""
+        annotations = MagicMock()
+        mock_select.return_value.ask.side_effect = KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            Console.prompt_select("Choose:", ["main"], annotations=annotations)
+
+        annotations.cancel.assert_called_once()
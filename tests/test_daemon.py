@@ -0,0 +1,199 @@
+"""Tests for daemon module."""
+
+import os
+import socket
+import threading
+import time
+import pytest
+from gitspaces.modules import daemon
+from gitspaces.modules.console import Console
+from gitspaces.modules.lock import FileLock
+from gitspaces.modules.project import Project
+
+pytestmark = pytest.mark.skipif(not daemon.available(), reason="needs Unix domain sockets")
+
+
+@pytest.fixture
+def daemon_project(gitspaces_project, gitspaces_config, monkeypatch):
+    """A project with a configuration the CLI accepts without running setup."""
+    config_dir = gitspaces_config["config_dir"]
+    (config_dir / "config.yaml").write_text(
+        f"project_paths:\n- {gitspaces_config['projects_dir']}\n"
+    )
+    monkeypatch.delenv(daemon.DISABLE_ENV, raising=False)
+    return gitspaces_project
+
+
+@pytest.fixture
+def running_daemon(temp_home):
+    """A daemon serving on the default socket from a background thread."""
+    server = daemon.Daemon()
+    server.listen()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    if thread.is_alive():
+        daemon.request(["daemon", "stop"])
+    thread.join(5)
+
+
+def test_command_name():
+    """Test the command is the first non-option argument, defaulting to switch."""
+    assert daemon.command_name(["switch", "main"]) == "switch"
+    assert daemon.command_name(["--debug", "config"]) == "config"
+    assert daemon.command_name([]) == "switch"
+    assert daemon.command_name(["--version"]) is None
+
+
+def test_switch_runs_in_daemon(daemon_project, running_daemon):
+    """Test a switch by name runs in the daemon and targets the client's shell."""
+    cwd = str(daemon_project["main_space"])
+
+    status, output = daemon.request(["switch", "feature"], cwd=cwd, shell_pid="4242")
+
+    assert status == 0
+    assert "✓ Switched to space: feature" in output
+    pid_file = daemon.shell_targets_dir() / "pid-4242"
+    assert pid_file.read_text() == str(daemon_project["feature_space"])
+    assert os.getcwd() != str(daemon_project["feature_space"])
+
+
+def test_prompting_command_is_declined(daemon_project, running_daemon):
+    """Test a command that needs a prompt is handed back to the client."""
+    cwd = str(daemon_project["main_space"])
+
+    assert daemon.request(["switch"], cwd=cwd) is None
+
+    # The daemon restores its console afterwards
+    assert Console.__dict__["prompt_select"].__func__ is not daemon._needs_terminal
+
+
+def test_slow_command_is_declined(daemon_project, running_daemon):
+    """Test commands outside DAEMON_COMMANDS aren't run by the daemon."""
+    cwd = str(daemon_project["main_space"])
+
+    assert daemon.request(["sleep", "feature"], cwd=cwd) is None
+    assert daemon_project["feature_space"].exists()
+
+
+def test_usage_error_status(daemon_project, running_daemon):
+    """Test argparse errors come back with their exit status and message."""
+    status, output = daemon.request(["switch", "a", "b"], cwd=str(daemon_project["main_space"]))
+
+    assert status == 2
+    assert "unrecognized arguments" in output
+
+
+def test_status_and_stop(running_daemon):
+    """Test the daemon reports its status and stops on request."""
+    status, output = daemon.request(["daemon", "status"])
+    assert status == 0
+    assert f"pid {os.getpid()}" in output
+
+    assert daemon.request(["daemon", "stop"]) == (0, "✓ Daemon stopped\n")
+    assert not daemon.is_running()
+
+
+def test_forward_without_daemon(temp_home):
+    """Test forward() leaves the command to the caller when no daemon is running."""
+    assert daemon.forward(["switch", "main"]) is None
+
+
+def test_forward_with_stale_socket(temp_home):
+    """Test a socket left behind by a dead daemon is ignored and replaced."""
+    path = daemon.socket_path()
+    path.parent.mkdir(parents=True)
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(path))
+    stale.close()
+
+    assert daemon.forward(["switch", "main"]) is None
+
+    server = daemon.Daemon()
+    server.listen()
+    assert daemon.is_running()
+    server._server.close()
+
+
+def test_forward_prints_output(daemon_project, running_daemon, monkeypatch, capsys):
+    """Test forward() prints the daemon's output and returns its status."""
+    monkeypatch.chdir(daemon_project["main_space"])
+    monkeypatch.setenv("GITSPACES_SHELL_PID", "4343")
+
+    assert daemon.forward(["switch", "feature"]) == 0
+
+    assert "✓ Switched to space: feature" in capsys.readouterr().out
+    assert (daemon.shell_targets_dir() / "pid-4343").exists()
+
+
+def test_forward_disabled(daemon_project, running_daemon, monkeypatch):
+    """Test GITSPACES_NO_DAEMON bypasses a running daemon."""
+    monkeypatch.setenv(daemon.DISABLE_ENV, "1")
+
+    assert daemon.forward(["switch", "feature"]) is None
+
+
+def test_listen_refuses_second_daemon(running_daemon):
+    """Test a second daemon doesn't take over a live socket."""
+    with pytest.raises(daemon.GitSpacesError):
+        daemon.Daemon().listen()
+
+
+def test_command_error_is_reported(daemon_project, running_daemon, monkeypatch):
+    """Test an exception from a command is sent to the client and the daemon keeps serving."""
+    from gitspaces import cli
+
+    def failing_run(argv):
+        raise daemon.GitSpacesError("boom")
+
+    monkeypatch.setattr(cli, "run", failing_run)
+    cwd = str(daemon_project["main_space"])
+
+    assert daemon.request(["switch", "feature"], cwd=cwd) == (1, "✗ boom\n")
+    assert daemon.is_running()
+
+
+def test_busy_project_is_declined(daemon_project, running_daemon):
+    """Test a command that needs a locked project is handed back instead of waiting."""
+    project = daemon_project["project"]
+    cwd = str(daemon_project["main_space"])
+
+    start = time.monotonic()
+    with FileLock(project.path / Project.LOCK_FILE):
+        assert daemon.request(["switch", "feature"], cwd=cwd) is None
+
+    assert time.monotonic() - start < 5
+    assert Project.__dict__["lock"].__name__ == "lock"
+
+
+def test_stuck_client_times_out(daemon_project, temp_home, monkeypatch):
+    """Test a client that never finishes its request doesn't block the next one."""
+    monkeypatch.setattr(daemon, "CONNECTION_TIMEOUT", 0.3)
+    server = daemon.Daemon()
+    server.listen()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stuck:
+        stuck.connect(str(daemon.socket_path()))
+        status, _ = daemon.request(
+            ["switch", "feature"], cwd=str(daemon_project["main_space"]), timeout=5
+        )
+
+    assert status == 0
+    daemon.request(["daemon", "stop"])
+    thread.join(5)
+
+
+def test_request_times_out(temp_home):
+    """Test the client gives up on a daemon that doesn't answer."""
+    path = daemon.socket_path()
+    path.parent.mkdir(parents=True)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as silent:
+        silent.bind(str(path))
+        silent.listen()
+
+        with pytest.raises(OSError):
+            daemon.request(["list"], path=path, timeout=0.2)
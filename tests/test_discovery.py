@@ -0,0 +1,70 @@
+"""Tests for discovery module."""
+
+import os
+from gitspaces.modules.discovery import discover_projects
+from gitspaces.modules.project import Project
+
+
+def _make_project(path):
+    path.mkdir(parents=True)
+    (path / Project.DOTFILE).touch()
+    (path / Project.ZZZ_DIR).mkdir()
+    return path
+
+
+def test_discover_nested_projects(tmp_path):
+    """Test projects are found up to max_depth levels down."""
+    _make_project(tmp_path / "top")
+    _make_project(tmp_path / "org" / "repo")
+    _make_project(tmp_path / "a" / "b" / "deep")
+
+    found = discover_projects(str(tmp_path), max_depth=2)
+
+    assert found.projects == [str(tmp_path / "org" / "repo"), str(tmp_path / "top")]
+    assert str(tmp_path / "org") in found.dirs
+    assert found.elapsed >= 0
+
+    found = discover_projects(str(tmp_path), max_depth=3)
+    assert str(tmp_path / "a" / "b" / "deep") in found.projects
+
+
+def test_discover_does_not_descend_into_projects(tmp_path):
+    """Test the spaces and .zzz of a project aren't listed."""
+    project = _make_project(tmp_path / "proj")
+    _make_project(project / "main" / "vendored")
+    _make_project(project / Project.ZZZ_DIR / "zzz-0" / "inner")
+
+    found = discover_projects(str(tmp_path), max_depth=5)
+
+    assert found.projects == [str(project)]
+    assert set(found.dirs) == {str(tmp_path)}
+
+
+def test_discover_skips_git_and_excluded(tmp_path):
+    """Test .git and directories matching exclusion globs are skipped."""
+    _make_project(tmp_path / ".git" / "hidden")
+    _make_project(tmp_path / "node_modules" / "pkg")
+    _make_project(tmp_path / "archive" / "old" / "repo")
+    _make_project(tmp_path / "keep" / "repo")
+
+    found = discover_projects(str(tmp_path), max_depth=3, exclude=["node_modules", "archive/*"])
+
+    assert found.projects == [str(tmp_path / "keep" / "repo")]
+
+
+def test_discover_follows_symlink_loops_once(tmp_path):
+    """Test a symlink back to an ancestor doesn't loop."""
+    _make_project(tmp_path / "org" / "repo")
+    os.symlink(tmp_path, tmp_path / "org" / "loop")
+
+    found = discover_projects(str(tmp_path), max_depth=10)
+
+    assert found.projects == [str(tmp_path / "org" / "repo")]
+
+
+def test_discover_missing_root(tmp_path):
+    """Test a missing root finds nothing."""
+    found = discover_projects(str(tmp_path / "missing"))
+
+    assert found.projects == []
+    assert found.dirs == {}
@@ -1,7 +1,13 @@
 """Tests for error classes."""
 
 import pytest
-from gitspaces.modules.errors import GitSpacesError, ConfigError, ProjectError, SpaceError
+from gitspaces.modules.errors import (
+    GitSpacesError,
+    ConfigError,
+    ProjectError,
+    SpaceError,
+    LockError,
+)
 
 
 def test_gitspaces_error():
@@ -30,3 +36,10 @@ def test_space_error():
     error = SpaceError("Space error")
     assert str(error) == "Space error"
     assert isinstance(error, GitSpacesError)
+
+
+def test_lock_error():
+    """Test LockError exception."""
+    error = LockError("Lock error")
+    assert str(error) == "Lock error"
+    assert isinstance(error, GitSpacesError)
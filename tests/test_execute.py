@@ -0,0 +1,80 @@
+"""Tests for execute module."""
+
+import sys
+import threading
+import time
+from gitspaces.modules import execute
+
+
+def _targets(gitspaces_project):
+    project = gitspaces_project["project"]
+    return [(project, e) for e in project.spaces(refresh=True)]
+
+
+def test_run_in_space_streams_output(gitspaces_project):
+    """Test the command runs in the space and both output streams reach the callback."""
+    project = gitspaces_project["project"]
+    entry = next(e for e in project.spaces() if e.name == "feature")
+    script = "import os, sys; print(os.getcwd()); print('oops', file=sys.stderr); sys.exit(3)"
+    lines = []
+
+    result = execute.run_in_space(project, entry, [sys.executable, "-c", script], lines.append)
+
+    assert result.status == 3
+    assert result.space == "feature" and result.error is None
+    assert sorted(line.strip() for line in lines) == sorted(
+        [str(gitspaces_project["feature_space"]), "oops"]
+    )
+
+
+def test_run_in_space_missing_command(gitspaces_project):
+    """Test a command that doesn't exist gets status 127 and an error."""
+    project = gitspaces_project["project"]
+    entry = project.spaces()[0]
+
+    result = execute.run_in_space(project, entry, ["gitspaces-no-such-command"], print)
+
+    assert result.status == execute.NOT_FOUND
+    assert result.error
+
+
+def test_run_all_runs_concurrently(gitspaces_project):
+    """Test every space runs at once when jobs allow, and results carry each status."""
+    targets = _targets(gitspaces_project)
+    script = (
+        "import os, time; time.sleep(0.5); "
+        "raise SystemExit(os.path.basename(os.getcwd()) == 'feature')"
+    )
+    seen = []
+    lock = threading.Lock()
+
+    def on_line(target, line):
+        with lock:
+            seen.append((target[1].name, line))
+
+    start = time.perf_counter()
+    results = list(execute.run_all(targets, [sys.executable, "-c", script], on_line, jobs=2))
+    elapsed = time.perf_counter() - start
+
+    assert {r.space: r.status for r in results} == {"main": 0, "feature": 1}
+    assert elapsed < 0.95  # two 0.5s commands side by side
+    assert seen == []
+
+
+def test_run_all_respects_jobs(gitspaces_project):
+    """Test jobs=1 runs one space at a time."""
+    targets = _targets(gitspaces_project)
+    script = "import time; time.sleep(0.3)"
+
+    start = time.perf_counter()
+    list(execute.run_all(targets, [sys.executable, "-c", script], lambda t, line: None, jobs=1))
+
+    assert time.perf_counter() - start >= 0.6
+
+
+def test_exit_status_and_description():
+    """Test return codes map to shell-style statuses and are described."""
+    assert execute.exit_status(0) == 0
+    assert execute.exit_status(-15) == 143
+    assert execute.describe_status(143) == "killed by SIGTERM"
+    assert execute.describe_status(2) == "exited with 2"
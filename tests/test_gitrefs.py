@@ -0,0 +1,106 @@
+"""Tests for gitrefs module."""
+
+import subprocess
+import pytest
+from git import Repo
+from gitspaces.modules import gitrefs
+
+
+def _git(path, *args):
+    return subprocess.run(
+        ["git", *args], cwd=path, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo_path(temp_git_repo):
+    """A repository with one commit on its default branch."""
+    return temp_git_repo
+
+
+def test_current_branch_matches_gitpython(repo_path):
+    """Test the branch read from HEAD is the one GitPython reports."""
+    with Repo(repo_path) as repo:
+        expected = repo.active_branch.name
+
+    assert gitrefs.current_branch(repo_path) == expected
+
+
+def test_current_branch_with_slash(repo_path):
+    """Test branch names containing slashes are returned whole."""
+    _git(repo_path, "switch", "-q", "-c", "feature/login")
+
+    assert gitrefs.current_branch(repo_path) == "feature/login"
+
+
+def test_detached_head(repo_path):
+    """Test a detached HEAD is reported as such and resolves to its commit."""
+    sha = _git(repo_path, "rev-parse", "HEAD")
+    _git(repo_path, "switch", "-q", "--detach")
+
+    assert gitrefs.current_branch(repo_path) == "detached"
+    assert gitrefs.head_commit(repo_path) == sha
+
+
+def test_head_commit_from_packed_refs(repo_path):
+    """Test HEAD resolves through packed-refs once loose refs are packed."""
+    sha = _git(repo_path, "rev-parse", "HEAD")
+    _git(repo_path, "pack-refs", "--all")
+    assert not list((repo_path / ".git" / "refs" / "heads").iterdir())
+
+    assert gitrefs.head_commit(repo_path) == sha
+
+
+def test_linked_worktree(repo_path, tmp_path):
+    """Test a worktree's .git file is followed to its own HEAD and the shared refs."""
+    worktree = tmp_path / "wt"
+    _git(repo_path, "worktree", "add", "-q", "-b", "topic", str(worktree))
+    sha = _git(worktree, "rev-parse", "HEAD")
+
+    assert (worktree / ".git").is_file()
+    assert gitrefs.current_branch(worktree) == "topic"
+    assert gitrefs.head_commit(worktree) == sha
+
+
+def test_unborn_branch(tmp_path):
+    """Test a repository without commits has a branch but no HEAD commit."""
+    _git(tmp_path, "init", "-q", "-b", "trunk")
+
+    assert gitrefs.current_branch(tmp_path) == "trunk"
+    assert gitrefs.head_commit(tmp_path) is None
+
+
+def test_not_a_repository(tmp_path):
+    """Test paths without a readable git directory return None."""
+    assert gitrefs.current_branch(tmp_path) is None
+    assert gitrefs.head_commit(tmp_path / "missing") is None
+
+    (tmp_path / ".git").write_text("gitdir: /nonexistent\n")
+    assert gitrefs.git_dir(tmp_path) is None
+
+
+def test_unusual_head_falls_back(tmp_path):
+    """Test a symbolic HEAD outside refs/heads is left to GitPython."""
+    _git(tmp_path, "init", "-q")
+    (tmp_path / ".git" / "HEAD").write_text("ref: refs/remotes/origin/main\n")
+
+    assert gitrefs.current_branch(tmp_path) is None
+
+
+def test_index_paths(repo_path):
+    """Test tracked paths are read from the index, including extended entries."""
+    (repo_path / "docs").mkdir()
+    (repo_path / "docs" / "guide.md").write_text("guide\n")
+    _git(repo_path, "add", "docs")
+    _git(repo_path, "update-index", "--index-version", "3")
+    _git(repo_path, "update-index", "--skip-worktree", "docs/guide.md")
+
+    assert gitrefs.index_paths(repo_path / ".git") == _git(repo_path, "ls-files").splitlines()
+
+
+def test_index_paths_unsupported(repo_path, tmp_path):
+    """Test index version 4 and a missing index aren't guessed at."""
+    _git(repo_path, "update-index", "--index-version", "4")
+
+    assert gitrefs.index_paths(repo_path / ".git") is None
+    assert gitrefs.index_paths(tmp_path) is None
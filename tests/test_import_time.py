@@ -0,0 +1,60 @@
+"""Import-time regression tests for the CLI.
+
+`gs` starts a new interpreter on every directory jump, so building the CLI
+must not import the heavy libraries; commands import them when they need them.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+import gitspaces
+
+HEAVY_MODULES = {"git", "yaml", "rich", "questionary", "prompt_toolkit"}
+
+# Generous for slow CI machines; importing the heavy libraries took ~300ms
+IMPORT_BUDGET_US = 150_000
+
+
+def _import_times(code: str) -> dict[str, int]:
+    """Run code in a fresh interpreter and return cumulative import times in µs.
+
+    Keys keep the indentation -X importtime uses for nested imports.
+    """
+    env = dict(os.environ)
+    src_dir = str(Path(gitspaces.__file__).resolve().parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src_dir, env.get("PYTHONPATH")]))
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # Nested imports are indented further than top-level ones
+        times[name.rstrip()[1:]] = int(cumulative)
+    return times
+
+
+def test_cli_does_not_import_heavy_libraries():
+    """Test building the parser leaves GitPython, PyYAML, rich and questionary unloaded."""
+    times = _import_times("import gitspaces.cli; gitspaces.cli.create_parser()")
+
+    loaded = {name.lstrip().split(".")[0] for name in times}
+    assert not HEAVY_MODULES & loaded
+
+
+def test_cli_import_budget():
+    """Test importing the CLI and its command modules stays within the budget."""
+    times = _import_times("import gitspaces.cli; gitspaces.cli.create_parser()")
+
+    # Top-level entries aren't indented; their cumulative times add up to the total
+    total = sum(t for name, t in times.items() if name.startswith("gitspaces"))
+    assert 0 < total < IMPORT_BUDGET_US
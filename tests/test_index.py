@@ -0,0 +1,196 @@
+"""Tests for index module."""
+
+import json
+import os
+import shutil
+from unittest.mock import patch
+from gitspaces.modules.index import ProjectIndex, record_project
+from gitspaces.modules.project import Project
+
+
+def _bump_mtime(path):
+    """Move a directory's mtime forward so the index sees it as changed."""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_list_projects_scans_and_saves(multiple_projects, tmp_path):
+    """Test a cold lookup scans the project path and writes the index."""
+    index_file = tmp_path / "index.json"
+    roots = [str(multiple_projects["projects_dir"])]
+
+    projects = ProjectIndex(index_file).list_projects(roots)
+
+    assert [p.name for p in projects] == ["project-alpha", "project-beta", "project-gamma"]
+    data = json.loads(index_file.read_text())
+    assert len(data["roots"][roots[0]]["projects"]) == 3
+
+
+def test_list_projects_warm_skips_scan(multiple_projects, tmp_path):
+    """Test an unchanged project path is served from the index."""
+    index_file = tmp_path / "index.json"
+    roots = [str(multiple_projects["projects_dir"])]
+    ProjectIndex(index_file).list_projects(roots)
+
+    with patch("gitspaces.modules.index.discover_projects") as mock_discover:
+        index = ProjectIndex(index_file)
+        projects = index.list_projects(roots)
+
+    mock_discover.assert_not_called()
+    assert index.scans == []
+    assert len(projects) == 3
+
+
+def test_list_projects_rescans_nested_change(multiple_projects, tmp_path):
+    """Test a project added below a nested directory triggers a rescan."""
+    index_file = tmp_path / "index.json"
+    projects_dir = multiple_projects["projects_dir"]
+    org_dir = projects_dir / "org"
+    org_dir.mkdir()
+    roots = [str(projects_dir)]
+    ProjectIndex(index_file).list_projects(roots)
+
+    nested = org_dir / "nested"
+    nested.mkdir()
+    (nested / Project.DOTFILE).touch()
+    _bump_mtime(org_dir)
+
+    index = ProjectIndex(index_file)
+    projects = index.list_projects(roots)
+
+    assert "nested" in [p.name for p in projects]
+    assert len(index.scans) == 1
+
+
+def test_list_projects_rescans_when_depth_changes(multiple_projects, tmp_path):
+    """Test changing the discovery settings invalidates a cached scan."""
+    index_file = tmp_path / "index.json"
+    roots = [str(multiple_projects["projects_dir"])]
+    ProjectIndex(index_file).list_projects(roots, max_depth=1)
+
+    index = ProjectIndex(index_file)
+    index.list_projects(roots, max_depth=2)
+
+    assert len(index.scans) == 1
+
+
+def test_list_projects_rescans_changed_path(multiple_projects, tmp_path):
+    """Test a project path whose mtime changed is rescanned."""
+    index_file = tmp_path / "index.json"
+    projects_dir = multiple_projects["projects_dir"]
+    roots = [str(projects_dir)]
+    ProjectIndex(index_file).list_projects(roots)
+
+    new_project = projects_dir / "project-delta"
+    new_project.mkdir()
+    (new_project / Project.DOTFILE).touch()
+    _bump_mtime(projects_dir)
+
+    projects = ProjectIndex(index_file).list_projects(roots)
+
+    assert "project-delta" in [p.name for p in projects]
+
+
+def test_list_projects_drops_unconfigured_paths(multiple_projects, tmp_path):
+    """Test paths removed from the configuration are forgotten."""
+    index_file = tmp_path / "index.json"
+    roots = [str(multiple_projects["projects_dir"])]
+    ProjectIndex(index_file).list_projects(roots)
+
+    assert ProjectIndex(index_file).list_projects([]) == []
+    assert json.loads(index_file.read_text())["roots"] == {}
+
+
+def test_list_projects_skips_missing_path(tmp_path):
+    """Test a configured path that doesn't exist is ignored."""
+    index = ProjectIndex(tmp_path / "index.json")
+
+    assert index.list_projects([str(tmp_path / "missing")]) == []
+
+
+def test_corrupt_index_is_rebuilt(multiple_projects, tmp_path):
+    """Test an unreadable index is treated as empty."""
+    index_file = tmp_path / "index.json"
+    index_file.write_text("{not json")
+
+    projects = ProjectIndex(index_file).list_projects([str(multiple_projects["projects_dir"])])
+
+    assert len(projects) == 3
+
+
+def test_parsed_index_reused_until_file_changes(multiple_projects, tmp_path):
+    """Test a saved index is reused by later instances until another writer replaces it."""
+    index_file = tmp_path / "index.json"
+    ProjectIndex(index_file).list_projects([str(multiple_projects["projects_dir"])])
+
+    with patch("gitspaces.modules.index.json.loads") as mock_loads:
+        assert ProjectIndex(index_file).data["roots"]
+    mock_loads.assert_not_called()
+
+    # Another process saving the index replaces the file
+    replacement = tmp_path / "index.json.new"
+    replacement.write_text(json.dumps({"version": 2, "roots": {}, "projects": {}}))
+    os.replace(replacement, index_file)
+
+    assert ProjectIndex(index_file).data["roots"] == {}
+
+
+def test_update_project_records_spaces(gitspaces_project, tmp_path):
+    """Test recording a project stores its spaces and adds it to its path."""
+    project = gitspaces_project["project"]
+    index_file = tmp_path / "index.json"
+    roots = [str(project.path.parent)]
+    ProjectIndex(index_file).list_projects(roots)
+
+    ProjectIndex(index_file).update_project(project)
+
+    index = ProjectIndex(index_file)
+    assert index.spaces(project) == project.list_spaces()
+    assert str(project.path) in index.data["roots"][roots[0]]["projects"]
+
+
+def test_scan_records_spaces_for_completion(multiple_projects, tmp_path):
+    """Test a scan records found projects' spaces and writes the completion cache."""
+    index_file = tmp_path / "index.json"
+    projects_dir = multiple_projects["projects_dir"]
+
+    ProjectIndex(index_file).list_projects([str(projects_dir)])
+
+    lines = (tmp_path / ProjectIndex.COMPLETION_FILE).read_text().splitlines()
+    assert lines == [
+        f"{projects_dir.resolve() / p['name']}\tmain" for p in multiple_projects["projects"]
+    ]
+
+
+def test_rescan_forgets_deleted_projects(multiple_projects, tmp_path):
+    """Test projects deleted since the last scan leave the completion cache."""
+    index_file = tmp_path / "index.json"
+    roots = [str(multiple_projects["projects_dir"])]
+    ProjectIndex(index_file).list_projects(roots)
+
+    shutil.rmtree(multiple_projects["projects"][0]["path"])
+    ProjectIndex(index_file).list_projects(roots)
+
+    completions = (tmp_path / ProjectIndex.COMPLETION_FILE).read_text()
+    assert "project-alpha" not in completions
+    assert "project-beta" in completions
+
+
+def test_spaces_unknown_project(gitspaces_project, tmp_path):
+    """Test spaces() returns None for a project that was never recorded."""
+    index = ProjectIndex(tmp_path / "index.json")
+
+    assert index.spaces(gitspaces_project["project"]) is None
+
+
+def test_record_project_uses_config_dir(gitspaces_project, temp_home):
+    """Test record_project writes the default index in the config directory."""
+    record_project(gitspaces_project["project"])
+
+    assert (temp_home / ".gitspaces" / ProjectIndex.FILENAME).exists()
+
+
+def test_record_project_ignores_write_errors(gitspaces_project, tmp_path):
+    """Test a failed index write doesn't raise."""
+    with patch.object(ProjectIndex, "save", side_effect=OSError("read-only")):
+        record_project(gitspaces_project["project"])
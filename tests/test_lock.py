@@ -0,0 +1,33 @@
+"""Tests for lock module."""
+
+import pytest
+from gitspaces.modules.errors import LockError
+from gitspaces.modules.lock import FileLock
+
+
+def test_file_lock_acquire_release(tmp_path):
+    """Test acquiring and releasing a lock."""
+    lock = FileLock(tmp_path / "test.lock")
+
+    with lock:
+        assert lock.locked
+        assert (tmp_path / "test.lock").exists()
+
+    assert not lock.locked
+
+
+def test_file_lock_exclusive_timeout(tmp_path):
+    """Test an exclusive lock blocks a second locker until timeout."""
+    with FileLock(tmp_path / "test.lock"):
+        with pytest.raises(LockError, match="Timed out"):
+            FileLock(tmp_path / "test.lock", timeout=0.1).acquire()
+
+    # Available again once released
+    with FileLock(tmp_path / "test.lock", timeout=0):
+        pass
+
+
+def test_file_lock_creates_parent(tmp_path):
+    """Test the lock file's directory is created if needed."""
+    with FileLock(tmp_path / "nested" / "dir" / "test.lock", timeout=0):
+        assert (tmp_path / "nested" / "dir").is_dir()
@@ -0,0 +1,49 @@
+"""Tests for mirror module."""
+
+from gitspaces.modules import mirror
+from gitspaces.modules.config import Config
+
+
+def test_mirror_path(gitspaces_config):
+    """Test mirrors are stored by a hash of the URL."""
+    path = mirror.mirror_path("https://github.com/test/repo.git")
+
+    assert path.parent == Config.instance().config_dir / "mirrors"
+    assert path == mirror.mirror_path("https://github.com/test/repo.git/")
+    assert path != mirror.mirror_path("https://github.com/test/other.git")
+
+
+def test_ensure_mirror_and_list(gitspaces_config, bare_git_repo):
+    """Test creating, refreshing and listing a mirror."""
+    url = str(bare_git_repo)
+    assert not mirror.has_mirror(url)
+
+    path = mirror.ensure_mirror(url)
+    assert mirror.has_mirror(url)
+    assert (path / "HEAD").exists()
+
+    # Existing mirrors are updated in place
+    assert mirror.ensure_mirror(url) == path
+    assert mirror.list_mirrors() == [(url, path)]
+
+
+def test_reference_for(gitspaces_config, bare_git_repo):
+    """Test clone only uses a mirror when one exists or the cache is enabled."""
+    url = str(bare_git_repo)
+    assert mirror.reference_for(url) is None
+
+    Config.instance().mirror_cache = True
+    assert mirror.reference_for(url) == mirror.mirror_path(url)
+
+    # An existing mirror is used even with the cache turned off
+    Config.instance().mirror_cache = False
+    assert mirror.reference_for(url) == mirror.mirror_path(url)
+
+
+def test_update_all(gitspaces_config, bare_git_repo):
+    """Test refreshing all mirrors."""
+    assert list(mirror.update_all()) == []
+
+    mirror.ensure_mirror(str(bare_git_repo))
+
+    assert list(mirror.update_all()) == [(str(bare_git_repo), None)]
@@ -104,3 +104,14 @@ def test_write_shell_target_with_path_object(temp_home, monkeypatch):
 
     # Cleanup
     pid_file.unlink()
+
+
+def test_write_shell_target_for_shell_pid(temp_home, monkeypatch):
+    """Test write_shell_target uses the wrapper's shell PID when given."""
+    monkeypatch.setenv("GITSPACES_SHELL_PID", "4242")
+
+    write_shell_target("/some/target/path")
+
+    pid_file = temp_home / ".gitspaces" / "pid-4242"
+    assert pid_file.read_text() == "/some/target/path"
+    assert not (temp_home / ".gitspaces" / f"pid-{os.getpid()}").exists()
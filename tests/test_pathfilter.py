@@ -0,0 +1,58 @@
+"""Tests for pathfilter module."""
+
+from gitspaces.modules.pathfilter import PathFilter
+
+
+def test_unanchored_patterns_match_at_any_depth():
+    """Test patterns without a slash match names anywhere."""
+    path_filter = PathFilter(exclude=["*.o", "node_modules/"])
+
+    assert path_filter("main.o", False)
+    assert path_filter("src/lib/util.o", False)
+    assert path_filter("node_modules", True)
+    assert path_filter("web/node_modules", True)
+    assert not path_filter("src/main.c", False)
+
+
+def test_directory_only_patterns():
+    """Test patterns with a trailing slash only match directories."""
+    path_filter = PathFilter(exclude=["target/"])
+
+    assert path_filter("target", True)
+    assert not path_filter("target", False)
+
+
+def test_anchored_and_double_star_patterns():
+    """Test patterns with a slash are relative to the space root."""
+    path_filter = PathFilter(exclude=["/build", "docs/**/*.tmp"])
+
+    assert path_filter("build", True)
+    assert not path_filter("src/build", True)
+    assert path_filter("docs/a.tmp", False)
+    assert path_filter("docs/a/b/c.tmp", False)
+    assert not path_filter("other/a.tmp", False)
+
+
+def test_include_overrides_exclude():
+    """Test include patterns re-include excluded paths."""
+    path_filter = PathFilter(exclude=["*.o"], include=["keep.o"])
+
+    assert path_filter("a.o", False)
+    assert not path_filter("lib/keep.o", False)
+
+
+def test_skip_paths_and_git_dir():
+    """Test exact skip paths, and that .git is never skipped."""
+    path_filter = PathFilter(exclude=[".*"], skip_paths=["dist/", "notes.txt"])
+
+    assert path_filter("dist", True)
+    assert path_filter("notes.txt", False)
+    assert path_filter(".venv", True)
+    assert not path_filter(".git", True)
+    assert not path_filter(".git/config", False)
+
+
+def test_empty_filter_is_falsy():
+    """Test a filter without rules reports itself as empty."""
+    assert not PathFilter(exclude=["", "# comment"], include=["*.o"])
+    assert PathFilter(exclude=["*.o"])
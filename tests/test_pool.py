@@ -0,0 +1,127 @@
+"""Tests for pool module."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+import gitspaces
+from gitspaces.modules import pool
+from gitspaces.modules.index import ProjectIndex
+from gitspaces.modules.lock import FileLock
+
+
+def test_pool_target(gitspaces_project):
+    """Test getting and setting the pool target."""
+    project = gitspaces_project["project"]
+
+    assert pool.get_target(project) == 0
+
+    pool.set_target(project, 2)
+    assert pool.get_target(project) == 2
+
+    project.settings["pool_target"] = "bogus"
+    assert pool.get_target(project) == 0
+
+
+def test_replenish(gitspaces_project):
+    """Test the worker duplicates sleepers up to the target."""
+    project = gitspaces_project["project"]
+    pool.set_target(project, 2)
+
+    created = pool.replenish(project)
+
+    assert created == 2
+    assert pool.count_sleepers(project) == 2
+    status = pool.read_status(project)
+    assert status["state"] == "idle"
+    assert status["created"] == 2
+    assert status["sleepers"] == 2
+
+    # The new sleepers reach the index, and with it the completion cache
+    assert ProjectIndex().spaces(project) == project.list_spaces()
+
+    # Already at target: nothing to do
+    assert pool.replenish(project) == 0
+
+
+WAKE_SCRIPT = """
+import sys
+from gitspaces.modules.errors import LockError
+from gitspaces.modules.project import Project
+from gitspaces.modules.space import Space
+
+project = Project(sys.argv[1])
+try:
+    with project.lock(timeout=0.2):
+        Space(project, sys.argv[2]).wake("woken")
+    print("woken")
+except LockError:
+    print("locked")
+"""
+
+
+def test_replenish_keeps_source_from_being_woken(gitspaces_project_with_sleepers):
+    """Test a wake from another process waits while the worker copies its source sleeper."""
+    project = gitspaces_project_with_sleepers["project"]
+    source_path = gitspaces_project_with_sleepers["sleeper1"]
+    pool.set_target(project, 4)
+    env = {**os.environ, "PYTHONPATH": str(Path(gitspaces.__file__).parent.parent)}
+    wake_results = []
+
+    from gitspaces.modules.space import Space
+
+    original_duplicate = Space.duplicate
+
+    def duplicate_while_waking(self, path):
+        if not wake_results:
+            wake_results.append(
+                subprocess.run(
+                    [sys.executable, "-c", WAKE_SCRIPT, str(project.path), str(source_path)],
+                    env=env,
+                    capture_output=True,
+                    text=True,
+                ).stdout.strip()
+            )
+        return original_duplicate(self, path)
+
+    with patch.object(Space, "duplicate", duplicate_while_waking):
+        created = pool.replenish(project)
+
+    assert wake_results and set(wake_results) == {"locked"}
+    assert created == 2
+    assert source_path.exists()
+    assert pool.read_status(project)["state"] == "idle"
+
+
+def test_replenish_skips_when_locked(gitspaces_project):
+    """Test a second worker exits while another holds the pool lock."""
+    project = gitspaces_project["project"]
+    pool.set_target(project, 1)
+
+    with FileLock(project.zzz_dir / pool.LOCK_FILE):
+        assert pool.is_running(project)
+        assert pool.replenish(project) == 0
+
+    assert pool.count_sleepers(project) == 0
+
+
+def test_replenish_in_background(gitspaces_project):
+    """Test a detached worker is only started below the target."""
+    project = gitspaces_project["project"]
+
+    with patch("gitspaces.modules.pool.runshell") as mock_runshell:
+        # No target configured
+        assert pool.replenish_in_background(project) is False
+
+        pool.set_target(project, 1)
+        assert pool.replenish_in_background(project) is True
+        mock_runshell.subprocess.spawn_detached.assert_called_once_with(
+            [sys.executable, "-m", "gitspaces.modules.pool", str(project.path)]
+        )
+
+
+def test_main_not_a_project(tmp_path, capsys):
+    """Test the worker entry point rejects non-projects."""
+    assert pool.main([str(tmp_path)]) == 1
+    assert pool.main([]) == 2
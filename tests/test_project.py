@@ -1,8 +1,12 @@
 """Tests for project module."""
 
+import shutil
+import subprocess
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 from gitspaces.modules.project import Project
+from gitspaces.modules.space import Space
 from gitspaces.modules.errors import ProjectError
 
 
@@ -81,6 +85,50 @@ def test_find_project_not_found(tmp_path):
     assert result is None
 
 
+def test_locate(tmp_path):
+    """Test locating the project and space holding a path."""
+    project_path = tmp_path / "myproject"
+    project_path.mkdir()
+    (project_path / Project.DOTFILE).touch()
+    (project_path / "main" / "src").mkdir(parents=True)
+    (project_path / ".zzz" / "zzz-0" / "lib").mkdir(parents=True)
+    (project_path / ".zzz" / ".staging-1-zzz-1").mkdir()
+    (project_path / ".vscode").mkdir()
+
+    project, space = Project.locate(project_path / "main" / "src")
+    assert project.path == project_path
+    assert space == "main"
+
+    assert Project.locate(project_path / ".zzz" / "zzz-0" / "lib")[1] == ".zzz/zzz-0"
+    assert Project.locate(project_path)[1] is None
+    assert Project.locate(project_path / ".zzz")[1] is None
+    assert Project.locate(project_path / ".zzz" / ".staging-1-zzz-1")[1] is None
+    assert Project.locate(project_path / ".vscode")[1] is None
+    assert Project.locate(tmp_path) == (None, None)
+
+
+def test_locate_is_cached(tmp_path):
+    """Test locate() walks up from a path once per process."""
+    project_path = tmp_path / "myproject"
+    (project_path / "main").mkdir(parents=True)
+    (project_path / Project.DOTFILE).touch()
+
+    first, _ = Project.locate(project_path / "main")
+    with patch.object(Project, "_search_upward") as mock_search:
+        second, space = Project.locate(project_path / "main")
+        assert Project.find_project(str(project_path / "main")).path == project_path
+
+    mock_search.assert_not_called()
+    assert space == "main"
+    # Each call gets its own Project, so remembered space lists aren't shared
+    assert first is not second
+
+    Project.clear_location_cache()
+    with patch.object(Project, "_search_upward", return_value=None) as mock_search:
+        assert Project.locate(project_path / "main") == (None, None)
+    mock_search.assert_called_once()
+
+
 def test_list_spaces(tmp_path):
     """Test listing spaces in a project."""
     project_path = tmp_path / "testproject"
@@ -104,3 +152,439 @@ def test_list_spaces(tmp_path):
     assert ".zzz/zzz-0" in spaces
     assert ".zzz/zzz-1" in spaces
     assert len(spaces) == 4
+
+
+def test_spaces_entries(tmp_path):
+    """Test spaces() returns typed entries and skips hidden entries and files."""
+    project_path = tmp_path / "testproject"
+    project = Project(str(project_path))
+    project_path.mkdir()
+    project.dotfile.touch()
+    project.zzz_dir.mkdir()
+    (project_path / "main").mkdir()
+    (project_path / ".vscode").mkdir()
+    (project_path / "notes.txt").touch()
+    (project.zzz_dir / "zzz-0").mkdir()
+    (project.zzz_dir / ".staging-1-zzz-1").mkdir()
+
+    spaces = project.spaces()
+
+    assert [s.name for s in spaces] == [".zzz/zzz-0", "main"]
+    sleeper, main = spaces
+    assert sleeper.sleeping and not main.sleeping
+    assert main.path == project_path / "main"
+    assert main.inode == (project_path / "main").stat().st_ino
+    assert main.mtime_ns == (project_path / "main").stat().st_mtime_ns
+    assert [s.name for s in project.spaces(sleeping=False)] == ["main"]
+    assert [s.name for s in project.spaces(sleeping=True)] == [".zzz/zzz-0"]
+
+
+def test_spaces_memoized(tmp_path):
+    """Test spaces() is remembered until invalidated or refreshed."""
+    project_path = tmp_path / "testproject"
+    project = Project(str(project_path))
+    project_path.mkdir()
+    (project_path / "main").mkdir()
+
+    assert len(project.spaces()) == 1
+
+    (project_path / "feature").mkdir()
+    assert len(project.spaces()) == 1
+    assert len(project.spaces(refresh=True)) == 2
+
+    (project_path / "other").mkdir()
+    project.invalidate_spaces()
+    assert len(project.spaces()) == 3
+
+
+def test_spaces_invalidated_by_space_changes(gitspaces_project):
+    """Test moving a space through Space drops the remembered list."""
+    project = gitspaces_project["project"]
+    names = [s.name for s in project.spaces()]
+    assert "main" in names
+
+    Space(project, project.path / "main").rename("renamed")
+
+    names = [s.name for s in project.spaces()]
+    assert "renamed" in names
+    assert "main" not in names
+
+
+def test_share_objects(gitspaces_project):
+    """Test moving a space's objects into the shared store."""
+    from git import Repo
+
+    project = gitspaces_project["project"]
+    main_space = gitspaces_project["main_space"]
+    feature_space = gitspaces_project["feature_space"]
+
+    # First space moves its objects; nothing is reclaimed yet
+    assert project.share_objects(main_space) == 0
+    assert project.has_store()
+
+    # The copy has the same objects, which are now duplicates
+    assert project.share_objects(feature_space) > 0
+
+    for space_path in (main_space, feature_space):
+        alternates = space_path / ".git" / "objects" / "info" / "alternates"
+        assert alternates.read_text() == "../../../.store.git/objects\n"
+
+        repo = Repo(str(space_path))
+        assert repo.head.commit.message == "Initial commit"
+        repo.close()
+
+    # Sharing again is a no-op
+    assert project.share_objects(main_space) == 0
+
+
+def _git(path, *args):
+    return subprocess.run(
+        ["git", *args], cwd=path, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def test_share_objects_survives_moving_the_project(gitspaces_project, tmp_path):
+    """Test spaces still find the shared history after the project directory moves."""
+    project = gitspaces_project["project"]
+    head = _git(gitspaces_project["main_space"], "rev-parse", "HEAD")
+    project.share_objects(gitspaces_project["main_space"])
+
+    moved = tmp_path / "moved-project"
+    shutil.move(str(project.path), str(moved))
+
+    assert _git(moved / "main", "log", "-1", "--format=%H") == head
+    _git(moved / "main", "fsck", "--no-dangling")
+
+
+def test_share_objects_store_survives_gc(gitspaces_project):
+    """Test git gc in the store keeps every object the spaces use."""
+    project = gitspaces_project["project"]
+    for space in ("main_space", "feature_space"):
+        project.share_objects(gitspaces_project[space])
+
+    refs = _git(project.store_dir, "for-each-ref", "--format=%(refname)", "refs/spaces/")
+    assert len({ref.split("/")[2] for ref in refs.splitlines()}) == 2
+
+    _git(project.store_dir, "gc", "--prune=now", "--quiet")
+
+    for space in ("main_space", "feature_space"):
+        _git(gitspaces_project[space], "fsck", "--no-dangling")
+        assert _git(gitspaces_project[space], "log", "--format=%s") == "Initial commit"
+
+
+def test_shared_space_moves_keep_alternates(gitspaces_project):
+    """Test sleeping and waking a shared space updates its relative alternates path."""
+    from gitspaces.modules.space import Space
+
+    project = gitspaces_project["project"]
+    project.share_objects(gitspaces_project["feature_space"])
+
+    sleeping = Space(project, gitspaces_project["feature_space"]).sleep()
+    alternates = sleeping.path / ".git" / "objects" / "info" / "alternates"
+    assert alternates.read_text() == "../../../../.store.git/objects\n"
+    _git(sleeping.path, "fsck", "--no-dangling")
+
+    woken = sleeping.wake("feature-again")
+    assert (woken.path / ".git" / "objects" / "info" / "alternates").read_text() == (
+        "../../../.store.git/objects\n"
+    )
+    _git(woken.path, "fsck", "--no-dangling")
+
+
+def test_link_store_replaces_absolute_entry(gitspaces_project):
+    """Test an absolute store path from older versions becomes relative, keeping others."""
+    project = gitspaces_project["project"]
+    space = gitspaces_project["main_space"]
+    alternates = space / ".git" / "objects" / "info" / "alternates"
+    alternates.parent.mkdir(parents=True, exist_ok=True)
+    alternates.write_text(f"/elsewhere/objects\n{project.store_dir.resolve() / 'objects'}\n")
+
+    assert project.link_store(space, create=False) is True
+    assert alternates.read_text() == "/elsewhere/objects\n../../../.store.git/objects\n"
+
+    # Spaces that don't use the store are left alone unless asked
+    assert project.link_store(gitspaces_project["feature_space"], create=False) is False
+
+
+def test_share_objects_not_a_repo(tmp_path):
+    """Test sharing objects for a directory without a .git directory."""
+    project = Project(str(tmp_path / "testproject"))
+    (tmp_path / "testproject" / "space1").mkdir(parents=True)
+
+    assert project.share_objects(tmp_path / "testproject" / "space1") == 0
+    assert not project.has_store()
+
+
+def test_project_settings(tmp_path):
+    """Test project settings are stored in the project dotfile."""
+    project = Project(str(tmp_path / "testproject"))
+    project._init()
+
+    assert project.settings == {}
+    assert project.mode == Project.MODE_CLONE
+
+    project.settings["mode"] = Project.MODE_WORKTREE
+    project.save_settings()
+
+    reloaded = Project(str(tmp_path / "testproject"))
+    assert reloaded.mode == Project.MODE_WORKTREE
+    assert reloaded.exists()
+
+
+def test_create_project_worktrees(temp_git_repo, tmp_path):
+    """Test creating a project whose spaces are worktrees of the store."""
+    from git import Repo
+    from gitspaces.modules.space import Space
+
+    project = Project.create_project(str(tmp_path), str(temp_git_repo), 2, worktrees=True)
+
+    assert project.mode == Project.MODE_WORKTREE
+    assert project.has_store()
+    spaces = project.list_spaces()
+    assert spaces == [".zzz/zzz-0", ".zzz/zzz-1"]
+    for space_name in spaces:
+        assert (project.path / space_name / ".git").is_file()
+        assert (project.path / space_name / "README.md").exists()
+
+    # The first space is on the default branch, tracking origin's
+    with Repo(str(project.path / ".zzz/zzz-0")) as repo:
+        assert repo.active_branch.name == "master"
+        assert repo.active_branch.tracking_branch().name == "origin/master"
+
+    # Moving a worktree keeps it connected to the store
+    woken = Space(project, project.path / ".zzz/zzz-1").wake("feature")
+    renamed = woken.rename("feature2")
+    with Repo(str(renamed.path)) as repo:
+        assert repo.head.commit.message == "Initial commit"
+    with Repo(str(project.store_dir)) as store:
+        assert str(renamed.path) in store.git.worktree("list")
+
+
+def test_create_sleepers_worktrees_loads_settings_once(temp_git_repo, tmp_path):
+    """Test concurrent duplicates in a worktree project all see its mode."""
+    import time
+    import yaml
+    from gitspaces.modules.space import Space
+
+    Project.create_project(str(tmp_path), str(temp_git_repo), 1, worktrees=True)
+    # A fresh instance, so the duplicate threads are the first to load the settings
+    project = Project(str(tmp_path / temp_git_repo.name))
+    source = Space(project, project.path / ".zzz" / "zzz-0")
+    safe_load = yaml.safe_load
+
+    def slow_safe_load(stream):
+        time.sleep(0.2)
+        return safe_load(stream)
+
+    with patch("yaml.safe_load", side_effect=slow_safe_load):
+        spaces = project.create_sleepers(source, 4)
+
+    assert [s.name for s in spaces] == ["zzz-1", "zzz-2", "zzz-3", "zzz-4"]
+    for space in spaces:
+        assert space.copy_method == "worktree"
+        assert (space.path / ".git").is_file()
+
+
+def test_create_sleepers(gitspaces_project):
+    """Test duplicating a space into several sleepers at once."""
+    from gitspaces.modules.space import Space
+
+    project = gitspaces_project["project"]
+    source = Space(project, gitspaces_project["main_space"])
+    progress = []
+
+    spaces = project.create_sleepers(
+        source, 3, on_progress=lambda done, total, space: progress.append((done, total))
+    )
+
+    assert [s.name for s in spaces] == ["zzz-0", "zzz-1", "zzz-2"]
+    assert sorted(progress) == [(1, 3), (2, 3), (3, 3)]
+    for space in spaces:
+        assert (space.path / "README.md").exists()
+
+
+def test_create_sleepers_rolls_back(gitspaces_project):
+    """Test a failed copy removes every sleeper of the batch."""
+    from unittest.mock import patch
+    from gitspaces.modules import runshell
+    from gitspaces.modules.errors import SpaceError
+    from gitspaces.modules.space import Space
+
+    project = gitspaces_project["project"]
+    source = Space(project, gitspaces_project["main_space"])
+    real_copy_tree = runshell.fs.copy_tree
+
+    def flaky_copy_tree(src, dst, **kwargs):
+        if Path(dst).name.endswith("-zzz-1"):
+            Path(dst).mkdir()
+            (Path(dst) / "partial").write_text("half copied")
+            raise OSError("No space left on device")
+        return real_copy_tree(src, dst, **kwargs)
+
+    with patch.object(runshell.fs, "copy_tree", side_effect=flaky_copy_tree):
+        with pytest.raises(SpaceError, match="1 of 3 copies failed"):
+            project.create_sleepers(source, 3)
+
+    assert list(project.zzz_dir.iterdir()) == []
+
+
+def test_copy_filter(gitspaces_project):
+    """Test the copy filter built from project settings."""
+    from gitspaces.modules.space import Space
+
+    project = gitspaces_project["project"]
+    main_space = gitspaces_project["main_space"]
+    assert project.copy_filter(main_space) is None
+
+    (main_space / ".gitignore").write_text("*.log\n")
+    (main_space / "debug.log").write_text("noise")
+    (main_space / "node_modules").mkdir()
+    (main_space / "node_modules" / "dep.js").write_text("dep")
+
+    project.settings["exclude"] = ["node_modules/"]
+    project.settings["exclude_ignored"] = True
+
+    copy = Space(project, main_space).duplicate()
+
+    assert (copy.path / "README.md").exists()
+    assert (copy.path / ".git").is_dir()
+    assert not (copy.path / "node_modules").exists()
+    assert not (copy.path / "debug.log").exists()
+
+
+def test_sweep_staging(tmp_path):
+    """Test abandoned staging directories are removed and hidden from listings."""
+    import os
+
+    project = Project(str(tmp_path / "testproject"))
+    project._init()
+    (project.zzz_dir / "zzz-0").mkdir()
+
+    abandoned = project.zzz_dir / f"{Project.STAGING_PREFIX}999999999-zzz-1"
+    (abandoned / "partial").mkdir(parents=True)
+    in_progress = Project.staging_path_for(project.zzz_dir / "zzz-2")
+    in_progress.mkdir()
+
+    assert project.list_spaces() == [".zzz/zzz-0"]
+
+    assert project.sweep_staging() == [abandoned]
+    assert not abandoned.exists()
+    # Still owned by a running process (this one)
+    assert in_progress.exists()
+    assert in_progress.name == f"{Project.STAGING_PREFIX}{os.getpid()}-zzz-2"
+
+
+def test_allocate_sleeper_paths(tmp_path):
+    """Test sleeper slots are reserved from a counter, not by probing."""
+    project = Project(str(tmp_path / "testproject"))
+    project._init()
+    (project.zzz_dir / "zzz-0").mkdir()
+    (project.zzz_dir / "zzz-3").mkdir()
+
+    # A missing counter starts after the highest slot in use
+    paths = project._allocate_sleeper_paths(2)
+    assert [p.name for p in paths] == ["zzz-4", "zzz-5"]
+    assert (project.path / Project.SLOTS_FILE).read_text() == "6"
+
+    # Reserved slots aren't handed out again, even before they exist on disk
+    assert project._allocate_sleeper_path().name == "zzz-6"
+
+    # Slots that exist anyway are skipped
+    (project.zzz_dir / "zzz-7").mkdir()
+    assert project._allocate_sleeper_path().name == "zzz-8"
+
+    # Allocation doesn't probe the existing sleepers
+    (project.path / Project.SLOTS_FILE).write_text("100")
+    with patch.object(Path, "exists", return_value=False) as mock_exists:
+        assert project._allocate_sleeper_path().name == "zzz-100"
+    assert mock_exists.call_count == 1
+
+
+def test_allocate_sleeper_paths_corrupt_counter(tmp_path):
+    """Test an unreadable counter is rebuilt from the sleepers on disk."""
+    project = Project(str(tmp_path / "testproject"))
+    project._init()
+    (project.zzz_dir / "zzz-2").mkdir()
+    (project.zzz_dir / f"{Project.STAGING_PREFIX}1-zzz-5").mkdir()
+    (project.path / Project.SLOTS_FILE).write_text("garbage")
+
+    assert project._allocate_sleeper_path().name == "zzz-6"
+
+
+def test_allocate_sleeper_paths_concurrent(tmp_path):
+    """Test concurrent allocations never hand out the same slot."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    project = Project(str(tmp_path / "testproject"))
+    project._init()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        batches = list(
+            executor.map(lambda _: Project(str(project.path))._allocate_sleeper_paths(3), range(16))
+        )
+
+    names = [p.name for batch in batches for p in batch]
+    assert len(names) == 48
+    assert len(set(names)) == 48
+
+
+def test_project_lock(tmp_path):
+    """Test the project lock excludes other commands and allows shared readers."""
+    from gitspaces.modules.errors import LockError
+    from gitspaces.modules.lock import FileLock
+
+    project = Project(str(tmp_path / "testproject"))
+    project._init()
+    lock_file = project.path / Project.LOCK_FILE
+
+    with project.lock():
+        # Another process can take neither an exclusive nor a shared lock
+        with pytest.raises(LockError):
+            FileLock(lock_file, timeout=0).acquire()
+        with pytest.raises(LockError):
+            FileLock(lock_file, shared=True, timeout=0).acquire()
+
+    with project.lock(shared=True):
+        with FileLock(lock_file, shared=True, timeout=0):
+            pass
+        with pytest.raises(LockError):
+            FileLock(lock_file, timeout=0).acquire()
+
+    # Released afterwards
+    with FileLock(lock_file, timeout=0):
+        pass
+
+
+def test_project_lock_timeout(tmp_path):
+    """Test waiting for a busy project gives up after the timeout."""
+    from gitspaces.modules.errors import LockError
+    from gitspaces.modules.lock import FileLock
+
+    project = Project(str(tmp_path / "testproject"))
+    project._init()
+
+    with FileLock(project.path / Project.LOCK_FILE):
+        with pytest.raises(LockError, match="in use by another gitspaces command"):
+            with project.lock(timeout=0.1):
+                pass
+
+
+def test_project_lock_reentrant(tmp_path):
+    """Test nested locks in one process share the outer lock."""
+    from gitspaces.modules.errors import LockError
+
+    project = Project(str(tmp_path / "testproject"))
+    project._init()
+
+    with project.lock():
+        # Another Project instance for the same directory nests too
+        with Project(str(project.path)).lock(timeout=0):
+            with project.lock(shared=True, timeout=0):
+                pass
+        assert str(project.path) in Project._held_locks
+    assert str(project.path) not in Project._held_locks
+
+    with project.lock(shared=True):
+        with pytest.raises(LockError, match="upgrade"):
+            with project.lock():
+                pass
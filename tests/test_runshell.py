@@ -1,5 +1,6 @@
 """Tests for runshell module."""
 
+import sys
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
@@ -24,6 +25,57 @@ def test_git_clone_success():
         )
 
 
+def test_git_clone_partial_options():
+    """Test git clone passes partial and shallow clone options."""
+    with patch("gitspaces.modules.runshell.Repo") as mock_repo:
+        runshell.git.clone(
+            "https://github.com/test/repo.git",
+            "/tmp/test",
+            filter="blob:none",
+            depth=1,
+            single_branch=True,
+        )
+        mock_repo.clone_from.assert_called_once_with(
+            "https://github.com/test/repo.git",
+            "/tmp/test",
+            filter="blob:none",
+            depth=1,
+            single_branch=True,
+        )
+
+
+def test_git_clone_bare():
+    """Test bare git clone tracks origin's branches."""
+    with patch("gitspaces.modules.runshell.Repo") as mock_repo:
+        runshell.git.clone("https://github.com/test/repo.git", "/tmp/test", bare=True)
+        mock_repo.clone_from.assert_called_once_with(
+            "https://github.com/test/repo.git", "/tmp/test", bare=True
+        )
+        cloned = mock_repo.clone_from.return_value
+        cloned.remotes.origin.fetch.assert_called_once()
+
+
+def test_git_worktree_add():
+    """Test adding a detached worktree."""
+    with patch("gitspaces.modules.runshell.Repo") as mock_repo:
+        runshell.git.worktree_add("/store", "/space", "abc123", detach=True)
+        repo = mock_repo.return_value.__enter__.return_value
+        repo.git.worktree.assert_called_once_with(
+            "add", "--no-checkout", "--detach", "/space", "abc123"
+        )
+        # The files are checked out separately, outside the registration lock
+        assert mock_repo.call_args_list[-1].args == ("/space",)
+        repo.git.reset.assert_called_once_with("--hard", "--quiet")
+
+
+def test_git_worktree_repair_failure():
+    """Test worktree repair failure."""
+    with patch("gitspaces.modules.runshell.Repo") as mock_repo:
+        mock_repo.side_effect = Exception("Not a repo")
+        with pytest.raises(GitSpacesError, match="repair worktree"):
+            runshell.git.worktree_repair("/store", "/space")
+
+
 def test_git_clone_failure():
     """Test git clone failure."""
     with patch("gitspaces.modules.runshell.Repo") as mock_repo:
@@ -138,18 +190,134 @@ def test_fs_move_inside_src_directory(tmp_path, monkeypatch):
     assert Path.cwd() == dst_dir / "subdir"
 
 
-def test_fs_copy_tree():
-    """Test fs.copy_tree."""
-    with patch("gitspaces.modules.runshell.shutil.copytree") as mock_copytree:
-        runshell.fs.copy_tree("/src", "/dst", symlinks=True)
-        mock_copytree.assert_called_once_with("/src", "/dst", symlinks=True)
+def test_fs_copy_tree(tmp_path):
+    """Test fs.copy_tree copies files, modes and symlinks."""
+    src = tmp_path / "src"
+    (src / "sub").mkdir(parents=True)
+    (src / "file.txt").write_text("test")
+    (src / "sub" / "run.sh").write_text("#!/bin/sh\n")
+    (src / "sub" / "run.sh").chmod(0o755)
+    (src / "link").symlink_to("file.txt")
+
+    method = runshell.fs.copy_tree(src, tmp_path / "dst", symlinks=True)
+
+    dst = tmp_path / "dst"
+    assert (dst / "file.txt").read_text() == "test"
+    assert (dst / "sub" / "run.sh").stat().st_mode & 0o777 == 0o755
+    assert (dst / "link").is_symlink()
+    assert method in {"reflink", "copy_file_range", "copy"}
+
+
+def test_fs_copy_tree_no_symlinks(tmp_path):
+    """Test fs.copy_tree without symlinks copies link targets."""
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "file.txt").write_text("test")
+    (src / "link").symlink_to("file.txt")
+
+    runshell.fs.copy_tree(src, tmp_path / "dst", symlinks=False)
+
+    assert not (tmp_path / "dst" / "link").is_symlink()
+    assert (tmp_path / "dst" / "link").read_text() == "test"
+
+
+def test_fs_copy_tree_many_files_parallel(tmp_path):
+    """Test fs.copy_tree with a worker pool over a nested tree."""
+    src = tmp_path / "src"
+    for d in range(5):
+        sub = src / f"dir{d}" / "nested"
+        sub.mkdir(parents=True)
+        for f in range(20):
+            (sub / f"file{f}.txt").write_text(f"{d}-{f}")
+
+    runshell.fs.copy_tree(src, tmp_path / "dst", workers=4)
+
+    for d in range(5):
+        for f in range(20):
+            copied = tmp_path / "dst" / f"dir{d}" / "nested" / f"file{f}.txt"
+            assert copied.read_text() == f"{d}-{f}"
+
+
+def test_fs_copy_tree_ignore(tmp_path):
+    """Test fs.copy_tree skips ignored entries without walking them."""
+    src = tmp_path / "src"
+    (src / "node_modules" / "pkg").mkdir(parents=True)
+    (src / "node_modules" / "pkg" / "index.js").write_text("x")
+    (src / "lib").mkdir()
+    (src / "lib" / "keep.py").write_text("x")
+    (src / "lib" / "skip.pyc").write_text("x")
+
+    seen = []
+
+    def ignore(rel_path, is_dir):
+        seen.append(rel_path)
+        return rel_path == "node_modules" or rel_path.endswith(".pyc")
+
+    runshell.fs.copy_tree(src, tmp_path / "dst", ignore=ignore)
+
+    assert not (tmp_path / "dst" / "node_modules").exists()
+    assert not (tmp_path / "dst" / "lib" / "skip.pyc").exists()
+    assert (tmp_path / "dst" / "lib" / "keep.py").exists()
+    assert "lib/keep.py" in seen
+    assert "node_modules/pkg" not in seen
+
+
+def test_fs_copy_tree_dst_exists(tmp_path):
+    """Test fs.copy_tree refuses to copy into an existing directory."""
+    src = tmp_path / "src"
+    src.mkdir()
+    (tmp_path / "dst").mkdir()
+
+    with pytest.raises(FileExistsError):
+        runshell.fs.copy_tree(src, tmp_path / "dst")
+
+
+def test_fs_copy_tree_copy_error(tmp_path):
+    """Test fs.copy_tree propagates errors from copy workers."""
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "file.txt").write_text("test")
+
+    with patch.object(runshell._FileCloner, "__call__", side_effect=OSError("disk full")):
+        with pytest.raises(OSError, match="disk full"):
+            runshell.fs.copy_tree(src, tmp_path / "dst")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="FICLONE is Linux-only")
+def test_fs_copy_tree_reflink(tmp_path):
+    """Test fs.copy_tree reports reflink when FICLONE succeeds."""
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "file.txt").write_text("test")
+
+    with patch("fcntl.ioctl") as mock_ioctl, patch.object(runshell.sys, "platform", "linux"):
+        method = runshell.fs.copy_tree(src, tmp_path / "dst")
+
+    assert method == "reflink"
+    assert mock_ioctl.call_args[0][1] == runshell._FICLONE
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="FICLONE is Linux-only")
+def test_fs_copy_tree_falls_back_to_copy(tmp_path):
+    """Test fs.copy_tree falls back to a plain copy when cloning is unsupported."""
+    import errno
+
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.txt").write_text("a")
+    (src / "b.txt").write_text("b")
 
+    unsupported = OSError(errno.EOPNOTSUPP, "Operation not supported")
+    with patch("fcntl.ioctl", side_effect=unsupported) as mock_ioctl:
+        with patch.object(runshell.sys, "platform", "linux"):
+            with patch.object(runshell.os, "copy_file_range", side_effect=unsupported, create=True):
+                method = runshell.fs.copy_tree(src, tmp_path / "dst")
 
-def test_fs_copy_tree_no_symlinks():
-    """Test fs.copy_tree without symlinks."""
-    with patch("gitspaces.modules.runshell.shutil.copytree") as mock_copytree:
-        runshell.fs.copy_tree("/src", "/dst", symlinks=False)
-        mock_copytree.assert_called_once_with("/src", "/dst", symlinks=False)
+    assert method == "copy"
+    assert (tmp_path / "dst" / "a.txt").read_text() == "a"
+    assert (tmp_path / "dst" / "b.txt").read_text() == "b"
+    # Unsupported strategies are only probed once per tree
+    assert mock_ioctl.call_count == 1
 
 
 def test_fs_chdir():
@@ -1,8 +1,10 @@
 """Tests for space module."""
 
+import os
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
+from gitspaces.modules.config import Config
 from gitspaces.modules.space import Space
 from gitspaces.modules.errors import SpaceError
 
@@ -53,6 +55,21 @@ def test_create_space_from_url(mock_runshell):
     assert space.name == "main"
 
 
+@patch("gitspaces.modules.space.runshell")
+def test_create_space_from_url_clone_options(mock_runshell):
+    """Test creating a space passes clone options through."""
+    mock_project = Mock()
+
+    with patch("gitspaces.modules.space.Path.exists", return_value=False):
+        Space.create_space_from_url(
+            mock_project, "https://github.com/test/repo.git", "/test/main", depth=1
+        )
+
+    mock_runshell.git.clone.assert_called_once_with(
+        "https://github.com/test/repo.git", Path("/test/main"), depth=1
+    )
+
+
 @patch("gitspaces.modules.space.runshell")
 def test_create_space_from_url_exists(mock_runshell):
     """Test creating space when path already exists."""
@@ -69,22 +86,68 @@ def test_create_space_from_url_exists(mock_runshell):
 def test_space_duplicate(mock_runshell):
     """Test duplicating a space."""
     mock_project = Mock()
-    mock_project._get_empty_sleeper_path.return_value = Path("/test/project/.zzz/sleep1")
+    mock_project._allocate_sleeper_path.return_value = Path("/test/project/.zzz/sleep1")
 
     space = Space(mock_project, "/test/project/main")
     new_space = space.duplicate()
 
+    staging_path = Path(f"/test/project/.zzz/.staging-{os.getpid()}-sleep1")
     mock_runshell.fs.copy_tree.assert_called_once_with(
-        Path("/test/project/main"), Path("/test/project/.zzz/sleep1"), symlinks=True
+        Path("/test/project/main"),
+        staging_path,
+        symlinks=True,
+        workers=Config.instance().copy_workers,
+        ignore=mock_project.copy_filter.return_value,
     )
+    mock_runshell.fs.rename.assert_called_once_with(staging_path, Path("/test/project/.zzz/sleep1"))
     assert new_space.name == "sleep1"
+    assert new_space.copy_method == mock_runshell.fs.copy_tree.return_value
+
+
+@patch("gitspaces.modules.space.runshell")
+def test_space_duplicate_worktree(mock_runshell):
+    """Test duplicating a space in a worktree project."""
+    mock_project = Mock()
+    mock_project.mode = mock_project.MODE_WORKTREE
+    mock_project.store_dir = Path("/test/project/.store.git")
+    mock_project._allocate_sleeper_path.return_value = Path("/test/project/.zzz/sleep1")
+    mock_runshell.git.get_head_commit.return_value = "abc123"
+
+    space = Space(mock_project, "/test/project/main")
+    new_space = space.duplicate()
+
+    mock_runshell.fs.copy_tree.assert_not_called()
+    staging_path = Path(f"/test/project/.zzz/.staging-{os.getpid()}-sleep1")
+    mock_runshell.git.worktree_add.assert_called_once_with(
+        Path("/test/project/.store.git"), staging_path, "abc123", detach=True
+    )
+    mock_runshell.git.worktree_repair.assert_called_once_with(
+        Path("/test/project/.store.git"), Path("/test/project/.zzz/sleep1")
+    )
+    assert new_space.copy_method == "worktree"
+
+
+@patch("gitspaces.modules.space.runshell")
+def test_space_sleep_worktree_repairs(mock_runshell):
+    """Test moving a worktree space repairs its link to the store."""
+    mock_project = Mock()
+    mock_project.mode = mock_project.MODE_WORKTREE
+    mock_project.zzz_dir = Path("/test/project/.zzz")
+    mock_project.store_dir = Path("/test/project/.store.git")
+    mock_project._allocate_sleeper_path.return_value = Path("/test/project/.zzz/sleep1")
+
+    Space(mock_project, "/test/project/main").sleep()
+
+    mock_runshell.git.worktree_repair.assert_called_once_with(
+        Path("/test/project/.store.git"), Path("/test/project/.zzz/sleep1")
+    )
 
 
 @patch("gitspaces.modules.space.runshell")
 def test_space_duplicate_error(mock_runshell):
     """Test duplicate error handling."""
     mock_project = Mock()
-    mock_project._get_empty_sleeper_path.return_value = Path("/test/project/.zzz/sleep1")
+    mock_project._allocate_sleeper_path.return_value = Path("/test/project/.zzz/sleep1")
     mock_runshell.fs.copy_tree.side_effect = Exception("Copy failed")
 
     space = Space(mock_project, "/test/project/main")
@@ -93,6 +156,43 @@ def test_space_duplicate_error(mock_runshell):
         space.duplicate()
 
 
+def test_space_duplicate_error_removes_partial_copy(tmp_path):
+    """Test a failed duplicate doesn't leave a half-copied staging directory behind."""
+    mock_project = Mock()
+    (tmp_path / "main").mkdir()
+    partial = tmp_path / ".zzz" / "zzz-0"
+
+    def failing_copy_tree(src, dst, **kwargs):
+        Path(dst).mkdir(parents=True)
+        raise OSError("disk full")
+
+    space = Space(mock_project, tmp_path / "main")
+    with patch("gitspaces.modules.space.runshell.fs.copy_tree", side_effect=failing_copy_tree):
+        with pytest.raises(SpaceError, match="disk full"):
+            space.duplicate(partial)
+
+    assert not partial.exists()
+    assert list(partial.parent.iterdir()) == []
+
+
+def test_space_duplicate_error_after_rename_removes_sleeper(tmp_path):
+    """Test a duplicate that can't be connected at its final path is removed again."""
+    mock_project = Mock()
+    mock_project.mode = "clone"
+    (tmp_path / "main").mkdir()
+    (tmp_path / "main" / "README.md").write_text("hello\n")
+    sleeper = tmp_path / ".zzz" / "zzz-0"
+    sleeper.parent.mkdir()
+
+    space = Space(mock_project, tmp_path / "main")
+    with patch.object(Space, "_moved", side_effect=OSError("Not a directory")):
+        with pytest.raises(SpaceError, match="Not a directory"):
+            space.duplicate(sleeper)
+
+    assert not sleeper.exists()
+    assert list(sleeper.parent.iterdir()) == []
+
+
 @patch("gitspaces.modules.space.runshell")
 def test_space_wake(mock_runshell):
     """Test waking a sleeping space."""
@@ -159,7 +259,7 @@ def test_space_sleep(mock_runshell):
     """Test putting space to sleep."""
     mock_project = Mock()
     mock_project.zzz_dir = Path("/test/project/.zzz")
-    mock_project._get_empty_sleeper_path.return_value = Path("/test/project/.zzz/sleep1")
+    mock_project._allocate_sleeper_path.return_value = Path("/test/project/.zzz/sleep1")
 
     space = Space(mock_project, "/test/project/main")
     sleeping_space = space.sleep()
@@ -270,3 +370,14 @@ def test_space_is_sleeping_false(mock_runshell):
 
     space = Space(mock_project, "/test/project/main")
     assert space.is_sleeping() is False
+
+
+def test_space_get_current_branch_reads_head(temp_git_repo):
+    """Test the branch is read from HEAD without opening a GitPython repo."""
+    (temp_git_repo / ".git" / "HEAD").write_text("ref: refs/heads/topic\n")
+    space = Space(Mock(), temp_git_repo)
+
+    with patch("gitspaces.modules.space.runshell") as mock_runshell:
+        assert space.get_current_branch() == "topic"
+
+    mock_runshell.git.get_repo.assert_not_called()
@@ -0,0 +1,277 @@
+"""Tests for status module."""
+
+import subprocess
+import threading
+import time
+from datetime import datetime
+from unittest.mock import Mock, patch
+from gitspaces.modules import status
+from gitspaces.modules.errors import GitSpacesError
+
+
+def _git(path, *args):
+    subprocess.run(["git", *args], cwd=path, check=True, capture_output=True)
+
+
+def _entry(project, name):
+    return next(e for e in project.spaces(refresh=True) if e.name == name)
+
+
+def test_parse_status():
+    """Test branch, changes and upstream distance are read from porcelain v2."""
+    output = (
+        "# branch.oid 0123\n"
+        "# branch.head feature/x\n"
+        "# branch.upstream origin/feature/x\n"
+        "# branch.ab +2 -1\n"
+        "? notes.txt\n"
+    )
+
+    assert status.parse_status(output) == {
+        "branch": "feature/x",
+        "commit": "0123",
+        "upstream": "origin/feature/x",
+        "dirty": True,
+        "ahead": 2,
+        "behind": 1,
+    }
+
+
+def test_parse_status_detached_without_upstream():
+    """Test a clean detached HEAD has no upstream distance."""
+    output = "# branch.oid (initial)\n# branch.head (detached)\n"
+
+    fields = status.parse_status(output)
+
+    assert fields["branch"] == "detached"
+    assert fields["commit"] is None
+    assert (fields["dirty"], fields["ahead"], fields["behind"]) == (False, None, None)
+
+
+def test_space_status_clean_and_dirty(gitspaces_project):
+    """Test a space's status reflects uncommitted changes."""
+    project = gitspaces_project["project"]
+
+    clean = status.space_status(project, _entry(project, "main"))
+    assert clean.dirty is False
+    assert clean.branch
+    assert clean.error is None
+    assert clean.modified <= time.time()
+
+    (gitspaces_project["feature_space"] / "new.txt").write_text("new\n")
+    dirty = status.space_status(project, _entry(project, "feature"))
+    assert dirty.dirty is True
+    assert dirty.project == "test-project"
+
+
+def test_space_status_ahead_behind(gitspaces_project):
+    """Test commits ahead of and behind the upstream are counted."""
+    project = gitspaces_project["project"]
+    main = gitspaces_project["main_space"]
+    identity = ["-c", "user.name=t", "-c", "user.email=t@t"]
+
+    # Track a local branch, then let both sides gain a commit
+    _git(main, "branch", "-q", "base")
+    _git(main, "branch", "-q", "--set-upstream-to", "base")
+    _git(main, *identity, "commit", "-q", "--allow-empty", "-m", "ours")
+    _git(main, *identity, "switch", "-q", "base")
+    _git(main, *identity, "commit", "-q", "--allow-empty", "-m", "theirs")
+    _git(main, "switch", "-q", "-")
+
+    row = status.space_status(project, _entry(project, "main"))
+
+    assert (row.ahead, row.behind) == (1, 1)
+
+
+def test_space_status_reports_errors(gitspaces_project):
+    """Test a space git can't read is reported, not raised."""
+    project = gitspaces_project["project"]
+
+    with patch("gitspaces.modules.status.runshell.git.status", side_effect=GitSpacesError("boom")):
+        row = status.space_status(project, _entry(project, "main"))
+
+    assert row.error == "boom"
+    assert row.dirty is None
+
+
+def test_collect_yields_every_space(gitspaces_project):
+    """Test collect checks every space once."""
+    project = gitspaces_project["project"]
+    targets = [(project, e) for e in project.spaces(refresh=True)]
+
+    rows = list(status.collect(targets, workers=2))
+
+    assert sorted(r.space for r in rows) == ["feature", "main"]
+    assert list(status.collect([])) == []
+
+
+def test_collect_reuses_unchanged_spaces(gitspaces_project):
+    """Test a second run answers unchanged spaces from the project's cache."""
+    project = gitspaces_project["project"]
+    targets = [(project, e) for e in project.spaces(refresh=True)]
+    first = {r.space: r for r in status.collect(targets)}
+    assert (gitspaces_project["project_path"] / ".status-cache.json").exists()
+
+    with patch("gitspaces.modules.status.runshell.git.status") as mock_status:
+        second = {r.space: r for r in status.collect(targets)}
+
+    mock_status.assert_not_called()
+    assert all(r.cached for r in second.values())
+    assert second["main"]._replace(cached=False) == first["main"]
+
+
+def test_collect_rechecks_changed_spaces(gitspaces_project):
+    """Test staging a change, or asking for a refresh, checks a space again."""
+    project = gitspaces_project["project"]
+    targets = [(project, e) for e in project.spaces(refresh=True)]
+    list(status.collect(targets))
+
+    feature = gitspaces_project["feature_space"]
+    (feature / "README.md").write_text("changed\n")
+    _git(feature, "add", "README.md")
+    rows = {r.space: r for r in status.collect(targets)}
+
+    assert rows["feature"].cached is False
+    assert rows["feature"].dirty is True
+    assert rows["main"].cached is True
+
+    assert not any(r.cached for r in status.collect(targets, refresh=True))
+
+
+def test_collect_rechecks_unstaged_edits(gitspaces_project):
+    """Test editing or deleting a tracked file without staging it shows the space as dirty."""
+    project = gitspaces_project["project"]
+    targets = [(project, e) for e in project.spaces(refresh=True)]
+    assert not any(r.dirty for r in status.collect(targets))
+
+    (gitspaces_project["feature_space"] / "README.md").write_text("edited\n")
+    (gitspaces_project["main_space"] / "README.md").unlink()
+    rows = {r.space: r for r in status.collect(targets)}
+
+    assert rows["feature"].cached is False
+    assert rows["feature"].dirty is True
+    assert rows["main"].cached is False
+    assert rows["main"].dirty is True
+
+
+def test_collect_without_readable_index_always_checks(gitspaces_project):
+    """Test spaces whose index gitrefs can't read are never answered from the cache."""
+    project = gitspaces_project["project"]
+    _git(gitspaces_project["main_space"], "update-index", "--index-version", "4")
+    targets = [(project, _entry(project, "main"))]
+    list(status.collect(targets))
+
+    assert next(status.collect(targets)).cached is False
+
+
+def test_collect_rechecks_after_commit(gitspaces_project):
+    """Test a new commit changes the cached branch ref and the commit shown."""
+    project = gitspaces_project["project"]
+    main = gitspaces_project["main_space"]
+    entry = _entry(project, "main")
+    before = next(status.collect([(project, entry)]))
+
+    _git(
+        main,
+        "-c",
+        "user.name=t",
+        "-c",
+        "user.email=t@t",
+        "commit",
+        "-q",
+        "--allow-empty",
+        "-m",
+        "x",
+    )
+    after = next(status.collect([(project, entry)]))
+
+    assert after.cached is False
+    assert after.commit != before.commit
+
+
+def test_status_cache_drops_missing_spaces(gitspaces_project):
+    """Test entries for spaces that were moved away are dropped on save."""
+    project = gitspaces_project["project"]
+    cache = status.StatusCache(project)
+    cache.put(status.SpaceStatus("test-project", "gone", "/nonexistent/gone"), {"/x": 1})
+    cache.put(
+        status.SpaceStatus("test-project", "main", str(gitspaces_project["main_space"])), {"/x": 1}
+    )
+
+    cache.save()
+
+    assert list(status.StatusCache(project).entries) == [str(gitspaces_project["main_space"])]
+
+
+def test_to_json_formats_modified():
+    """Test the JSON form carries an ISO 8601 modified time."""
+    row = status.SpaceStatus("p", "s", "/p/s", modified=1_700_000_000.0)
+
+    assert datetime.fromisoformat(row.to_json()["modified"]).timestamp() == 1_700_000_000
+
+
+def test_annotation():
+    """Test the short description used in menus."""
+    row = status.SpaceStatus("p", "s", "/p/s", branch="main", dirty=True, ahead=2, behind=0)
+
+    assert row.annotation() == "main, dirty, ↑2"
+    assert row._replace(error="boom").annotation() == "status unavailable"
+
+
+def test_status_annotations_report_every_space(gitspaces_project):
+    """Test annotations arrive for each space from the pool, then from the cache."""
+    project = gitspaces_project["project"]
+    targets = [(project, e) for e in project.spaces(refresh=True)]
+    received = {}
+    arrived = threading.Event()
+
+    def update(space, note):
+        received[space] = note
+        if len(received) == len(targets):
+            arrived.set()
+
+    annotations = status.StatusAnnotations(targets, workers=2)
+    annotations.start(update)
+    assert arrived.wait(10)
+    annotations.cancel()
+
+    assert received == {"main": "master, clean", "feature": "master, clean"}
+
+    with patch("gitspaces.modules.status.runshell.git.status") as mock_status:
+        cached = {}
+        status.StatusAnnotations(targets).start(lambda space, note: cached.update({space: note}))
+
+    mock_status.assert_not_called()
+    assert cached == received
+
+
+def test_status_annotations_cancel_drops_pending(gitspaces_project):
+    """Test cancel() terminates running checks, skips the rest and ignores late results."""
+    project = gitspaces_project["project"]
+    targets = [(project, e) for e in project.spaces(refresh=True)]
+    release = threading.Event()
+    running = threading.Event()
+    calls = []
+    process = Mock()
+
+    def slow_status(path, on_start=None):
+        calls.append(path)
+        on_start(process)
+        running.set()
+        release.wait(10)
+        return "# branch.head main\n"
+
+    received = []
+    with patch("gitspaces.modules.status.runshell.git.status", side_effect=slow_status):
+        annotations = status.StatusAnnotations(targets, workers=1)
+        annotations.start(lambda space, note: received.append(space))
+        assert running.wait(10)
+        annotations.cancel()
+        release.set()
+        for thread in annotations.threads:
+            thread.join(10)
+
+    process.terminate.assert_called_once()
+    assert len(calls) == 1
+    assert received == []
+    assert all(thread.daemon for thread in annotations.threads)